@@ -0,0 +1,42 @@
+import sys
+import argparse
+from pathlib import Path
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run extract, plan and deploy from request form JSON files"
+    )
+    parser.add_argument("request_forms", nargs="+", type=Path)
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="Number of zuora-vcs directories processed concurrently",
+    )
+    parser.add_argument("--report", type=Path, help="Write the results as JSON")
+    args = parser.parse_args(argv)
+
+    from common.lib.logger import logger
+    from steps import batch
+
+    requests = []
+    try:
+        for request_form_file in args.request_forms:
+            requests.extend(batch.load_request_forms(request_form_file))
+    except (OSError, ValueError, batch.BatchRequestError) as e:
+        logger.error(f"❌ Invalid request form: {e}")
+        return batch.EXIT_INVALID_REQUEST
+
+    results = batch.run_batch(requests, max_workers=args.max_workers)
+    if args.report:
+        batch.write_report(results, args.report)
+
+    for result in results:
+        logger.info(f"{result['name']}: {result['status']}")
+
+    return batch.get_exit_code(results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
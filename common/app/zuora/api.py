@@ -1,23 +1,75 @@
+import os
 import json
+import time
 import requests
 import posixpath
 import urllib.parse
-from typing import List
+from pathlib import Path
+from typing import Iterator, List
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
 
 from common.lib.logger import logger
+from common.lib.cache import TTLCache
+from common.lib.file_lock import FileLock
 from common.lib.secrets_manager import SecretsManager
+from common.app.zuora.throttle import (
+    THROTTLE_MAX_RETRIES,
+    IDEMPOTENT_METHODS,
+    AdaptiveThrottle,
+    get_throttle,
+    is_retryable,
+)
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("ZUORA_HTTP_POOL_CONNECTIONS", 4))
+HTTP_POOL_MAXSIZE = int(os.getenv("ZUORA_HTTP_POOL_MAXSIZE", 16))
+
+# The response never arrived in full, resent for idempotent methods
+RETRYABLE_REQUEST_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+# Seconds before the real expiry at which a bearer token is considered expired
+TOKEN_REFRESH_MARGIN = float(os.getenv("ZUORA_TOKEN_REFRESH_MARGIN", 60))
+
+# In-process bearer token cache: environment -> (bearer_token, token_ttl)
+token_cache = TTLCache()
+
+# Token refreshes are serialised per environment, across threads and processes
+TOKEN_LOCK_DIR = Path.home().joinpath(".zuora")
+
+
+class ZuoraAPIResponseError(Exception):
+    pass
 
 
 class ZuoraAPI:
+    """
+    Zuora REST client bound to one environment.
+    HTTP calls go through a ``requests.Session`` owned by the instance, so
+    back-to-back calls reuse pooled keep-alive connections. Use it as a context
+    manager (or call ``close``) to release the connections when done.
+    """
+
     env: str
     base_url: str
     version: str
     _bearer_token: str
     _token_ttl: datetime
-
-    def __init__(self, environment: str):
+    _session: requests.Session
+
+    def __init__(
+        self,
+        environment: str,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    ):
         self.env = environment.upper()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._session = None
         self.base_url = SecretsManager.get_secret(
             secret_key="zuora_api_base_url",
             environment=self.env,
@@ -31,6 +83,75 @@ class ZuoraAPI:
         self.bearer_token = None
         self.token_ttl = None
 
+    def __enter__(self) -> "ZuoraAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Connection": "keep-alive"})
+            self._session = session
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def send_request(
+        self,
+        method: str,
+        url: str,
+        retry: bool = True,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request through the environment throttle
+
+        Throttled responses (429/503) are retried for every method, other 5xx
+        responses, connection errors, timeouts and broken responses only for
+        idempotent methods, up to ``THROTTLE_MAX_RETRIES`` times with backoff.
+        The last response is returned as is.
+        """
+        throttle = get_throttle(self.env)
+        max_retries = THROTTLE_MAX_RETRIES if retry else 0
+        for attempt in range(max_retries + 1):
+            throttle.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except RETRYABLE_REQUEST_ERRORS as e:
+                throttle.release()
+                if attempt == max_retries or method not in IDEMPOTENT_METHODS:
+                    raise
+
+                delay = AdaptiveThrottle.get_backoff(attempt)
+                logger.info(f"🟡 {type(e).__name__}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            except BaseException:
+                throttle.release()
+                raise
+
+            throttle.release(response.status_code, response.headers)
+            if attempt == max_retries or not is_retryable(method, response.status_code):
+                return response
+
+            delay = AdaptiveThrottle.get_backoff(attempt, response.headers)
+            logger.info(
+                f"🟡 Zuora API returned {response.status_code}, "
+                f"retrying in {delay:.1f}s ({attempt + 1}/{max_retries})"
+            )
+            time.sleep(delay)
+
     @property
     def bearer_token(self) -> str:
         return self._bearer_token
@@ -77,7 +198,7 @@ class ZuoraAPI:
             "Authorization": "Bearer ",
         }
 
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = self.send_request("POST", url, headers=headers, data=payload)
 
         if response.status_code == 200:
             response_json = response.json()
@@ -91,30 +212,65 @@ class ZuoraAPI:
             self.token_ttl = datetime.now()
 
         SecretsManager.update_secret(
-            secret={"zuora_bearer_token": self.bearer_token}, environment=self.env
-        )
-        SecretsManager.update_secret(
-            secret={"zuora_token_ttl": self.token_ttl.timestamp()}, environment=self.env
+            secret={
+                "zuora_bearer_token": self.bearer_token,
+                "zuora_token_ttl": self.token_ttl.timestamp(),
+            },
+            environment=self.env,
         )
+        self.cache_bearer_token()
 
-    def renew_bearer_token_if_expired(self):
-        logger.info("Checking if token is still valid ...")
-        self.bearer_token = SecretsManager.get_secret(
-            secret_key="zuora_bearer_token", environment=self.env
-        )
-        zuora_token_ttl_timestamp = SecretsManager.get_secret(
-            secret_key="zuora_token_ttl", environment=self.env
-        )
+    def is_token_expiring(self) -> bool:
+        refresh_at = self.token_ttl - timedelta(seconds=TOKEN_REFRESH_MARGIN)
+        return datetime.now() > refresh_at
 
-        if not self.bearer_token or not zuora_token_ttl_timestamp:
-            self.generate_bearer_token()
+    def cache_bearer_token(self):
+        if not self.bearer_token:
             return
 
-        self.token_ttl = datetime.fromtimestamp(zuora_token_ttl_timestamp)
-        if datetime.now() > self.token_ttl:
-            self.generate_bearer_token()
-        else:
-            logger.info("✅ Zuora API bearer token is still valid")
+        valid_for = self.token_ttl - datetime.now()
+        cache_ttl = valid_for.total_seconds() - TOKEN_REFRESH_MARGIN
+        if cache_ttl > 0:
+            token_cache.set(self.env, (self.bearer_token, self.token_ttl), cache_ttl)
+
+    def renew_bearer_token_if_expired(self):
+        """Renew the bearer token once per environment when it expires
+
+        Threads and processes that find the token expired wait on the same
+        lock, and the first one refreshes it. The others then read the new
+        token from ``sm.json`` or Secrets Manager instead of calling
+        ``oauth/token`` again.
+        """
+        cached_token = token_cache.get(self.env)
+        if cached_token:
+            self.bearer_token, self.token_ttl = cached_token
+            return
+
+        lock_file = TOKEN_LOCK_DIR.joinpath(f".token-{self.env.lower()}.lock")
+        with FileLock(lock_file):
+            cached_token = token_cache.get(self.env)
+            if cached_token:
+                self.bearer_token, self.token_ttl = cached_token
+                return
+
+            logger.info("Checking if token is still valid ...")
+            self.bearer_token = SecretsManager.get_secret(
+                secret_key="zuora_bearer_token", environment=self.env, use_cache=False
+            )
+            zuora_token_ttl_timestamp = SecretsManager.get_secret(
+                secret_key="zuora_token_ttl", environment=self.env
+            )
+
+            if not self.bearer_token or not zuora_token_ttl_timestamp:
+                self.generate_bearer_token()
+                return
+
+            self.token_ttl = datetime.fromtimestamp(zuora_token_ttl_timestamp)
+            if self.is_token_expiring():
+                self.generate_bearer_token()
+            else:
+                logger.info("✅ Zuora API bearer token is still valid")
+                self.cache_bearer_token()
 
     def get(self, path: str, payload: dict = {}):
         logger.info("Zuora API - GET method")
@@ -127,7 +283,7 @@ class ZuoraAPI:
         }
 
         url = posixpath.join(self.base_url, path)
-        response = requests.request("GET", url, headers=headers, data=payload)
+        response = self.send_request("GET", url, headers=headers, data=payload)
 
         return response
 
@@ -146,8 +302,9 @@ class ZuoraAPI:
         logger.info(f"url == {url}")
         logger.debug(f"payload == {payload}")
 
-        response = requests.request(
-            "POST", url, headers=headers, data=payload, files=files
+        # File objects are consumed by the first attempt, so those are not resent
+        response = self.send_request(
+            "POST", url, retry=not files, headers=headers, data=payload, files=files
         )
 
         return response
@@ -166,8 +323,10 @@ class ZuoraAPI:
         logger.info(f"url == {url}")
         logger.info(f"files == {files}")
 
-        response = requests.post(
+        response = self.send_request(
+            "POST",
             url,
+            retry=False,
             headers=headers,
             files=files,
         )
@@ -189,8 +348,69 @@ class ZuoraAPI:
         logger.info(f"url == {url}")
         logger.debug(f"payload == {payload}")
 
-        response = requests.request(
+        response = self.send_request(
             "PUT", url, headers=headers, data=json.dumps(payload)
         )
 
         return response
+
+    def get_paginated_records(
+        self,
+        path: str,
+        records_key: str = "records",
+        page_size: int = None,
+    ) -> Iterator[dict]:
+        """Lazily yield records from a cursor-paginated Zuora endpoint.
+
+        Follows the ``cursor`` (or ``nextPage``/``next_page`` link) returned with
+        each page until the last page, so only one page is held in memory.
+
+        Args:
+            path (str): API path relative to the base URL
+            records_key (str): Response key holding the records of a page
+            page_size (int): Optional number of records requested per page
+
+        Raises:
+            ZuoraAPIResponseError: A page could not be retrieved
+        """
+        params = {}
+        if page_size:
+            params["pageSize"] = page_size
+
+        while True:
+            response = self.get(ZuoraAPI.get_page_url(path, params))
+            if response.status_code != 200:
+                raise ZuoraAPIResponseError(
+                    f"Unable to retrieve records from {path}. {response.text}"
+                )
+
+            response_json: dict = response.json()
+            records: List[dict] = response_json.get(records_key) or []
+            yield from records
+
+            next_params = ZuoraAPI.get_next_page_params(params, response_json)
+            if not records or next_params == params:
+                return
+
+            params = next_params
+
+    @staticmethod
+    def get_page_url(path: str, params: dict) -> str:
+        if not params:
+            return path
+
+        separator = "&" if "?" in path else "?"
+        return f"{path}{separator}{urllib.parse.urlencode(params)}"
+
+    @staticmethod
+    def get_next_page_params(params: dict, response_json: dict) -> dict:
+        next_params = dict(params)
+        next_page = response_json.get("nextPage") or response_json.get("next_page")
+        cursor = response_json.get("cursor")
+        if next_page:
+            query = urllib.parse.urlparse(next_page).query
+            next_params.update(urllib.parse.parse_qsl(query))
+        elif cursor:
+            next_params["cursor"] = cursor
+
+        return next_params
@@ -0,0 +1,220 @@
+import os
+import json
+import httpx
+import asyncio
+import weakref
+import posixpath
+from typing import AsyncIterator, List
+
+from common.lib.logger import logger
+from common.app.zuora.api import ZuoraAPI, ZuoraAPIResponseError, token_cache
+from common.app.zuora.throttle import (
+    THROTTLE_MAX_RETRIES,
+    IDEMPOTENT_METHODS,
+    AdaptiveThrottle,
+    get_throttle,
+    is_retryable,
+)
+
+ASYNC_MAX_CONCURRENCY = int(os.getenv("ZUORA_ASYNC_MAX_CONCURRENCY", 16))
+ASYNC_TIMEOUT = float(os.getenv("ZUORA_ASYNC_TIMEOUT", 120))
+
+# Semaphores and locks per event loop and environment, since asyncio primitives
+# are bound to the loop they were first used in
+_semaphores = weakref.WeakKeyDictionary()
+_token_locks = weakref.WeakKeyDictionary()
+
+
+def get_environment_semaphore(
+    environment: str, max_concurrency: int
+) -> asyncio.Semaphore:
+    loop_semaphores = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    if environment not in loop_semaphores:
+        loop_semaphores[environment] = asyncio.Semaphore(max_concurrency)
+    return loop_semaphores[environment]
+
+
+def get_token_lock(environment: str) -> asyncio.Lock:
+    loop_locks = _token_locks.setdefault(asyncio.get_running_loop(), {})
+    if environment not in loop_locks:
+        loop_locks[environment] = asyncio.Lock()
+    return loop_locks[environment]
+
+
+class AsyncZuoraAPI(ZuoraAPI):
+    """
+    Asynchronous Zuora REST client with the same method surface as ``ZuoraAPI``.
+    Requests to one environment share a semaphore limiting them to
+    ``max_concurrency`` in flight, and the bearer token cache of ``ZuoraAPI``,
+    so concurrent coroutines trigger a single token refresh.
+    """
+
+    _client: httpx.AsyncClient
+
+    def __init__(
+        self,
+        environment: str,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ):
+        super().__init__(environment)
+        self.max_concurrency = max_concurrency
+        self._client = None
+
+    async def __aenter__(self) -> "AsyncZuoraAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=ASYNC_TIMEOUT)
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.close()
+
+    async def renew_bearer_token_async(self):
+        cached_token = token_cache.get(self.env)
+        if cached_token:
+            self.bearer_token, self.token_ttl = cached_token
+            return
+
+        # Only one coroutine refreshes, the others find the token in the cache
+        async with get_token_lock(self.env):
+            await asyncio.to_thread(self.renew_bearer_token_if_expired)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: dict,
+        retry: bool = True,
+        **kwargs,
+    ):
+        """Send a request, retried like ``ZuoraAPI.send_request``
+
+        Requests wait for a slot of the shared environment throttle, so they
+        follow the same limit and pauses as ``ZuoraAPI``, and at most
+        ``max_concurrency`` of them are in flight per event loop.
+        """
+        await self.renew_bearer_token_async()
+        headers["Authorization"] = f"Bearer {self.bearer_token}"
+
+        url = posixpath.join(self.base_url, path)
+        semaphore = get_environment_semaphore(self.env, self.max_concurrency)
+        throttle = get_throttle(self.env)
+        max_retries = THROTTLE_MAX_RETRIES if retry else 0
+        for attempt in range(max_retries + 1):
+            try:
+                async with semaphore:
+                    await throttle.acquire_async()
+                    try:
+                        response = await self.client.request(
+                            method, url, headers=headers, **kwargs
+                        )
+                    except BaseException:
+                        throttle.release()
+                        raise
+                    throttle.release(response.status_code, response.headers)
+            except httpx.TransportError as e:
+                if attempt == max_retries or method not in IDEMPOTENT_METHODS:
+                    raise
+
+                delay = AdaptiveThrottle.get_backoff(attempt)
+                logger.info(f"🟡 {type(e).__name__}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if attempt == max_retries or not is_retryable(method, response.status_code):
+                return response
+
+            delay = AdaptiveThrottle.get_backoff(attempt, response.headers)
+            logger.info(
+                f"🟡 Zuora API returned {response.status_code}, "
+                f"retrying in {delay:.1f}s ({attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+    async def get(self, path: str, payload: dict = {}):
+        logger.info("Zuora API - async GET method")
+
+        headers = {"Accept": "application/json"}
+        if payload:
+            return await self.request("GET", path, headers, data=payload)
+        return await self.request("GET", path, headers)
+
+    async def post(self, path: str, payload: dict = {}, files: List[str] = []):
+        logger.info("Zuora API - async POST method")
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        logger.debug(f"payload == {payload}")
+
+        kwargs = {}
+        if isinstance(payload, (str, bytes)):
+            kwargs["content"] = payload
+        elif payload:
+            kwargs["data"] = payload
+        if files:
+            kwargs["files"] = files
+
+        return await self.request("POST", path, headers, retry=not files, **kwargs)
+
+    async def post_multipart(self, path: str, files: dict = {}):
+        logger.info("Zuora API - async POST multipart method")
+
+        headers = {"Accept": "application/json"}
+        logger.info(f"files == {files}")
+
+        return await self.request("POST", path, headers, retry=False, files=files)
+
+    async def put(self, path: str, payload: dict = {}):
+        logger.info("Zuora API - async PUT method")
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        logger.debug(f"payload == {payload}")
+
+        return await self.request("PUT", path, headers, content=json.dumps(payload))
+
+    async def get_paginated_records(
+        self,
+        path: str,
+        records_key: str = "records",
+        page_size: int = None,
+    ) -> AsyncIterator[dict]:
+        """Async counterpart of ``ZuoraAPI.get_paginated_records``"""
+        params = {}
+        if page_size:
+            params["pageSize"] = page_size
+
+        while True:
+            response = await self.get(ZuoraAPI.get_page_url(path, params))
+            if response.status_code != 200:
+                raise ZuoraAPIResponseError(
+                    f"Unable to retrieve records from {path}. {response.text}"
+                )
+
+            response_json: dict = response.json()
+            records: List[dict] = response_json.get(records_key) or []
+            for record in records:
+                yield record
+
+            next_params = ZuoraAPI.get_next_page_params(params, response_json)
+            if not records or next_params == params:
+                return
+
+            params = next_params
@@ -0,0 +1,160 @@
+import os
+import time
+import random
+import asyncio
+import threading
+from typing import Dict, Mapping
+
+THROTTLE_MAX_CONCURRENCY = int(os.getenv("ZUORA_THROTTLE_MAX_CONCURRENCY", 16))
+THROTTLE_MIN_CONCURRENCY = int(os.getenv("ZUORA_THROTTLE_MIN_CONCURRENCY", 1))
+THROTTLE_MAX_RETRIES = int(os.getenv("ZUORA_THROTTLE_MAX_RETRIES", 5))
+THROTTLE_BACKOFF_BASE = float(os.getenv("ZUORA_THROTTLE_BACKOFF_BASE", 1))
+THROTTLE_BACKOFF_MAX = float(os.getenv("ZUORA_THROTTLE_BACKOFF_MAX", 60))
+# How often coroutines waiting for a free slot check the throttle again
+THROTTLE_POLL_INTERVAL = 0.05
+
+# Zuora rejected the request without processing it, safe to resend any method
+THROTTLED_STATUS_CODES = {429, 503}
+# The request may have been processed, only resent for idempotent methods
+TRANSIENT_STATUS_CODES = {500, 502, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+_throttles: Dict[str, "AdaptiveThrottle"] = {}
+_throttles_lock = threading.Lock()
+
+
+def get_header(headers: Mapping, name: str) -> str:
+    if not headers:
+        return None
+
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+def get_float_header(headers: Mapping, name: str) -> float:
+    try:
+        return float(get_header(headers, name))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(method: str, status_code: int) -> bool:
+    if status_code in THROTTLED_STATUS_CODES:
+        return True
+    return status_code in TRANSIENT_STATUS_CODES and method in IDEMPOTENT_METHODS
+
+
+class AdaptiveThrottle:
+    """
+    Limits the requests in flight to one Zuora environment, shared by every
+    thread. The limit follows AIMD: it grows by one request per window of
+    successful responses and halves whenever Zuora throttles (429/503).
+    It is also capped by the ``Concurrency-Limit-Limit`` header, and new
+    requests pause until the reset when ``RateLimit-Remaining`` reaches zero.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = THROTTLE_MAX_CONCURRENCY,
+        min_concurrency: int = THROTTLE_MIN_CONCURRENCY,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while True:
+                pause = self.paused_until - time.monotonic()
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self.in_flight >= int(self.limit):
+                    self._condition.wait()
+                else:
+                    break
+
+            self.in_flight += 1
+
+    def release(self, status_code: int = None, headers: Mapping = None):
+        with self._condition:
+            self.in_flight -= 1
+            self.update(status_code, headers)
+            self._condition.notify_all()
+
+    def update(self, status_code: int = None, headers: Mapping = None):
+        """Adjust the limit from a response, callers hold the condition"""
+        concurrency_limit = get_float_header(headers, "Concurrency-Limit-Limit")
+        if concurrency_limit:
+            self.max_concurrency = max(self.min_concurrency, int(concurrency_limit))
+
+        if status_code in THROTTLED_STATUS_CODES:
+            self.limit = max(float(self.min_concurrency), self.limit / 2)
+            self.pause(self.get_retry_after(headers))
+        elif status_code is not None and status_code < 500:
+            self.limit += 1 / self.limit
+
+        self.limit = min(self.limit, float(self.max_concurrency))
+
+        if get_float_header(headers, "RateLimit-Remaining") == 0:
+            self.pause(get_float_header(headers, "RateLimit-Reset"))
+
+    def try_acquire(self) -> float:
+        """Take a slot without blocking
+
+        Returns 0 once the slot is taken, otherwise the seconds to wait before
+        trying again.
+        """
+        with self._condition:
+            pause = self.paused_until - time.monotonic()
+            if pause > 0:
+                return pause
+            if self.in_flight >= int(self.limit):
+                return THROTTLE_POLL_INTERVAL
+
+            self.in_flight += 1
+            return 0
+
+    async def acquire_async(self):
+        """``acquire`` for coroutines, waits without blocking the event loop"""
+        while True:
+            delay = self.try_acquire()
+            if not delay:
+                return
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float):
+        if seconds:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    @staticmethod
+    def get_retry_after(headers: Mapping) -> float:
+        retry_after = get_float_header(headers, "Retry-After")
+        if retry_after is None:
+            retry_after = get_float_header(headers, "RateLimit-Reset")
+        return retry_after
+
+    @staticmethod
+    def get_backoff(attempt: int, headers: Mapping = None) -> float:
+        """Seconds to wait before retry ``attempt`` (starting at 0)
+
+        Honours ``Retry-After`` or ``RateLimit-Reset`` when Zuora sends them,
+        otherwise uses exponential backoff with full jitter.
+        """
+        retry_after = AdaptiveThrottle.get_retry_after(headers)
+        if retry_after is not None:
+            return min(retry_after, THROTTLE_BACKOFF_MAX) + random.uniform(0, 1)
+
+        ceiling = min(THROTTLE_BACKOFF_MAX, THROTTLE_BACKOFF_BASE * 2**attempt)
+        return random.uniform(0, ceiling)
+
+
+def get_throttle(environment: str) -> AdaptiveThrottle:
+    with _throttles_lock:
+        if environment not in _throttles:
+            _throttles[environment] = AdaptiveThrottle()
+        return _throttles[environment]
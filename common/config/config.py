@@ -1,9 +1,13 @@
+import os
 import json
 from pathlib import Path
 
 _root_dir = Path(__file__).parent.parent.parent
 
-ZUORA_VCS_DIR = _root_dir.parent.joinpath("zuora-vcs")
+# ZUORA_VCS_DIR overrides the zuora-vcs checkout, e.g. one per batch run
+ZUORA_VCS_DIR = Path(
+    os.getenv("ZUORA_VCS_DIR", _root_dir.parent.joinpath("zuora-vcs"))
+)
 
 
 with open(_root_dir.joinpath("config.json")) as fs:
@@ -14,3 +18,5 @@ CUSTOM_OBJECT_NAMES = config["CUSTOM_OBJECT_NAMES"]
 CUSTOM_OBJECTS_MAP = config["CUSTOM_OBJECTS_MAP"]
 WORKFLOW_NAMES = config["WORKFLOW_NAMES"]
 ZUORA_OBJECTS = config["ZUORA_OBJECTS"]
+# "json" (one indented array per object) or "jsonl" (one record per line)
+CUSTOM_OBJECT_RECORDS_FORMAT = config.get("CUSTOM_OBJECT_RECORDS_FORMAT", "json")
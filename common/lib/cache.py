@@ -0,0 +1,41 @@
+import time
+import threading
+from typing import Any, Dict, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory key-value cache where every entry expires after a TTL.
+    A TTL of ``None`` keeps the entry until it is invalidated.
+    """
+
+    def __init__(self, ttl: float = None):
+        self.ttl = ttl
+        self._items: Dict[Any, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+
+            value, expires_at = item
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._items.pop(key, None)
+                return default
+
+            return value
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._items[key] = (value, expires_at)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)
@@ -0,0 +1,10 @@
+import threading
+from common.lib.logger import logger
+
+
+def is_cancelled(cancel_event: threading.Event, step: str) -> bool:
+    """Check between components whether the user cancelled a running step"""
+    if cancel_event is not None and cancel_event.is_set():
+        logger.info(f"🟠 {step} cancelled")
+        return True
+    return False
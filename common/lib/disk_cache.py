@@ -0,0 +1,82 @@
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any
+
+
+class DiskCache:
+    """
+    JSON values stored on disk, one file per key named after the SHA-256 of the
+    key. Meant for values that never change once written, so entries do not
+    expire. Reads refresh the file mtime, and once the directory grows past
+    ``max_bytes`` the least recently used files are evicted.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory.joinpath(f"{digest}.json")
+
+    def get(self, key: str, default=None) -> Any:
+        path = self.get_path(key)
+        try:
+            with open(path, encoding="utf-8") as fs:
+                value = json.load(fs)
+        except (OSError, ValueError):
+            return default
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any):
+        path = self.get_path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Readers in other threads or processes never see a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fs:
+                json.dump(value, fs)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def invalidate(self, key: str = None):
+        paths = [self.get_path(key)] if key else self.directory.glob("*.json")
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        with self._lock:
+            entries = []
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total_bytes <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total_bytes -= size
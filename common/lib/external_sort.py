@@ -0,0 +1,59 @@
+import json
+import heapq
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+
+def sort_entries(
+    entries: Iterable[list], directory: Path, memory_bytes: int
+) -> Iterator[list]:
+    """
+    Sort ``[key, seq, value]`` entries by ``key`` then ``seq``, where ``key`` is a
+    string and ``value`` is JSON serialisable. Entries are buffered as JSON lines,
+    and each time the buffer grows past ``memory_bytes`` it is sorted and spilled
+    to a run file in ``directory``. The runs are then merged lazily, so only one
+    entry per run is held in memory.
+    """
+    runs = []
+    buffer = []
+    buffer_bytes = 0
+    for entry in entries:
+        line = json.dumps(entry)
+        buffer.append((entry[0], entry[1], line))
+        buffer_bytes += len(line)
+        if buffer_bytes >= memory_bytes:
+            runs.append(write_run(buffer, Path(directory), len(runs)))
+            buffer = []
+            buffer_bytes = 0
+
+    if not runs:
+        # Everything fit in the budget, nothing to merge
+        buffer.sort(key=lambda item: (item[0], item[1]))
+        for _, _, line in buffer:
+            yield json.loads(line)
+        return
+
+    if buffer:
+        runs.append(write_run(buffer, Path(directory), len(runs)))
+    del buffer
+
+    yield from heapq.merge(
+        *(iter_run(run) for run in runs), key=lambda entry: (entry[0], entry[1])
+    )
+
+
+def write_run(buffer: List[tuple], directory: Path, index: int) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    run = directory.joinpath(f"run-{index}.jsonl")
+    buffer.sort(key=lambda item: (item[0], item[1]))
+    with open(run, "w") as fs:
+        for _, _, line in buffer:
+            fs.write(line)
+            fs.write("\n")
+    return run
+
+
+def iter_run(run: Path) -> Iterator[list]:
+    with open(run) as fs:
+        for line in fs:
+            yield json.loads(line)
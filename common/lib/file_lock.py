@@ -0,0 +1,76 @@
+import threading
+from pathlib import Path
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_lock = threading.Lock()
+
+
+def get_thread_lock(path: Path) -> threading.Lock:
+    key = str(Path(path).resolve())
+    with _thread_locks_lock:
+        if key not in _thread_locks:
+            _thread_locks[key] = threading.Lock()
+        return _thread_locks[key]
+
+
+class FileLock:
+    """
+    Exclusive lock on ``path`` held across threads and processes of the
+    machine. The lock file is created if missing and never removed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._thread_lock = get_thread_lock(self.path)
+        self._fs = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fs = open(self.path, "a+")
+            if fcntl:
+                fcntl.flock(self._fs.fileno(), fcntl.LOCK_EX)
+            else:
+                self._fs.seek(0)
+                # LK_LOCK retries for 10 seconds before raising, keep waiting
+                while True:
+                    try:
+                        msvcrt.locking(self._fs.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+        except BaseException:
+            self._close()
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        try:
+            if fcntl:
+                fcntl.flock(self._fs.fileno(), fcntl.LOCK_UN)
+            else:
+                self._fs.seek(0)
+                msvcrt.locking(self._fs.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._close()
+            self._thread_lock.release()
+
+    def _close(self):
+        if self._fs is not None:
+            self._fs.close()
+            self._fs = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -1,10 +1,13 @@
 import os
 import json
-import boto3
 from pathlib import Path
-from boto3_type_annotations.secretsmanager import Client as SMClient
+from typing import TYPE_CHECKING
 from common.lib.logger import logger
+from common.lib.cache import TTLCache
+from common.lib.file_lock import FileLock
 
+if TYPE_CHECKING:
+    from boto3_type_annotations.secretsmanager import Client as SMClient
 
 IS_LOCAL = os.getenv("IS_LOCAL", True)
 IS_AWS_HOSTED = os.getenv("IS_AWS_HOSTED", False)
@@ -25,11 +28,25 @@ else:
     }
 
 
-sm_client: SMClient = boto3.client(
-    service_name="secretsmanager",
-    region_name="us-east-1",
-)
+_sm_client: "SMClient" = None
 local_sm_file = Path.home().joinpath(".zuora/sm.json")
+local_sm_lock_file = Path.home().joinpath(".zuora/.sm.json.lock")
+
+SECRETS_CACHE_TTL = float(os.getenv("SECRETS_CACHE_TTL", 300))
+secrets_cache = TTLCache(ttl=SECRETS_CACHE_TTL)
+
+
+def get_sm_client() -> "SMClient":
+    """Secrets Manager client, created on first use since boto3 is slow to import"""
+    global _sm_client
+    if _sm_client is None:
+        import boto3
+
+        _sm_client = boto3.client(
+            service_name="secretsmanager",
+            region_name="us-east-1",
+        )
+    return _sm_client
 
 
 class SecretsManager:
@@ -52,7 +69,10 @@ class SecretsManager:
 
     @staticmethod
     def get_secret(
-        secret_key: str, secrets_path: str = None, environment: str = None
+        secret_key: str,
+        secrets_path: str = None,
+        environment: str = None,
+        use_cache: bool = True,
     ) -> str:
         """Get a specific secret by key from secrets paths"""
         secrets_path = SecretsManager.get_secrets_path_for_environment(
@@ -60,26 +80,41 @@ class SecretsManager:
             environment=environment,
         )
 
-        secrets = SecretsManager.get_secrets(secrets_path)
+        secrets = SecretsManager.get_secrets(secrets_path, use_cache=use_cache)
         return secrets.get(secret_key, None)
 
     @staticmethod
-    def get_secrets(secrets_path: str) -> dict:
+    def get_secrets(secrets_path: str, use_cache: bool = True) -> dict:
         """Get secrets from Secrets Manager
 
+        Secrets are kept in an in-process cache for ``SECRETS_CACHE_TTL`` seconds,
+        so repeated lookups do not re-read ``sm.json`` or call AWS.
+
         Args:
             secrets_path (str): Secret Name stored in Secrets manager
+            use_cache (bool): Serve the secrets from the in-process cache if present
 
         Returns:
             dict: key-value pair stored in the Secret name in Secrets manager
         """
+        if use_cache:
+            cached_secrets = secrets_cache.get(secrets_path)
+            if cached_secrets is not None:
+                return dict(cached_secrets)
+
+        secrets = SecretsManager._load_secrets(secrets_path)
+        secrets_cache.set(secrets_path, secrets)
+        return dict(secrets)
+
+    @staticmethod
+    def _load_secrets(secrets_path: str) -> dict:
         if IS_LOCAL:
             with open(local_sm_file) as fs:
                 all_secrets = json.load(fs)
                 return all_secrets[secrets_path]
 
         try:
-            get_secret_value_response = sm_client.get_secret_value(
+            get_secret_value_response = get_sm_client().get_secret_value(
                 SecretId=secrets_path
             )
         except Exception as e:
@@ -107,25 +142,35 @@ class SecretsManager:
         )
 
         if IS_LOCAL:
-            with open(local_sm_file) as fs:
-                all_secrets = json.load(fs)
+            # Read-modify-write under a lock, and replace the file atomically so
+            # concurrent readers never see a partially written sm.json
+            with FileLock(local_sm_lock_file):
+                with open(local_sm_file) as fs:
+                    all_secrets = json.load(fs)
 
-            for key, value in secret.items():
-                all_secrets[secrets_path][key] = value
+                for key, value in secret.items():
+                    all_secrets[secrets_path][key] = value
 
-            with open(local_sm_file, "w") as fs:
-                json.dump(all_secrets, fs, indent=4)
+                tmp_file = local_sm_file.with_name(f"{local_sm_file.name}.tmp")
+                with open(tmp_file, "w") as fs:
+                    json.dump(all_secrets, fs, indent=4)
+                os.replace(tmp_file, local_sm_file)
 
+            secrets_cache.set(secrets_path, all_secrets[secrets_path])
             return
 
         try:
             logger.info("Updating following secrets in SecretsManager")
             logger.info(f"Secret keys == {secret.keys()}")
 
-            update_secret_response = sm_client.update_secret(
-                SecretId=secrets_path, SecretString=json.dumps(secret)
+            # update_secret replaces the whole SecretString, keep the other keys
+            secrets = SecretsManager._load_secrets(secrets_path)
+            secrets.update(secret)
+            update_secret_response = get_sm_client().update_secret(
+                SecretId=secrets_path, SecretString=json.dumps(secrets)
             )
             logger.info(f"update_secret_response == {update_secret_response}")
+            secrets_cache.set(secrets_path, secrets)
         except Exception as e:
             msg = f"ERROR: Failed to update secret in Secrets Manager. \n{e}"
             logger.exception(msg)
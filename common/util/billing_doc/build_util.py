@@ -5,6 +5,7 @@ from pathlib import Path
 
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
+from common.util.billing_doc.html_util import BillingDocumentHtmlSplitter
 
 HTML_TEMPLATES_DIR = ZUORA_VCS_DIR.joinpath("billing_documents")
 
@@ -24,7 +25,9 @@ class BillingDocumentTemplateBuilder:
         rows: List[dict] = body["rows"]
 
         main_html_content_file = billing_doc_dir.joinpath("main_content.html")
-        main_html = main_html_content_file.read_text()
+        with open(main_html_content_file, encoding="utf-8", newline="") as fs:
+            main_html = fs.read()
+        source_contents = {}
 
         for row in rows:
             columns = row["columns"]
@@ -45,13 +48,12 @@ class BillingDocumentTemplateBuilder:
                     html_id = meta["htmlID"]
 
                     source_file = billing_doc_dir.joinpath(f"{html_id}.html")
-                    source_content = source_file.read_text()
+                    with open(source_file, encoding="utf-8", newline="") as fs:
+                        source_content = fs.read()
                     values["html"] = source_content
+                    source_contents[html_id] = source_content
 
-                    main_html = main_html.replace(
-                        f"placeholder-{html_id}", f"\n{source_content}\n"
-                    )
-
+        main_html = BillingDocumentHtmlSplitter.merge(main_html, source_contents)
         billing_doc_content["htmlContent"] = main_html
 
         if output_dir:
@@ -62,7 +64,7 @@ class BillingDocumentTemplateBuilder:
         return billing_doc_content
 
     @staticmethod
-    def build_request_payload(template_name: str, output_dir: Path) -> dict:
+    def build_request_payload(template_name: str, output_dir: Path = None) -> dict:
         template_json = BillingDocumentTemplateBuilder.build_json_from_source_code(
             template_name
         )
@@ -77,13 +79,19 @@ class BillingDocumentTemplateBuilder:
         with open(request_form_file) as fs:
             request_form: dict = json.load(fs)
 
-        request_form_file_new = output_dir.joinpath(f"{template_name}_form_new.json")
-
         request_form["base64EncodedTemplateFileContent"] = (
             base64_encoded_template_content
         )
 
-        with open(request_form_file_new, "w") as fs:
-            json.dump(request_form, fs, indent=2)
+        if output_dir:
+            BillingDocumentTemplateBuilder.dump_request_payload(
+                template_name, request_form, output_dir
+            )
 
         return request_form
+
+    @staticmethod
+    def dump_request_payload(template_name: str, request_form: dict, output_dir: Path):
+        request_form_file_new = output_dir.joinpath(f"{template_name}_form_new.json")
+        with open(request_form_file_new, "w") as fs:
+            json.dump(request_form, fs, indent=2)
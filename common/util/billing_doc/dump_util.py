@@ -1,13 +1,15 @@
 import json
 import base64
 import shutil
+import hashlib
 from pathlib import Path
-from bs4 import BeautifulSoup
 from requests import Response
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
+from common.util.billing_doc.html_util import BillingDocumentHtmlSplitter
 
 HTML_TEMPLATES_DIR = ZUORA_VCS_DIR.joinpath("billing_documents")
+MANIFEST_FILE = HTML_TEMPLATES_DIR.joinpath(".manifest.json")
 
 
 class BillingDocumentTemplateParser:
@@ -84,23 +86,73 @@ class BillingDocumentTemplateParser:
 
                     output_file = billing_doc_dir.joinpath(f"{html_id}.html")
                     logger.info(f"Writing {output_file}")
-                    output_file.write_text(html, encoding="utf-8")
+                    output_file.write_text(html, encoding="utf-8", newline="")
 
         main_html_content_file = billing_doc_dir.joinpath("main_content.html")
         main_html = billing_doc_content["htmlContent"]
 
-        soup = BeautifulSoup(main_html, "html.parser")
+        main_html, sources = BillingDocumentHtmlSplitter.split(main_html, html_ids)
         for html_id in html_ids:
-            element = soup.find(id=html_id)
-            for content in element.contents:
-                content.replace_with("")
-            element.append(f"placeholder-{html_id}")
+            if html_id not in sources:
+                logger.info(f"🚩 Element {html_id} not found in htmlContent")
 
         billing_doc_content["htmlContent"] = "Placeholder"
         with open(billing_doc_json, "w") as fs:
             json.dump(billing_doc_content, fs, indent=2)
 
         logger.info(f"Writing {main_html_content_file}")
-        main_html_content_file.write_text(
-            soup.prettify(formatter="html"), encoding="utf-8"
+        main_html_content_file.write_text(main_html, encoding="utf-8", newline="")
+
+    @staticmethod
+    def get_template_content_hash(template_name: str) -> str:
+        template_dir = HTML_TEMPLATES_DIR.joinpath(template_name)
+        if not template_dir.is_dir():
+            return None
+
+        content_hash = hashlib.sha256()
+        for file in sorted(template_dir.rglob("*")):
+            if not file.is_file():
+                continue
+            content_hash.update(file.relative_to(template_dir).as_posix().encode())
+            content_hash.update(file.read_bytes())
+        return content_hash.hexdigest()
+
+    @staticmethod
+    def read_manifest() -> dict:
+        if not MANIFEST_FILE.exists():
+            return {}
+
+        with open(MANIFEST_FILE) as fs:
+            return json.load(fs)
+
+    @staticmethod
+    def dump_manifest(manifest: dict):
+        MANIFEST_FILE.parent.mkdir(exist_ok=True, parents=True)
+        with open(MANIFEST_FILE, "w") as fs:
+            json.dump(manifest, fs, indent=2, sort_keys=True)
+
+    @staticmethod
+    def get_manifest_entry(template: dict, environment: str) -> dict:
+        return {
+            "environment": environment.lower(),
+            "id": template["id"],
+            "updatedOn": template.get("updatedOn"),
+            "content_hash": BillingDocumentTemplateParser.get_template_content_hash(
+                template["name"]
+            ),
+        }
+
+    @staticmethod
+    def is_template_unchanged(manifest: dict, template: dict, environment: str):
+        """
+        A template is unchanged when the manifest recorded the same id and
+        ``updatedOn`` for this environment, and its files on disk still match the
+        recorded content hash.
+        """
+        entry: dict = manifest.get(template["name"])
+        if not entry or not template.get("updatedOn"):
+            return False
+
+        return entry == BillingDocumentTemplateParser.get_manifest_entry(
+            template, environment
         )
@@ -0,0 +1,105 @@
+import re
+from typing import Dict, Iterable, List, Tuple
+from html.parser import HTMLParser
+
+PLACEHOLDER_PREFIX = "placeholder-"
+
+
+class HtmlRegionScanner(HTMLParser):
+    """
+    Finds the source offsets of the inner content of the elements whose ``id`` is
+    one of ``html_ids`` in a single pass over the document. No tree is built and
+    nothing is re-serialised, so the untouched parts keep their exact bytes.
+    """
+
+    def __init__(self, html_ids: Iterable[str]):
+        super().__init__(convert_charrefs=False)
+        self.html_ids = set(html_ids)
+        self.regions: Dict[str, Tuple[int, int]] = {}
+        self._open_regions: List[dict] = []
+        self._line_offsets: List[int] = [0]
+
+    def scan(self, html: str) -> Dict[str, Tuple[int, int]]:
+        self._line_offsets = [0] + [match.end() for match in re.finditer("\n", html)]
+        self.feed(html)
+        self.close()
+        return self.regions
+
+    def get_offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag: str, attrs: list):
+        for region in self._open_regions:
+            if region["tag"] == tag:
+                region["depth"] += 1
+
+        html_id = dict(attrs).get("id")
+        if html_id not in self.html_ids or html_id in self.regions:
+            return
+
+        if any(region["html_id"] == html_id for region in self._open_regions):
+            return
+
+        start = self.get_offset() + len(self.get_starttag_text())
+        self._open_regions.append(
+            {"html_id": html_id, "tag": tag, "depth": 1, "start": start}
+        )
+
+    def handle_endtag(self, tag: str):
+        for region in list(self._open_regions):
+            if region["tag"] != tag:
+                continue
+
+            region["depth"] -= 1
+            if region["depth"] == 0:
+                self.regions[region["html_id"]] = (region["start"], self.get_offset())
+                self._open_regions.remove(region)
+
+
+class BillingDocumentHtmlSplitter:
+    @staticmethod
+    def split(html: str, html_ids: Iterable[str]) -> Tuple[str, Dict[str, str]]:
+        """Replace the inner content of each ``reactHtml`` element by a placeholder
+
+        Args:
+            html (str): Full ``htmlContent`` of the billing document template
+            html_ids (Iterable[str]): ``htmlID`` of the ``reactHtml`` elements
+
+        Returns:
+            Tuple[str, Dict[str, str]]: HTML with placeholders, and the inner
+            content of each element by ``htmlID``
+        """
+        regions = HtmlRegionScanner(html_ids).scan(html)
+
+        parts = []
+        contents = {}
+        position = 0
+        for html_id, (start, end) in sorted(regions.items(), key=lambda x: x[1]):
+            # Elements nested inside an already replaced element are dropped with it
+            if start < position:
+                continue
+
+            parts.append(html[position:start])
+            parts.append(f"{PLACEHOLDER_PREFIX}{html_id}")
+            contents[html_id] = html[start:end]
+            position = end
+
+        parts.append(html[position:])
+        return "".join(parts), contents
+
+    @staticmethod
+    def merge(html: str, contents: Dict[str, str]) -> str:
+        """Substitute every placeholder by its content in a single pass"""
+        if not contents:
+            return html
+
+        # Longest ids first, so an id that is a prefix of another never wins
+        html_ids = sorted(contents.keys(), key=len, reverse=True)
+        pattern = re.compile(
+            re.escape(PLACEHOLDER_PREFIX)
+            + "("
+            + "|".join(re.escape(html_id) for html_id in html_ids)
+            + ")"
+        )
+        return pattern.sub(lambda match: contents[match.group(1)], html)
@@ -1,4 +1,7 @@
-from typing import Dict, List
+import json
+import base64
+import hashlib
+from typing import Dict, Iterable, List
 
 from common.lib.logger import logger
 from common.app.zuora.api import ZuoraAPI
@@ -11,6 +14,8 @@ BILLING_DOCUMENT_TYPES = [
     "debit-memo",
 ]
 
+TEMPLATE_CONTENT_KEY = "base64EncodedTemplateFileContent"
+
 
 class BillingDocumentTemplateUtil:
     @staticmethod
@@ -19,39 +24,71 @@ class BillingDocumentTemplateUtil:
         validate_environment(environment)
 
         logger.info(f"Zuora environment: {environment}")
-        zuora_api = ZuoraAPI(environment)
-
         billing_document_templates: Dict[str, List[dict]] = {}
-        for billing_document_type in BILLING_DOCUMENT_TYPES:
-            logger.info(
-                f"Listing billing document templates for {billing_document_type}"
-            )
-            billing_document_templates[billing_document_type] = []
+        with ZuoraAPI(environment) as zuora_api:
+            for billing_document_type in BILLING_DOCUMENT_TYPES:
+                logger.info(
+                    f"Listing billing document templates for {billing_document_type}"
+                )
+                billing_document_templates[billing_document_type] = []
 
-            url = f"settings/{billing_document_type}-templates"
+                url = f"settings/{billing_document_type}-templates"
 
-            response = zuora_api.get(path=url)
+                response = zuora_api.get(path=url)
 
-            if response.status_code == 200:
-                response_json: List[dict] = response.json()
-                for item in response_json:
-                    template_format = item.get("templateFormat")
-                    associated_account = item.get("associatedToBillingAccount")
+                if response.status_code == 200:
+                    response_json: List[dict] = response.json()
+                    for item in response_json:
+                        template_format = item.get("templateFormat")
+                        associated_account = item.get("associatedToBillingAccount")
 
-                    if template_format not in ("HTML"):
-                        continue
+                        if template_format not in ("HTML"):
+                            continue
 
-                    if not associated_account:
-                        continue
+                        if not associated_account:
+                            continue
 
-                    billing_document_templates[billing_document_type].append(item)
+                        billing_document_templates[billing_document_type].append(item)
 
-            else:
-                logger.error("❌ Could not get billing document templates")
-                logger.error(response.text)
+                else:
+                    logger.error("❌ Could not get billing document templates")
+                    logger.error(response.text)
 
         return billing_document_templates
 
     @staticmethod
     def get_id_by_template_name(template_name: str, environment: str) -> str:
         pass
+
+    @staticmethod
+    def get_template(zuora_api: ZuoraAPI, url: str) -> dict:
+        """Current template with its content, or ``None`` if it cannot be read"""
+        response = zuora_api.get(path=url)
+        if response.status_code == 200:
+            return response.json()
+
+        logger.info(f"🟡 Could not get current template {url}")
+        logger.info(response.text)
+        return None
+
+    @staticmethod
+    def get_payload_hash(payload: dict, fields: Iterable[str]) -> str:
+        """Hash of a template payload that ignores formatting differences
+
+        The template content is base64 decoded and, when it is JSON, re-serialised
+        with sorted keys. Only ``fields`` of the form are hashed, so the keys the
+        API adds on read (id, updatedOn, ...) do not count as changes.
+        """
+        content = base64.b64decode(payload.get(TEMPLATE_CONTENT_KEY) or "")
+        try:
+            template = json.loads(content)
+        except ValueError:
+            template = content.decode("utf-8", errors="replace")
+
+        form = {key: payload.get(key) for key in fields if key != TEMPLATE_CONTENT_KEY}
+        normalized = json.dumps(
+            {"form": form, "template": template},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -5,6 +5,22 @@ from common.config.config import ZUORA_OBJECTS
 
 
 class CustomFieldsUtil:
+    @staticmethod
+    def get_custom_fields_from_definition(definition: dict) -> dict:
+        schema: dict = definition.get("schema", {})
+        properties: dict[str, dict] = definition["schema"]["properties"]
+        custom_fields = {
+            field_name: field_definition
+            for field_name, field_definition in properties.items()
+            if field_definition.get("origin") == "custom"
+        }
+
+        return {
+            "custom_fields": custom_fields,
+            "read_only": schema.get("readonlyOnUI", []),
+            "filterable": schema.get("filterable", []),
+        }
+
     @staticmethod
     def dump_custom_fields_definition(object_fields: dict, object_name: str):
         output_file = ZUORA_VCS_DIR.joinpath(f"custom_fields/{object_name}.json")
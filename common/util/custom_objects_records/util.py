@@ -1,7 +1,11 @@
+import os
 import json
-from typing import List
+from pathlib import Path
+from typing import Iterable, Iterator, List
 from common.lib.logger import logger
-from common.config.config import ZUORA_VCS_DIR
+from common.config.config import ZUORA_VCS_DIR, CUSTOM_OBJECT_RECORDS_FORMAT
+
+RECORDS_FORMATS = ("json", "jsonl")
 
 
 class CustomObjectRecordsUtil:
@@ -18,27 +22,125 @@ class CustomObjectRecordsUtil:
             CustomObjectRecordsUtil.remove_key_from_dict(obj, key)
 
     @staticmethod
-    def dump_records_to_file(records: List[dict], object_name: str):
-        output_file = ZUORA_VCS_DIR.joinpath(
-            f"custom_object_records/{object_name}.json"
+    def chunk_records(records: Iterable, chunk_size: int) -> Iterator[List]:
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def get_records_file(object_name: str, records_format: str) -> Path:
+        if records_format not in RECORDS_FORMATS:
+            raise ValueError(
+                f"Not a valid custom object records format - {records_format}"
+            )
+        return ZUORA_VCS_DIR.joinpath(
+            f"custom_object_records/{object_name}.{records_format}"
+        )
+
+    @staticmethod
+    def dump_records_to_file(
+        records: Iterable[dict],
+        object_name: str,
+        records_format: str = CUSTOM_OBJECT_RECORDS_FORMAT,
+    ):
+        """
+        Stream records into ``custom_object_records/{object_name}.{records_format}``.
+        ``json`` output is identical to ``json.dump(records, fs, indent=2)``, ``jsonl``
+        output holds one record per line with sorted keys. Records are written one
+        by one, so ``records`` can be a lazy iterator. The file is only replaced once
+        all records have been written, and the file in the other format is removed.
+        """
+        output_file = CustomObjectRecordsUtil.get_records_file(
+            object_name, records_format
         )
         output_file.parent.mkdir(exist_ok=True, parents=True)
         logger.info(f"Writing {object_name} records into file {output_file.as_posix()}")
 
-        with open(output_file, "w") as fs:
-            json.dump(records, fs, indent=2)
+        temp_file = output_file.with_name(f"{output_file.name}.tmp")
+        try:
+            with open(temp_file, "w") as fs:
+                if records_format == "jsonl":
+                    count = CustomObjectRecordsUtil.write_jsonl(records, fs)
+                else:
+                    count = CustomObjectRecordsUtil.write_json(records, fs)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        os.replace(temp_file, output_file)
+        for other_format in RECORDS_FORMATS:
+            if other_format != records_format:
+                CustomObjectRecordsUtil.get_records_file(
+                    object_name, other_format
+                ).unlink(missing_ok=True)
+        logger.info(f"{count} {object_name} records written")
 
     @staticmethod
-    def read_custom_object_record() -> dict:
-        logger.info("🟡 Reading custom object records from Zuora-VCS repository")
-        custom_object_records = {}
+    def write_json(records: Iterable[dict], fs) -> int:
+        fs.write("[")
+        count = 0
+        for record in records:
+            fs.write(",\n  " if count else "\n  ")
+            fs.write(json.dumps(record, indent=2).replace("\n", "\n  "))
+            count += 1
+        fs.write("\n]" if count else "]")
+        return count
+
+    @staticmethod
+    def write_jsonl(records: Iterable[dict], fs) -> int:
+        count = 0
+        for record in records:
+            fs.write(json.dumps(record, sort_keys=True))
+            fs.write("\n")
+            count += 1
+        return count
+
+    @staticmethod
+    def iter_records_from_file(file: Path) -> Iterator[dict]:
+        """
+        Records of a ``.json`` or ``.jsonl`` file. ``.jsonl`` files are read one line
+        at a time, so only the current record is held in memory.
+        """
+        with open(file) as fs:
+            if Path(file).suffix == ".jsonl":
+                for line in fs:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                yield from json.load(fs)
+
+    @staticmethod
+    def get_custom_object_record_files() -> dict:
+        """Records file of each custom object, in either format, by object name"""
         custom_object_records_dir = ZUORA_VCS_DIR.joinpath("custom_object_records")
-        files = list(custom_object_records_dir.glob("*.json"))
-        for file in files:
-            with open(file) as fs:
-                records = json.load(fs)
+        files = {}
+        for records_format in RECORDS_FORMATS:
+            for file in custom_object_records_dir.glob(f"*.{records_format}"):
+                # Prefer the configured format if an object has both files
+                if (
+                    file.stem not in files
+                    or records_format == CUSTOM_OBJECT_RECORDS_FORMAT
+                ):
+                    files[file.stem] = file
+        return files
 
-            custom_object_records[file.stem] = records
+    @staticmethod
+    def read_custom_object_record(lazy: bool = False) -> dict:
+        """
+        Records of every custom object in the Zuora-VCS repository, by object name.
+        With ``lazy``, each value is an iterator which reads its file on demand.
+        """
+        logger.info("🟡 Reading custom object records from Zuora-VCS repository")
+        custom_object_records = {}
+        files = CustomObjectRecordsUtil.get_custom_object_record_files()
+        for object_name, file in files.items():
+            records = CustomObjectRecordsUtil.iter_records_from_file(file)
+            custom_object_records[object_name] = records if lazy else list(records)
 
         logger.info(
             "✅ Reading custom object records from Zuora-VCS repository finished"
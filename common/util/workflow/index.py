@@ -0,0 +1,55 @@
+import json
+from typing import Dict, List
+from pathlib import Path
+
+
+class WorkflowSourceIndex:
+    """
+    Lookup tables of a workflow built once per workflow directory or export:
+    task name to task id, task id to task name, and task file name to path.
+    """
+
+    task_map: Dict[str, int]
+    task_names_by_id: Dict[int, str]
+    task_files: Dict[str, Path]
+
+    def __init__(self, task_map: dict = None, task_files: List[Path] = None):
+        self.task_map = task_map or {}
+        self.task_names_by_id = {}
+        for task_name, task_id in self.task_map.items():
+            self.add_task_id(task_id, task_name)
+
+        self.task_files = {}
+        for file in task_files or []:
+            self.task_files.setdefault(file.name, file)
+
+    def add_task_id(self, task_id: int, task_name: str):
+        # Keep the first name registered for an id, like a linear scan would
+        self.task_names_by_id.setdefault(int(task_id), task_name)
+
+    @staticmethod
+    def from_directory(source_code_dir: Path) -> "WorkflowSourceIndex":
+        task_map_file = source_code_dir.joinpath("task_map.json")
+        with open(task_map_file) as fs:
+            task_map: dict = json.load(fs)
+
+        task_files = list(source_code_dir.joinpath("tasks").glob("*"))
+        return WorkflowSourceIndex(task_map=task_map, task_files=task_files)
+
+    @staticmethod
+    def from_tasks(tasks: List[dict]) -> "WorkflowSourceIndex":
+        task_map = {}
+        for task in tasks:
+            task_map[task["name"]] = task["id"]
+
+        source_index = WorkflowSourceIndex(task_map=task_map)
+        # Duplicate task names keep every id resolvable
+        for task in tasks:
+            source_index.add_task_id(task["id"], task["name"])
+        return source_index
+
+    def find_task_file(self, task_filename: str) -> Path:
+        return self.task_files.get(task_filename)
+
+    def get_task_name_by_id(self, id: int) -> str:
+        return self.task_names_by_id.get(int(id))
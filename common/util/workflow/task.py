@@ -3,6 +3,7 @@ from typing import List
 from pathlib import Path
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
+from common.util.workflow.index import WorkflowSourceIndex
 
 
 class NotValidZuoraWorkflowTaskName(Exception):
@@ -11,25 +12,13 @@ class NotValidZuoraWorkflowTaskName(Exception):
 
 class WorkflowTaskUtil:
     @staticmethod
-    def find_task_file(task_filename: str, task_files: List[Path]) -> Path:
-        for file in task_files:
-            if task_filename == file.name:
-                return file
-        return None
-
-    @staticmethod
-    def create_task_definitions(
-        task_map_src: dict,
-        task_files: List[Path],
-    ) -> List[dict]:
+    def create_task_definitions(source_index: WorkflowSourceIndex) -> List[dict]:
         tasks_dest: List[dict] = []
 
-        for task_name, task_id in task_map_src.items():
+        for task_name, task_id in source_index.task_map.items():
             logger.info(f"Building task data {task_name}")
 
-            task_definition_file = WorkflowTaskUtil.find_task_file(
-                f"{task_name}.json", task_files
-            )
+            task_definition_file = source_index.find_task_file(f"{task_name}.json")
             if not task_definition_file:
                 logger.info(f"🚩🚩🚩Task definition file not found: {task_name}")
                 continue
@@ -40,57 +29,43 @@ class WorkflowTaskUtil:
             task_action_type = task_definition["action_type"]
 
             if task_action_type == "If":
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.liquid", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.liquid")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["if_clause"] = src_code
 
             elif task_action_type == "Logic::Liquid":
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.liquid", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.liquid")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["code"] = src_code
 
             elif task_action_type == "Logic::Case":
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.liquid", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.liquid")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["case_clause"] = src_code
 
             elif task_action_type == "Script::JavaScript":
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.js", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.js")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["code"] = src_code
 
             elif task_action_type in ("Logic::JSONTransform"):
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.jsonata", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.jsonata")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["template"] = src_code
 
             elif task_action_type in ("Data::Link"):
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.sql", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.sql")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["query"] = src_code
 
             elif task_action_type in ("Email"):
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.html", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.html")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["email"]["template"] = src_code
@@ -99,9 +74,7 @@ class WorkflowTaskUtil:
                 "File::CustomPDF::CustomDocument",
                 "Billing::CustomBillingDocument",
             ):
-                code_file = WorkflowTaskUtil.find_task_file(
-                    f"{task_name}.html", task_files
-                )
+                code_file = source_index.find_task_file(f"{task_name}.html")
                 if code_file:
                     src_code = code_file.read_text()
                     task_definition["parameters"]["template"] = src_code
@@ -112,13 +85,6 @@ class WorkflowTaskUtil:
 
         return tasks_dest
 
-    @staticmethod
-    def get_task_name_by_id(task_map: dict, id: int) -> str:
-        for task_name, task_id in task_map.items():
-            if int(task_id) == int(id):
-                return task_name
-        return None
-
     @staticmethod
     def get_id_from_filename(filename: str) -> int:
         suffix = filename.split("__")[-1]
@@ -130,7 +96,9 @@ class WorkflowTaskUtil:
             return None
 
     @staticmethod
-    def update_id_in_file(file: str, task_map_original: dict, task_map_new: dict):
+    def update_id_in_file(
+        file: str, source_index: WorkflowSourceIndex, task_map_new: dict
+    ):
         logger.info(f"Updating id in file or object: {file}")
 
         id_in_file = WorkflowTaskUtil.get_id_from_filename(file)
@@ -138,7 +106,7 @@ class WorkflowTaskUtil:
             logger.info(f"ID in file {id_in_file}")
             return file
 
-        task_name = WorkflowTaskUtil.get_task_name_by_id(task_map_original, id_in_file)
+        task_name = source_index.get_task_name_by_id(id_in_file)
         if not task_name:
             logger.info(f"🚩New id not found to replace id {id_in_file}")
             return file
@@ -152,13 +120,13 @@ class WorkflowTaskUtil:
 
     @staticmethod
     def update_ids_in_files_for_callout_task(
-        files: List[dict], task_map_original: dict, task_map_new: dict
+        files: List[dict], source_index: WorkflowSourceIndex, task_map_new: dict
     ):
         for file_obj in files:
             file = file_obj["key"]
             updated_file = WorkflowTaskUtil.update_id_in_file(
                 file=file,
-                task_map_original=task_map_original,
+                source_index=source_index,
                 task_map_new=task_map_new,
             )
             file_obj["key"] = updated_file
@@ -166,13 +134,13 @@ class WorkflowTaskUtil:
 
     @staticmethod
     def update_ids_in_files_for_email_task(
-        files: dict, task_map_original: dict, task_map_new: dict
+        files: dict, source_index: WorkflowSourceIndex, task_map_new: dict
     ):
         updated_files = {}
         for filename, file_obj in files.items():
             updated_file = WorkflowTaskUtil.update_id_in_file(
                 file=filename,
-                task_map_original=task_map_original,
+                source_index=source_index,
                 task_map_new=task_map_new,
             )
             updated_files[updated_file] = file_obj
@@ -191,7 +159,7 @@ class WorkflowTaskUtil:
     def dump_task_to_file(
         task: dict,
         file_basename: str,
-        task_map_original: dict,
+        source_index: WorkflowSourceIndex,
         task_map_new: dict,
     ):
         workflows_dir = ZUORA_VCS_DIR.joinpath("workflows")
@@ -302,7 +270,7 @@ class WorkflowTaskUtil:
             if files:
                 updated_files = WorkflowTaskUtil.update_ids_in_files_for_email_task(
                     files=files,
-                    task_map_original=task_map_original,
+                    source_index=source_index,
                     task_map_new=task_map_new,
                 )
                 task_parameters["files"] = updated_files
@@ -360,7 +328,7 @@ class WorkflowTaskUtil:
             task_object = task["object"]
             task_object = WorkflowTaskUtil.update_id_in_file(
                 file=task_object,
-                task_map_original=task_map_original,
+                source_index=source_index,
                 task_map_new=task_map_new,
             )
 
@@ -384,7 +352,7 @@ class WorkflowTaskUtil:
                 files = task_parameters["files"]
                 WorkflowTaskUtil.update_ids_in_files_for_callout_task(
                     files=files,
-                    task_map_original=task_map_original,
+                    source_index=source_index,
                     task_map_new=task_map_new,
                 )
 
@@ -393,7 +361,7 @@ class WorkflowTaskUtil:
                 if "FileDownload" in url:
                     updated_url = WorkflowTaskUtil.update_id_in_file(
                         file=url,
-                        task_map_original=task_map_original,
+                        source_index=source_index,
                         task_map_new=task_map_new,
                     )
                     task_parameters["url"] = updated_url
@@ -452,14 +420,6 @@ class WorkflowTaskUtil:
 
         return duplicate_tasks
 
-    @staticmethod
-    def get_task_map_original(tasks: List[dict]) -> dict:
-        task_map = {}
-        for task in tasks:
-            task_map[task["name"]] = task["id"]
-
-        return task_map
-
     def get_task_map_new_ids(tasks: List[dict]) -> dict:
         task_map = {}
         repeated_task_names = []
@@ -485,17 +445,16 @@ class WorkflowTaskUtil:
         with open(duplicates_file, "w") as fs:
             json.dump(duplicate_tasks, fs)
 
-        task_map_original = WorkflowTaskUtil.get_task_map_original(tasks)
+        source_index = WorkflowSourceIndex.from_tasks(tasks)
         task_map_new = WorkflowTaskUtil.get_task_map_new_ids(tasks)
         WorkflowTaskUtil.dump_task_map_to_file(task_map_new, f"{dirname}/task_map.json")
 
         for task in tasks:
             task_name = task["name"]
-            task_map_original[task_name] = task["id"]
             WorkflowTaskUtil.dump_task_to_file(
                 task=task,
                 file_basename=f"{dirname}/tasks/{task_name}",
-                task_map_original=task_map_original,
+                source_index=source_index,
                 task_map_new=task_map_new,
             )
 
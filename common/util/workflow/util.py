@@ -1,12 +1,124 @@
+import os
+import threading
+from pathlib import Path
 from typing import Dict, List
-from packaging.version import Version
 
 from common.lib.logger import logger
+from common.lib.cache import TTLCache
+from common.lib.disk_cache import DiskCache
 from common.app.zuora.api import ZuoraAPI
 from common.app.zuora.validator import validate_environment
 
+WORKFLOW_PAGE_LENGTH = 50
+WORKFLOW_CATALOGUE_TTL = float(os.getenv("ZUORA_WORKFLOW_CATALOGUE_TTL", 300))
+
+# environment -> {workflow name: version map}
+workflow_catalogue_cache = TTLCache(ttl=WORKFLOW_CATALOGUE_TTL)
+# Exports of workflow versions are kept on disk, keyed by environment and export
+# URL (not by content). ZUORA_WORKFLOW_EXPORT_CACHE=0 always downloads them
+WORKFLOW_EXPORT_CACHE_ENABLED = os.getenv("ZUORA_WORKFLOW_EXPORT_CACHE", "1") != "0"
+WORKFLOW_EXPORT_CACHE_DIR = Path(
+    os.getenv(
+        "ZUORA_WORKFLOW_EXPORT_CACHE_DIR",
+        Path.home().joinpath(".zuora/cache/workflow_exports"),
+    )
+)
+WORKFLOW_EXPORT_CACHE_MAX_BYTES = int(
+    os.getenv("ZUORA_WORKFLOW_EXPORT_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+)
+workflow_export_cache = DiskCache(
+    WORKFLOW_EXPORT_CACHE_DIR, WORKFLOW_EXPORT_CACHE_MAX_BYTES
+)
+
+_catalogue_locks: Dict[str, threading.Lock] = {}
+_catalogue_locks_lock = threading.Lock()
+
+
+def get_catalogue_lock(environment: str) -> threading.Lock:
+    with _catalogue_locks_lock:
+        if environment not in _catalogue_locks:
+            _catalogue_locks[environment] = threading.Lock()
+        return _catalogue_locks[environment]
+
 
 class ZuoraWorkflowUtil:
+    @staticmethod
+    def get_version_map(workflow: dict) -> dict:
+        """Map the active and latest inactive versions of a listed workflow"""
+        version_map = {}
+        versions = [workflow.get("active_version")]
+        versions.extend(workflow.get("latest_inactive_versions") or [])
+        for version in versions:
+            if not version:
+                continue
+
+            version_map[version["version"]] = {
+                "definition_id": version["definitionId"],
+                "description": version["description"],
+            }
+        return version_map
+
+    @staticmethod
+    def list_workflows(environment: str) -> List[dict]:
+        """List every workflow of the environment, page by page
+
+        Raises:
+            Exception: A page could not be retrieved
+        """
+        workflows = []
+        with ZuoraAPI(environment) as zuora_api:
+            page = 1
+            while True:
+                url = f"workflows?page={page}&page_length={WORKFLOW_PAGE_LENGTH}"
+                response = zuora_api.get(path=url)
+                if response.status_code != 200:
+                    raise Exception(f"Unable to list workflows. {response.text}")
+
+                response_json: dict = response.json()
+                data: List[dict] = response_json.get("data") or []
+                workflows.extend(data)
+
+                pagination: dict = response_json.get("pagination") or {}
+                if len(data) < WORKFLOW_PAGE_LENGTH or not pagination.get("next_page"):
+                    break
+                page += 1
+
+        logger.info(f"Listed {len(workflows)} workflows in {environment.upper()}")
+        return workflows
+
+    @staticmethod
+    def get_workflow_catalogue(environment: str) -> Dict[str, dict]:
+        """Version map of every workflow by name, listed once per environment
+
+        The catalogue is cached for ``WORKFLOW_CATALOGUE_TTL`` seconds, and
+        concurrent callers wait for a single listing. Deploys invalidate it.
+        """
+        validate_environment(environment)
+        environment = environment.lower()
+
+        catalogue = workflow_catalogue_cache.get(environment)
+        if catalogue is not None:
+            return catalogue
+
+        with get_catalogue_lock(environment):
+            catalogue = workflow_catalogue_cache.get(environment)
+            if catalogue is not None:
+                return catalogue
+
+            catalogue = {}
+            for workflow in ZuoraWorkflowUtil.list_workflows(environment):
+                # First listed workflow wins, like the lookup by name
+                catalogue.setdefault(
+                    workflow["name"], ZuoraWorkflowUtil.get_version_map(workflow)
+                )
+
+            workflow_catalogue_cache.set(environment, catalogue)
+            return catalogue
+
+    @staticmethod
+    def invalidate_workflow_catalogue(environment: str = None):
+        workflow_catalogue_cache.invalidate(environment and environment.lower())
+
     @staticmethod
     def get_workflow_version_map_by_workflow_name(
         environment: str,
@@ -16,6 +128,26 @@ class ZuoraWorkflowUtil:
         logger.info(f"Zuora environment: {environment}")
         validate_environment(environment)
 
+        try:
+            catalogue = ZuoraWorkflowUtil.get_workflow_catalogue(environment)
+        except Exception as e:
+            logger.info(f"🟡 Unable to list workflows: {e}")
+            catalogue = {}
+
+        if workflow_name in catalogue:
+            return dict(catalogue[workflow_name])
+
+        # Not listed (e.g. created after the catalogue was cached), look it up
+        return ZuoraWorkflowUtil.fetch_workflow_version_map(
+            environment=environment,
+            workflow_name=workflow_name,
+        )
+
+    @staticmethod
+    def fetch_workflow_version_map(
+        environment: str,
+        workflow_name: str,
+    ) -> dict:
         url = f"workflows?name={workflow_name}"
 
         zuora_api = ZuoraAPI(environment)
@@ -27,25 +159,9 @@ class ZuoraWorkflowUtil:
             response_json = response.json()
             logger.info(response.json()["pagination"])
             data = response_json["data"][0]
-            active_version = data["active_version"]
-            logger.info(
-                f"{active_version['version']} - {active_version['definitionId']}"
-            )
-            version_map[active_version["version"]] = {
-                "definition_id": active_version["definitionId"],
-                "description": active_version["description"],
-            }
-
-            latest_inactive_versions = data["latest_inactive_versions"]
-            for inactive_version in latest_inactive_versions:
-                logger.info(
-                    f"{inactive_version['version']} - {inactive_version['definitionId']}"
-                )
-
-                version_map[inactive_version["version"]] = {
-                    "definition_id": inactive_version["definitionId"],
-                    "description": inactive_version["description"],
-                }
+            version_map = ZuoraWorkflowUtil.get_version_map(data)
+            for version, details in version_map.items():
+                logger.info(f"{version} - {details['definition_id']}")
         else:
             logger.info(f"No successful response: {response.json()}")
 
@@ -56,20 +172,18 @@ class ZuoraWorkflowUtil:
         for key, value in version_map.items():
             return value["definition_id"]
 
-    @staticmethod
-    def filter_task_by_id(task_id: str, tasks: List[dict]) -> dict:
-        for task in tasks:
-            if task["id"] == task_id:
-                logger.info(f"Task found with ID: {task_id}")
-                return task
-        return {}
-
     @staticmethod
     def export_workflow_definition(
         environment: str,
         workflow_id: int,
         workflow_version: str,
+        use_cache: bool = WORKFLOW_EXPORT_CACHE_ENABLED,
     ):
+        """
+        Workflow definition of one version. Exports are cached on disk by
+        environment and URL, so a version edited in place is only picked up
+        with ``use_cache=False``, which downloads it and refreshes the cache.
+        """
         logger.info(
             f"Exporting workflow {workflow_id} details for version {workflow_version}"
         )
@@ -77,6 +191,13 @@ class ZuoraWorkflowUtil:
         validate_environment(environment)
 
         url = f"workflows/{workflow_id}/export?version={workflow_version}"
+        cache_key = f"{environment.lower()}/{url}"
+
+        if use_cache:
+            response_json = workflow_export_cache.get(cache_key)
+            if response_json is not None:
+                logger.info("Workflow export served from the disk cache")
+                return ZuoraWorkflowUtil.build_workflow_definition(response_json)
 
         zuora_api = ZuoraAPI(environment)
 
@@ -84,51 +205,73 @@ class ZuoraWorkflowUtil:
 
         if response.status_code == 200:
             response_json = response.json()
-            wf_metadata = response_json["workflow"]
-            wf_def_metadata = response_json["workflow_definition"]
+            try:
+                workflow_export_cache.set(cache_key, response_json)
+            except OSError as e:
+                logger.info(f"🟡 Unable to cache workflow export: {e}")
+            return ZuoraWorkflowUtil.build_workflow_definition(response_json)
+        else:
+            logger.info(f"❌ No successful response: {response.json()}")
 
-            wf_tasks = response_json["tasks"]
-            wf_linkages = response_json["linkages"]
+    @staticmethod
+    def build_workflow_definition(response_json: dict) -> dict:
+        wf_metadata = response_json["workflow"]
+        wf_def_metadata = response_json["workflow_definition"]
 
-            linkages = []
-            for linkage in wf_linkages:
-                source_task_id = linkage["source_task_id"]
-                target_task_id = linkage["target_task_id"]
-                linkage_type = linkage["linkage_type"]
-                source_workflow_id = linkage["source_workflow_id"]
+        wf_tasks = response_json["tasks"]
+        wf_linkages = response_json["linkages"]
 
-                source_task = ZuoraWorkflowUtil.filter_task_by_id(
-                    source_task_id, wf_tasks
-                )
-                target_task = ZuoraWorkflowUtil.filter_task_by_id(
-                    target_task_id, wf_tasks
-                )
-                source_task_name = source_task.get("name", source_task_id)
-                target_task_name = target_task.get("name", target_task_id)
-
-                linkages.append(
-                    {
-                        "source_workflow_id": source_workflow_id,
-                        "source_task_name": source_task_name,
-                        "target_task_name": target_task_name,
-                        "linkage_type": linkage_type,
-                    }
-                )
+        # First task wins on duplicated ids
+        tasks_by_id = {}
+        for task in wf_tasks:
+            tasks_by_id.setdefault(task["id"], task)
+
+        linkages = []
+        unresolved_task_ids = set()
+        for linkage in wf_linkages:
+            source_task_id = linkage["source_task_id"]
+            target_task_id = linkage["target_task_id"]
+            linkage_type = linkage["linkage_type"]
+            source_workflow_id = linkage["source_workflow_id"]
 
-            sorted_linkages = sorted(
-                linkages, key=lambda x: str(x["source_task_name"]), reverse=True
+            source_task = tasks_by_id.get(source_task_id, {})
+            target_task = tasks_by_id.get(target_task_id, {})
+            if not source_task:
+                unresolved_task_ids.add(source_task_id)
+            if not target_task:
+                unresolved_task_ids.add(target_task_id)
+
+            source_task_name = source_task.get("name", source_task_id)
+            target_task_name = target_task.get("name", target_task_id)
+
+            linkages.append(
+                {
+                    "source_workflow_id": source_workflow_id,
+                    "source_task_name": source_task_name,
+                    "target_task_name": target_task_name,
+                    "linkage_type": linkage_type,
+                }
             )
-            return {
-                "workflow": wf_metadata,
-                "workflow_definition": wf_def_metadata,
-                "tasks": wf_tasks,
-                "linkages": sorted_linkages,
-            }
-        else:
-            logger.info(f"❌ No successful response: {response.json()}")
+
+        logger.info(
+            f"Resolved {len(linkages)} linkages against {len(wf_tasks)} tasks, "
+            f"unresolved task ids: {sorted(unresolved_task_ids, key=str)}"
+        )
+
+        sorted_linkages = sorted(
+            linkages, key=lambda x: str(x["source_task_name"]), reverse=True
+        )
+        return {
+            "workflow": wf_metadata,
+            "workflow_definition": wf_def_metadata,
+            "tasks": wf_tasks,
+            "linkages": sorted_linkages,
+        }
 
     @staticmethod
     def get_new_version_tag(version_map: Dict[str, int]) -> str:
+        from packaging.version import Version
+
         versions = list(version_map.keys())
         sorted_versions = sorted(versions, key=lambda version: Version(version))
         logger.info(f"unsorted_versions == {versions}")
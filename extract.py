@@ -1,5 +1,9 @@
-from gui.app_extract import run_app_for_extract
+def main():
+    # Imported here so that importing this module does not load Tkinter
+    from gui.app_extract import run_app_for_extract
+
+    run_app_for_extract()
 
 
 if __name__ == "__main__":
-    run_app_for_extract()
+    main()
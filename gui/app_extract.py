@@ -1,16 +1,18 @@
 from common.config import config
 from common.lib.logger import logger
 from tkinter import Tk, ttk, BooleanVar, StringVar
-from common.util.workflow.util import ZuoraWorkflowUtil
-from steps.extract.extract_all import extract_all
 from gui.checkbox_options import CHECKBOX_OPTIONS
 from gui.style import get_style
+from gui.worker import BackgroundWorker
 
 
 class Application(ttk.Frame):
     def __init__(self, main_window: Tk):
         super().__init__(main_window)
         main_window.title("Zuora Deployment Automation Tool - Extract")
+        self.worker = BackgroundWorker(self)
+        self.fetch_generation = 0
+        self.workflows = []
 
         label = ttk.Label(self, text="Select items to extract")
         label.place(x=400, y=10)
@@ -56,21 +58,39 @@ class Application(ttk.Frame):
         workflows_label = ttk.Label(self, text="Select Workflows to extract")
         workflows_label.place(x=20, y=250)
 
+        self.extract_button = ttk.Button(
+            text="EXTRACT",
+            command=self.extract_selected,
+            style="TButton",
+        )
+        self.cancel_button = ttk.Button(
+            text="CANCEL",
+            command=self.cancel_running,
+            state="disabled",
+        )
+        self.progress_bar = ttk.Progressbar(self, mode="determinate", length=300)
+
         # Set default environment and fetch workflow versions
         self.workflow_checkboxes: list[ttk.Checkbutton] = []
         self.workflow_checkboxes_values: list[tuple[str, BooleanVar]] = []
         self.workflow_versions: list[ttk.Combobox] = []
         self.environment_box.set("dev")
 
-        button = ttk.Button(
-            text="EXTRACT",
-            command=self.extract_selected,
-            style="TButton",
-        )
-        button.place(x=400, y=300 + 35 * self.checkbox_counter)
+        self.place_controls()
+        main_window.protocol("WM_DELETE_WINDOW", self.close)
+
+    def place_controls(self):
+        rows = self.checkbox_counter + len(self.workflow_checkboxes)
+        self.extract_button.place(x=300, y=300 + 35 * rows)
+        self.cancel_button.place(x=450, y=300 + 35 * rows)
+        self.progress_bar.place(x=300, y=345 + 35 * rows)
+
+        self.place(width=800, height=400 + 35 * rows)
+        self.master.minsize(1000, 400 + 35 * rows)
 
-        self.place(width=800, height=400 + 35 * self.checkbox_counter)
-        main_window.minsize(1000, 400 + 35 * self.checkbox_counter)
+    def close(self):
+        self.worker.shutdown()
+        self.master.destroy()
 
     def fetch_workflow_versions(self, *args, **kwargs):
         # Reset workflow checkboxes
@@ -93,8 +113,43 @@ class Application(ttk.Frame):
         self.workflow_versions: list[ttk.Combobox] = []
         self.workflow_checkboxes_values: list[tuple[str, BooleanVar]] = []
 
-        self.fetch_data_from_zuora(self.environment_box.get())
+        # Results of a previous environment that arrive late are ignored
+        self.fetch_generation += 1
+        fetch_generation = self.fetch_generation
+        environment = self.environment_box.get()
+        workflows = {}
+
+        self.progress_bar.stop()
+        self.progress_bar.config(
+            mode="determinate", maximum=len(config.WORKFLOW_NAMES), value=0
+        )
+
+        def workflow_fetched(workflow_name: str, workflow: dict):
+            if fetch_generation != self.fetch_generation:
+                return
+
+            workflows[workflow_name] = workflow
+            self.progress_bar.step(1)
+            if len(workflows) == len(config.WORKFLOW_NAMES):
+                self.workflows = [
+                    workflows[name]
+                    for name in config.WORKFLOW_NAMES
+                    if workflows[name] is not None
+                ]
+                self.show_workflows()
 
+        for workflow_name in config.WORKFLOW_NAMES:
+            self.worker.submit(
+                Application.fetch_workflow,
+                workflow_name,
+                environment,
+                on_done=lambda workflow, name=workflow_name: workflow_fetched(
+                    name, workflow
+                ),
+                on_error=lambda error, name=workflow_name: workflow_fetched(name, None),
+            )
+
+    def show_workflows(self):
         checkbox_counter = 0
         for workflow in self.workflows:
             workflow_value = BooleanVar(self)
@@ -124,31 +179,28 @@ class Application(ttk.Frame):
 
             checkbox_counter += 1
 
-        self.checkbox_counter += checkbox_counter
+        self.place_controls()
 
-    def fetch_data_from_zuora(self, environment: str = "dev"):
-        self.workflows = []
+    @staticmethod
+    def fetch_workflow(workflow_name: str, environment: str = "dev") -> dict:
+        """Runs on a worker thread, one call per workflow"""
+        from common.util.workflow.util import ZuoraWorkflowUtil
 
-        for workflow_name in config.WORKFLOW_NAMES:
-            try:
-                workflow_version_map = (
-                    ZuoraWorkflowUtil.get_workflow_version_map_by_workflow_name(
-                        workflow_name=workflow_name,
-                        environment=environment,
-                    )
-                )
-            except Exception:
-                continue
+        workflow_version_map = (
+            ZuoraWorkflowUtil.get_workflow_version_map_by_workflow_name(
+                workflow_name=workflow_name,
+                environment=environment,
+            )
+        )
 
-            workflow = {
-                "name": workflow_name,
-                "default": False,
-                "versions": [
-                    {"number": version_key, "description": details["description"]}
-                    for version_key, details in workflow_version_map.items()
-                ],
-            }
-            self.workflows.append(workflow)
+        return {
+            "name": workflow_name,
+            "default": False,
+            "versions": [
+                {"number": version_key, "description": details["description"]}
+                for version_key, details in workflow_version_map.items()
+            ],
+        }
 
     def workflow_checkbox_clicked(self, *args, **kwargs):
         for index, checkbox in enumerate(self.workflow_checkboxes):
@@ -191,7 +243,38 @@ class Application(ttk.Frame):
                 }
             )
 
-        extract_all(request_form)
+        self.run_in_background(request_form)
+
+    def run_in_background(self, request_form: dict):
+        from steps.extract.extract_all import extract_all
+
+        self.extract_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.progress_bar.config(mode="indeterminate")
+        self.progress_bar.start()
+
+        self.worker.submit(
+            extract_all,
+            request_form,
+            cancel_event=self.worker.reset_cancel(),
+            on_done=self.extract_finished,
+            on_error=self.extract_failed,
+        )
+
+    def extract_finished(self, status: str = None):
+        self.progress_bar.stop()
+        self.progress_bar.config(mode="determinate", value=0)
+        self.extract_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+
+    def extract_failed(self, error: Exception):
+        logger.info(f"❌ Extraction failed: {error}")
+        self.extract_finished()
+
+    def cancel_running(self):
+        logger.info("🟠 Cancelling after the components already running")
+        self.worker.cancel()
+        self.cancel_button.config(state="disabled")
 
 
 def run_app_for_extract():
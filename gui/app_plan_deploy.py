@@ -1,16 +1,17 @@
 from common.config import config
 from common.lib.logger import logger
 from tkinter import Tk, ttk, BooleanVar
-from steps.plan.plan_all import plan_all
-from steps.deploy.deploy_all import deploy_all
 from gui.checkbox_options import CHECKBOX_OPTIONS
 from gui.style import get_style
+from gui.worker import BackgroundWorker
 
 
 class Application(ttk.Frame):
     def __init__(self, main_window: Tk):
         super().__init__(main_window)
         main_window.title("Zuora Deployment Automation Tool - plan and deploy")
+        self.worker = BackgroundWorker(self)
+        self.plan_status = None
 
         self.checkboxes: list[ttk.Checkbutton] = []
         self.checkboxes_values: list[tuple[str, BooleanVar]] = []
@@ -85,13 +86,30 @@ class Application(ttk.Frame):
         )
         self.deploy_button.place(x=450, y=300 + 35 * checkbox_counter)
 
+        self.cancel_button = ttk.Button(
+            text="CANCEL",
+            command=self.cancel_running,
+            state="disabled",
+        )
+        self.cancel_button.place(x=600, y=300 + 35 * checkbox_counter)
+
+        self.progress_bar = ttk.Progressbar(self, mode="indeterminate", length=450)
+        self.progress_bar.place(x=300, y=345 + 35 * checkbox_counter)
+
         self.place(width=800, height=400 + 35 * checkbox_counter)
         main_window.minsize(1000, 400 + 35 * checkbox_counter)
+        main_window.protocol("WM_DELETE_WINDOW", self.close)
+
+    def close(self):
+        self.worker.shutdown()
+        self.master.destroy()
 
     def any_state_change(self):
         self.deploy_button.config(state="disabled")
 
     def plan_selected(self):
+        from steps.plan.plan_all import plan_all
+
         logger.info("Planning selected componets")
         request_form = {"target_env": self.environment_box.get()}
 
@@ -114,16 +132,50 @@ class Application(ttk.Frame):
             logger.info(f"Workflow {workflow_checkbox.cget('text')} is selected")
             request_form["workflows"].append(workflow_checkbox.cget("text"))
 
-        self.plan_status = plan_all(request_form)
-        if self.plan_status == "success":
-            self.deploy_button.config(state="normal")
+        self.request_form = request_form
+        self.run_in_background(plan_all, on_done=self.plan_finished)
 
-            self.request_form = request_form
+    def plan_finished(self, status: str):
+        self.plan_status = status
+        self.step_finished()
 
     def deploy_selected(self):
+        from steps.deploy.deploy_all import deploy_all
+
         logger.info("Deploying selected componets")
         if self.plan_status == "success":
-            deploy_all(self.request_form)
+            self.run_in_background(deploy_all, on_done=self.step_finished)
+
+    def run_in_background(self, step, on_done):
+        self.plan_button.config(state="disabled")
+        self.deploy_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.progress_bar.start()
+
+        self.worker.submit(
+            step,
+            self.request_form,
+            cancel_event=self.worker.reset_cancel(),
+            on_done=on_done,
+            on_error=self.step_failed,
+        )
+
+    def step_finished(self, status: str = None):
+        self.progress_bar.stop()
+        self.plan_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        if self.plan_status == "success":
+            self.deploy_button.config(state="normal")
+
+    def step_failed(self, error: Exception):
+        logger.info(f"❌ FAILED: {error}")
+        self.plan_status = None
+        self.step_finished()
+
+    def cancel_running(self):
+        logger.info("🟠 Cancelling after the component already running")
+        self.worker.cancel()
+        self.cancel_button.config(state="disabled")
 
 
 def run_app_for_plan_and_deploy():
@@ -0,0 +1,76 @@
+import queue
+import threading
+from tkinter import Misc
+from typing import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+WORKER_MAX_THREADS = 8
+POLL_INTERVAL_MS = 100
+
+
+class BackgroundWorker:
+    """
+    Runs Zuora calls on worker threads so the Tk main loop never blocks.
+    Finished calls are put on a queue which the main thread drains with
+    ``after()``, so ``on_done``/``on_error`` callbacks can safely update widgets.
+    Long running steps receive ``cancel_event`` to stop between components.
+    """
+
+    def __init__(self, widget: Misc, max_workers: int = WORKER_MAX_THREADS):
+        self.widget = widget
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.results: "queue.Queue[tuple]" = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.pending = 0
+        self._polling = False
+
+    def submit(
+        self,
+        task: Callable,
+        *args,
+        on_done: Callable = None,
+        on_error: Callable = None,
+        **kwargs,
+    ) -> Future:
+        self.pending += 1
+        future = self.executor.submit(task, *args, **kwargs)
+        future.add_done_callback(
+            lambda future: self.results.put((future, on_done, on_error))
+        )
+        self._schedule_poll()
+        return future
+
+    def poll(self):
+        self._polling = False
+        while True:
+            try:
+                future, on_done, on_error = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            self.pending -= 1
+            error = future.exception()
+            if error is not None:
+                if on_error:
+                    on_error(error)
+            elif on_done:
+                on_done(future.result())
+
+        if self.pending:
+            self._schedule_poll()
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.widget.after(POLL_INTERVAL_MS, self.poll)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def reset_cancel(self) -> threading.Event:
+        self.cancel_event.clear()
+        return self.cancel_event
+
+    def shutdown(self):
+        self.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
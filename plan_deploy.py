@@ -1,4 +1,9 @@
-from gui.app_plan_deploy import run_app_for_plan_and_deploy
+def main():
+    # Imported here so that importing this module does not load Tkinter
+    from gui.app_plan_deploy import run_app_for_plan_and_deploy
 
-if __name__ == "__main__":
     run_app_for_plan_and_deploy()
+
+
+if __name__ == "__main__":
+    main()
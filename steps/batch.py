@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from common.config.config import ZUORA_VCS_DIR
+from common.lib.logger import logger
+
+root_dir = Path(__file__).parent.parent
+
+BATCH_STEPS = ("extract", "plan", "deploy")
+
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+EXIT_INVALID_REQUEST = 2
+
+# (name, request_form)
+BatchRequest = Tuple[str, dict]
+
+
+class BatchRequestError(Exception):
+    pass
+
+
+def validate_request_form(request_form: dict, name: str):
+    if not isinstance(request_form, dict):
+        raise BatchRequestError(f"{name}: request form must be a JSON object")
+
+    steps = request_form.get("steps")
+    if not isinstance(steps, list) or not steps:
+        raise BatchRequestError(f"{name}: 'steps' must be a non-empty list")
+
+    for step in steps:
+        if step not in BATCH_STEPS:
+            raise BatchRequestError(f"{name}: not a valid step - {step}")
+
+    if "extract" in steps and not request_form.get("source_environment"):
+        raise BatchRequestError(f"{name}: 'source_environment' is required")
+
+    if ("plan" in steps or "deploy" in steps) and not request_form.get("target_env"):
+        raise BatchRequestError(f"{name}: 'target_env' is required")
+
+
+def load_request_forms(path: Path) -> List[BatchRequest]:
+    """Load one request form, or a list of them, from a JSON file
+
+    Besides the keys read by ``extract_all``, ``plan_all`` and ``deploy_all``,
+    a request form lists the ``steps`` to run in order, and optionally the
+    ``vcs_dir`` to run them against instead of ``ZUORA_VCS_DIR``.
+    """
+    with open(path) as fs:
+        content = json.load(fs)
+
+    if isinstance(content, list):
+        requests = [(f"{path}#{i}", form) for i, form in enumerate(content)]
+    else:
+        requests = [(str(path), content)]
+
+    for name, request_form in requests:
+        validate_request_form(request_form, name)
+    return requests
+
+
+def get_step_function(step: str) -> Callable:
+    if step == "extract":
+        from steps.extract.extract_all import extract_all
+
+        return extract_all
+    if step == "plan":
+        from steps.plan.plan_all import plan_all
+
+        return plan_all
+    if step == "deploy":
+        from steps.deploy.deploy_all import deploy_all
+
+        return deploy_all
+
+    raise BatchRequestError(f"Not a valid step - {step}")
+
+
+def run_request_form(name: str, request_form: dict) -> dict:
+    """
+    Runs the steps of one request form in order and times each of them.
+    A failed step stops the request form, since later steps depend on it.
+    """
+    result = {"name": name, "status": "success", "steps": []}
+    for step in request_form["steps"]:
+        step_result = {"step": step, "status": "success"}
+        start = time.perf_counter()
+        try:
+            output = get_step_function(step)(request_form)
+            if output != "success":
+                raise Exception(f"{step.capitalize()} finished with status {output}")
+        except Exception as e:
+            logger.exception(f"❌ {name}: {step} failed")
+            step_result["status"] = "failed"
+            step_result["error"] = str(e)
+
+        step_result["seconds"] = round(time.perf_counter() - start, 3)
+        result["steps"].append(step_result)
+        logger.info(
+            f"⏱️ {name}: {step} {step_result['status']} "
+            f"in {step_result['seconds']:.1f}s"
+        )
+
+        if step_result["status"] != "success":
+            result["status"] = "failed"
+            break
+
+    return result
+
+
+def get_vcs_dir(request_form: dict) -> Path:
+    return Path(request_form.get("vcs_dir") or ZUORA_VCS_DIR).resolve()
+
+
+def group_by_vcs_dir(requests: List[BatchRequest]) -> Dict[Path, List[BatchRequest]]:
+    groups: Dict[Path, List[BatchRequest]] = {}
+    for name, request_form in requests:
+        groups.setdefault(get_vcs_dir(request_form), []).append((name, request_form))
+    return groups
+
+
+def run_group_in_subprocess(vcs_dir: Path, requests: List[BatchRequest]) -> List[dict]:
+    """
+    Runs request forms sharing a ``zuora-vcs`` directory one after another in a
+    child process, with ``ZUORA_VCS_DIR`` pointing to that directory.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        forms_file = Path(tmp_dir).joinpath("request_forms.json")
+        report_file = Path(tmp_dir).joinpath("report.json")
+        # The child runs from root_dir, so it must not resolve vcs_dir again
+        with open(forms_file, "w") as fs:
+            json.dump(
+                [
+                    {**request_form, "vcs_dir": str(vcs_dir)}
+                    for _, request_form in requests
+                ],
+                fs,
+            )
+
+        logger.info(f"Running {len(requests)} request forms against {vcs_dir}")
+        process = subprocess.run(
+            [
+                sys.executable,
+                str(root_dir.joinpath("batch.py")),
+                str(forms_file),
+                "--report",
+                str(report_file),
+            ],
+            cwd=root_dir,
+            env={**os.environ, "ZUORA_VCS_DIR": str(vcs_dir)},
+        )
+
+        child_results = []
+        if report_file.exists():
+            with open(report_file) as fs:
+                child_results = json.load(fs)
+
+    results = []
+    for i, (name, _) in enumerate(requests):
+        if i < len(child_results):
+            results.append({**child_results[i], "name": name})
+        else:
+            results.append(
+                {
+                    "name": name,
+                    "status": "failed",
+                    "steps": [],
+                    "error": f"Batch process exited with code {process.returncode}",
+                }
+            )
+    return results
+
+
+def run_batch(requests: List[BatchRequest], max_workers: int = 1) -> List[dict]:
+    """
+    Runs request forms and returns one result per request form, in order.
+
+    Request forms against the current ``ZUORA_VCS_DIR`` run in this process
+    when ``max_workers`` is 1. Otherwise request forms are grouped by
+    ``zuora-vcs`` directory, since the steps write to it, and up to
+    ``max_workers`` groups run concurrently in child processes.
+    """
+    groups = group_by_vcs_dir(requests)
+    if max_workers <= 1 and list(groups) in ([], [ZUORA_VCS_DIR.resolve()]):
+        return [run_request_form(name, request_form) for name, request_form in requests]
+
+    max_workers = max(1, min(max_workers, len(groups)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run_group_in_subprocess, vcs_dir, group)
+            for vcs_dir, group in groups.items()
+        ]
+        results_by_name = {}
+        for future in futures:
+            for result in future.result():
+                results_by_name[result["name"]] = result
+
+    return [results_by_name[name] for name, _ in requests]
+
+
+def get_exit_code(results: List[dict]) -> int:
+    if all(result["status"] == "success" for result in results):
+        return EXIT_SUCCESS
+    return EXIT_FAILURE
+
+
+def write_report(results: List[dict], report_file: Path):
+    with open(report_file, "w") as fs:
+        json.dump(results, fs, indent=4)
@@ -1,4 +1,6 @@
 import json
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
 from common.app.zuora.api import ZuoraAPI
@@ -7,8 +9,33 @@ from common.util.billing_doc.util import BillingDocumentTemplateUtil
 
 VALID_ENVIRONMENTS = ("dev", "qa", "uat", "prod")
 
+TEMPLATE_DEPLOY_MAX_WORKERS = 4
 
-def deploy_all_billing_document_templates(environment: str):
+
+def deploy_billing_document_template(
+    zuora_api: ZuoraAPI, url: str, template_name: str, payload: dict
+) -> bool:
+    response = zuora_api.put(path=url, payload=payload)
+    if response.status_code == 200:
+        logger.info(f"Successfully deployed template {template_name}")
+        return True
+
+    logger.error(f"❌ Could not update billing document {url}")
+    logger.error(response.text)
+    return False
+
+
+def deploy_all_billing_document_templates(
+    environment: str,
+    max_workers: int = TEMPLATE_DEPLOY_MAX_WORKERS,
+) -> List[str]:
+    """
+    PUTs the planned ``*_form_new.json`` payloads to the matching templates of
+    the target environment. The current target templates are fetched
+    concurrently, and a template is only PUT when the normalized hash of its
+    payload differs from the deployed one. PUTs run in a pool of
+    ``max_workers`` threads. Returns the names of the templates that failed.
+    """
     logger.info(
         f"Deploying all billing document templates to Zuora {environment.upper()}"
     )
@@ -17,10 +44,9 @@ def deploy_all_billing_document_templates(environment: str):
     )
 
     logger.info(f"Zuora environment: {environment}")
-    zuora_api = ZuoraAPI(environment)
-
     payloads_dir = ZUORA_VCS_DIR.joinpath("temp", "billing_documents")
     templates_deployed = []
+    deployments = []
     for document_type, documents in billing_documents.items():
         for document in documents:
             id = document["id"]
@@ -38,16 +64,52 @@ def deploy_all_billing_document_templates(environment: str):
             with open(payload_file) as fs:
                 payload = json.load(fs)
 
-            response = zuora_api.put(path=url, payload=payload)
-            if response.status_code == 200:
-                logger.info(f"Successfully deployed template {template_name}")
-            else:
-                logger.error(f"❌ Could not update billing document {url}")
-                logger.error(response.text)
+            deployments.append((url, template_name, payload))
 
-            templates_deployed.append(template_name)
+    max_workers = max(1, min(max_workers, len(deployments) or 1))
+    failed = []
+    with ZuoraAPI(environment) as zuora_api:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            target_templates = executor.map(
+                lambda deployment: BillingDocumentTemplateUtil.get_template(
+                    zuora_api, deployment[0]
+                ),
+                deployments,
+            )
 
-    eligible_files = list(payloads_dir.glob("*.json"))
+            changed = []
+            for deployment, target_template in zip(deployments, target_templates):
+                url, template_name, payload = deployment
+                templates_deployed.append(template_name)
+                if target_template is not None:
+                    payload_hash = BillingDocumentTemplateUtil.get_payload_hash(
+                        payload, payload.keys()
+                    )
+                    target_hash = BillingDocumentTemplateUtil.get_payload_hash(
+                        target_template, payload.keys()
+                    )
+                    if payload_hash == target_hash:
+                        logger.info(f"Template {template_name} is up to date")
+                        continue
+
+                changed.append(deployment)
+
+            logger.info(f"Deploying {len(changed)} changed billing document templates")
+            deployed = executor.map(
+                lambda deployment: deploy_billing_document_template(
+                    zuora_api, *deployment
+                ),
+                changed,
+            )
+            for deployment, is_deployed in zip(changed, deployed):
+                if not is_deployed:
+                    failed.append(deployment[1])
+
+    if failed:
+        logger.info("❌ Some billing document templates failed to deploy")
+        logger.info(failed)
+
+    eligible_files = list(payloads_dir.glob("*_form_new.json"))
     eligible_template_names = [
         filepath.stem.replace("_form_new", "") for filepath in eligible_files
     ]
@@ -82,5 +144,7 @@ def deploy_all_billing_document_templates(environment: str):
         #     "templateFormat": "WORD",
         #     "templateCategory": "New"
         # }
-    else:
+    elif not failed:
         logger.info("✅ Successfully deployed all billing document templates")
+
+    return failed
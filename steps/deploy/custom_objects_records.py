@@ -1,6 +1,193 @@
+import json
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from common.lib.logger import logger
+from common.config.config import ZUORA_VCS_DIR
+from common.app.zuora.api import ZuoraAPI
+from common.util.custom_objects_records import CustomObjectRecordsUtil
 
+BATCH_URL = "objects/batch/default"
 
-def deploy_all_custom_object_records_diff(target_env: str):
-    # TODO: Placeholder for deployment steps (add, update, delete) for custom object records
-    logger.info("❌❌❌ deploy_all_custom_object_records_diff not implemented")
+# Maximum number of records accepted by a single custom object batch action
+BATCH_RECORDS_LIMIT = 1000
+BATCH_MAX_WORKERS = 4
+
+SEQUENCESET_PLACEHOLDER = "To be generated on DEPLOY step"
+
+BatchAction = Tuple[str, str, list]
+
+
+def get_create_records(records: List[dict]) -> Tuple[List[dict], List[dict]]:
+    create_records = []
+    skipped = []
+    for record in records:
+        if record.get("LookupValue1__c") == SEQUENCESET_PLACEHOLDER:
+            skipped.append(
+                {
+                    "record": record,
+                    "error": "SEQUENCESET value has to be generated manually",
+                }
+            )
+            continue
+        create_records.append(record)
+    return create_records, skipped
+
+
+def get_update_records(records: List[dict]) -> List[Tuple[str, dict]]:
+    update_records = []
+    for record in records:
+        fields = {
+            key: value
+            for key, value in record.items()
+            if key != "Id" and not key.startswith("__")
+        }
+        update_records.append((record["Id"], fields))
+    return update_records
+
+
+def get_batch_actions(object_type: str, object_diff: dict) -> List[BatchAction]:
+    """
+    Splits the add/edit/delete sets of one custom object into batch actions of
+    at most ``BATCH_RECORDS_LIMIT`` records each.
+    """
+    create_records, _ = get_create_records(object_diff.get("add", []))
+    update_records = get_update_records(object_diff.get("edit", []))
+    delete_ids = [record["Id"] for record in object_diff.get("delete", [])]
+
+    batch_actions: List[BatchAction] = []
+    for action_type, records in (
+        ("create", create_records),
+        ("update", update_records),
+        ("delete", delete_ids),
+    ):
+        chunks = CustomObjectRecordsUtil.chunk_records(records, BATCH_RECORDS_LIMIT)
+        for chunk in chunks:
+            batch_actions.append((object_type, action_type, chunk))
+
+    return batch_actions
+
+
+def get_batch_payload(object_type: str, action_type: str, chunk: list) -> dict:
+    action = {"type": action_type, "object": object_type}
+    if action_type == "create":
+        action["records"] = chunk
+        action["allOrNone"] = False
+    elif action_type == "update":
+        action["records"] = {record_id: fields for record_id, fields in chunk}
+    elif action_type == "delete":
+        action["ids"] = chunk
+    else:
+        raise ValueError(f"Not a valid batch action type - {action_type}")
+
+    return {"action": action}
+
+
+def get_chunk_record_refs(action_type: str, chunk: list) -> list:
+    if action_type == "update":
+        return [record_id for record_id, _ in chunk]
+    return chunk
+
+
+def deploy_batch_action(zuora_api: ZuoraAPI, batch_action: BatchAction) -> dict:
+    object_type, action_type, chunk = batch_action
+    logger.info(f"Deploying {action_type} of {len(chunk)} {object_type} records")
+
+    payload = get_batch_payload(object_type, action_type, chunk)
+    try:
+        response = zuora_api.post(path=BATCH_URL, payload=json.dumps(payload))
+    except Exception as e:
+        error = str(e)
+    else:
+        if response.status_code == 200:
+            response_json: dict = response.json() if response.text else {}
+            unprocessed = list(response_json.get("unprocessedRecords") or [])
+            unprocessed.extend(response_json.get("unprocessedIds") or [])
+            return {
+                "succeeded": len(chunk) - len(unprocessed),
+                "failed": [
+                    {"record": record, "error": response_json.get("error")}
+                    for record in unprocessed
+                ],
+            }
+        error = response.text
+
+    logger.error(f"❌ Failed to {action_type} {object_type} records")
+    logger.error(error)
+    return {
+        "succeeded": 0,
+        "failed": [
+            {"record": record, "error": error}
+            for record in get_chunk_record_refs(action_type, chunk)
+        ],
+    }
+
+
+def deploy_all_custom_object_records_diff(
+    target_env: str,
+    max_workers: int = BATCH_MAX_WORKERS,
+) -> Dict[str, dict]:
+    """
+    Deploys ``temp/custom_object_records/diff.json`` through the custom object
+    batch API. Records are sent in chunks of ``BATCH_RECORDS_LIMIT``, and the
+    chunks run concurrently in a pool of ``max_workers`` threads.
+    Per-record failures are written to ``deploy_result.json`` next to the diff.
+    """
+    logger.info(f"Deploying custom object records to Zuora {target_env.upper()}")
+    diff_dir = ZUORA_VCS_DIR.joinpath("temp/custom_object_records")
+    diff_file = diff_dir.joinpath("diff.json")
+    if not diff_file.exists():
+        logger.info(f"❌ Cannot deploy custom object records: {diff_file} not found")
+        return {}
+
+    with open(diff_file) as fs:
+        diff: Dict[str, dict] = json.load(fs)
+
+    results: Dict[str, dict] = {}
+    batch_actions: List[BatchAction] = []
+    for object_type, object_diff in diff.items():
+        results[object_type] = {}
+        for action_type in ("create", "update", "delete"):
+            results[object_type][action_type] = {"succeeded": 0, "failed": []}
+
+        _, skipped = get_create_records(object_diff.get("add", []))
+        results[object_type]["create"]["failed"].extend(skipped)
+        batch_actions.extend(get_batch_actions(object_type, object_diff))
+
+    if batch_actions:
+        max_workers = max(1, min(max_workers, len(batch_actions)))
+        logger.info(
+            f"Running {len(batch_actions)} batch actions with {max_workers} workers"
+        )
+        with ZuoraAPI(target_env) as zuora_api:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(deploy_batch_action, zuora_api, action): action
+                    for action in batch_actions
+                }
+                for future in as_completed(futures):
+                    object_type, action_type, _ = futures[future]
+                    chunk_result = future.result()
+                    action_result = results[object_type][action_type]
+                    action_result["succeeded"] += chunk_result["succeeded"]
+                    action_result["failed"].extend(chunk_result["failed"])
+
+    failed_count = 0
+    for object_type, object_results in results.items():
+        for action_type, action_result in object_results.items():
+            failed_count += len(action_result["failed"])
+            logger.info(
+                f"{object_type} {action_type}: {action_result['succeeded']} succeeded, "
+                f"{len(action_result['failed'])} failed"
+            )
+
+    result_file = diff_dir.joinpath("deploy_result.json")
+    with open(result_file, "w") as fs:
+        json.dump(results, fs, indent=4)
+
+    if failed_count:
+        logger.info(f"❌ {failed_count} custom object records failed to deploy")
+        logger.info(f"See {result_file.as_posix()}")
+    else:
+        logger.info("✅ Successfully deployed all custom object records")
+
+    return results
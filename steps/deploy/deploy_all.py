@@ -1,5 +1,7 @@
+import threading
 from common.lib.logger import logger
-from steps.deploy.workflow import deploy_all_workflows
+from common.lib.cancellation import is_cancelled
+from steps.deploy.workflow import deploy_all_workflows, WORKFLOW_DEPLOY_MAX_WORKERS
 from steps.deploy.billing_doc import deploy_all_billing_document_templates
 from steps.deploy.custom_objects_records import deploy_all_custom_object_records_diff
 from steps.deploy.custom_fields import deploy_all_custom_fields_diff
@@ -8,7 +10,7 @@ from steps.deploy.custom_objects_definition import (
 )
 
 
-def deploy_all(request_form: dict):
+def deploy_all(request_form: dict, cancel_event: threading.Event = None):
     """
     Given deployment parameters in ``input-plan-deploy.json``. \n
     Uses deployment ready JSONs that were prepared by plan to: \n
@@ -17,6 +19,8 @@ def deploy_all(request_form: dict):
     - Deploy Custom object definitions  \n
     - Deploy Custom object records      \n
     - Deploy Custom fields              \n
+    Setting ``cancel_event`` stops before the next component.
+    Returns ``"failed"`` when some records or templates failed to deploy.
     """
     logger.info("🟣 Running deployment step")
     logger.info(f"Request form: {request_form}")
@@ -24,6 +28,10 @@ def deploy_all(request_form: dict):
     target_env: str = request_form["target_env"]
 
     logger.info(f"Target environment is: {target_env.upper()}")
+    failed = []
+
+    if is_cancelled(cancel_event, "Deployment step"):
+        return "cancelled"
 
     # Custom fields for standard objects
     include_custom_fields = request_form.get("include_custom_fields", False)
@@ -32,6 +40,9 @@ def deploy_all(request_form: dict):
     else:
         logger.info("Skipping Custom Fields deployment")
 
+    if is_cancelled(cancel_event, "Deployment step"):
+        return "cancelled"
+
     # Custom object definitions
     include_custom_object_definitions = request_form.get(
         "include_custom_object_definitions", False
@@ -41,30 +52,54 @@ def deploy_all(request_form: dict):
     else:
         logger.info("Skipping Custom Object Definitions deployment")
 
+    if is_cancelled(cancel_event, "Deployment step"):
+        return "cancelled"
+
     # Custom object records
     include_custom_object_records = request_form.get(
         "include_custom_object_records", False
     )
     if include_custom_object_records:
-        deploy_all_custom_object_records_diff(target_env)
+        results = deploy_all_custom_object_records_diff(target_env)
+        if any(
+            action_result["failed"]
+            for object_results in results.values()
+            for action_result in object_results.values()
+        ):
+            failed.append("custom object records")
     else:
         logger.info("Skipping Custom Object Records deployment")
 
+    if is_cancelled(cancel_event, "Deployment step"):
+        return "cancelled"
+
     # Billing document templates (Out of the box HTML templates)
     include_html_templates = request_form.get("include_html_templates", False)
     if include_html_templates:
-        deploy_all_billing_document_templates(environment=target_env)
+        if deploy_all_billing_document_templates(environment=target_env):
+            failed.append("billing document templates")
     else:
         logger.info("Skipping Billing Document Templates deployment")
 
+    if is_cancelled(cancel_event, "Deployment step"):
+        return "cancelled"
+
     # Workflows
     workflow_names = request_form.get("workflows", [])
     if workflow_names:
         deploy_all_workflows(
             environment=target_env,
             workflow_names=workflow_names,
+            max_workers=request_form.get(
+                "workflow_deploy_workers", WORKFLOW_DEPLOY_MAX_WORKERS
+            ),
         )
     else:
         logger.info("Skipping Workflows deployment")
 
+    if failed:
+        logger.info(f"❌ Deployment step failed for: {', '.join(failed)}")
+        return "failed"
+
     logger.info("🟢🟢🟢 Deployment step completed 🟢🟢🟢")
+    return "success"
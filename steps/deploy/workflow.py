@@ -1,5 +1,10 @@
+import os
 import json
-from typing import List
+import time
+import requests
+from pathlib import Path
+from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
 from common.app.zuora.api import ZuoraAPI
@@ -8,20 +13,69 @@ from common.util.workflow.util import ZuoraWorkflowUtil
 
 VALID_ENVIRONMENTS = ("dev", "qa", "uat", "prod")
 
+WORKFLOW_DEPLOY_MAX_WORKERS = int(os.getenv("ZUORA_WORKFLOW_DEPLOY_MAX_WORKERS", 1))
 
-def deploy_all_workflows(environment: str, workflow_names: List[str]):
+
+def deploy_all_workflows(
+    environment: str,
+    workflow_names: List[str],
+    max_workers: int = WORKFLOW_DEPLOY_MAX_WORKERS,
+) -> List[dict]:
+    """
+    Imports the planned workflows in a pool of ``max_workers`` threads.
+    Results per workflow are written to ``temp/workflows/deploy_result.json``.
+
+    Raises:
+        Exception: At least one workflow failed to deploy
+    """
     logger.info(f"Deploying all workflows to Zuora {environment.upper()}")
-    for workflow_name in workflow_names:
-        deploy_workflow(
-            environment=environment,
-            workflow_name=workflow_name,
+
+    max_workers = max(1, min(max_workers, len(workflow_names)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda workflow_name: deploy_workflow(
+                    environment=environment,
+                    workflow_name=workflow_name,
+                ),
+                workflow_names,
+            )
+        )
+
+    result_dir = ZUORA_VCS_DIR.joinpath("temp", "workflows")
+    result_dir.mkdir(parents=True, exist_ok=True)
+    result_file = result_dir.joinpath("deploy_result.json")
+    with open(result_file, "w") as fs:
+        json.dump(results, fs, indent=4)
+
+    for result in results:
+        logger.info(
+            f"{result['workflow']}: {result['status']} "
+            f"v{result['version']} in {result['seconds']:.1f}s"
         )
+
+    failed = [result["workflow"] for result in results if result["status"] == "failed"]
+    if failed:
+        logger.info(f"❌ {len(failed)} workflows failed to deploy")
+        logger.info(f"See {result_file.as_posix()}")
+        raise Exception(f"FAILED to deploy workflows: {', '.join(failed)}")
+
     logger.info("✅ Successfully deployed all workflows")
+    return results
 
 
-def deploy_workflow(environment: str, workflow_name: str):
+def deploy_workflow(environment: str, workflow_name: str) -> dict:
     logger.info(f"Deploying workflow to Zuora {environment.upper()}")
     logger.info(f"Workflow: {workflow_name}")
+    result = {
+        "workflow": workflow_name,
+        "status": "success",
+        "version": None,
+        "seconds": 0.0,
+        "error": None,
+    }
+    start = time.perf_counter()
+
     workflow_deploy_content_file = ZUORA_VCS_DIR.joinpath(
         "temp", "workflows", f"{workflow_name}-output-to-zuora.json"
     )
@@ -29,16 +83,46 @@ def deploy_workflow(environment: str, workflow_name: str):
         logger.info(
             f"❌ Cannot deploy {workflow_name} since {workflow_deploy_content_file} does not exist."
         )
-        return
+        result["status"] = "skipped"
+        result["error"] = f"{workflow_deploy_content_file.as_posix()} does not exist"
+        return result
+
+    try:
+        response, result["version"] = import_workflow_version(
+            environment, workflow_name, workflow_deploy_content_file
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to deploy {workflow_name}")
+        logger.error(e)
+        result["status"] = "failed"
+        result["error"] = str(e)
+    else:
+        if response.status_code == 200:
+            logger.info(
+                f"✅ Successfully deployed {workflow_name} v{result['version']}"
+            )
+            # The new version has to show up in the next version lookups
+            ZuoraWorkflowUtil.invalidate_workflow_catalogue(environment)
+        else:
+            logger.error(f"❌ Failed to deploy {workflow_name} v{result['version']}")
+            logger.error(response.text)
+            result["status"] = "failed"
+            result["error"] = response.text
+
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
 
-    zuora_api = ZuoraAPI(environment)
 
+def import_workflow_version(
+    environment: str,
+    workflow_name: str,
+    workflow_deploy_content_file: Path,
+) -> Tuple[requests.Response, str]:
     # Get workflow id and new version tag on target environment by workflow name
     workflow_id, new_version = ZuoraWorkflowUtil.get_target_workflow_id_and_version(
         environment=environment,
         workflow_name=workflow_name,
     )
-
     url = f"workflows/{workflow_id}/versions/import?version={new_version}"
 
     # TODO: when it is a new workflow, we will not be able to get workflow_id in target environment...
@@ -49,9 +133,5 @@ def deploy_workflow(environment: str, workflow_name: str):
 
     payload = json.dumps(workflow_content)
 
-    response = zuora_api.post(path=url, payload=payload)
-    if response.status_code == 200:
-        logger.info(f"✅ Successfully deployed {workflow_name} v{new_version}")
-    else:
-        logger.error(f"❌ Failed to deploy {workflow_name} v{new_version}")
-        logger.error(response.text)
+    with ZuoraAPI(environment) as zuora_api:
+        return zuora_api.post(path=url, payload=payload), new_version
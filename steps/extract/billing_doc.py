@@ -11,7 +11,31 @@ BILLING_DOCUMENT_TYPES = [
 ]
 
 
-def export_all_billing_document_templates(environment: str):
+def export_billing_document_template(
+    zuora_api: ZuoraAPI, document_type: str, document: dict
+) -> bool:
+    id = document["id"]
+    template_name = document["name"]
+
+    url = f"settings/{document_type}-templates/{id}"
+    response = zuora_api.get(path=url)
+
+    if response.status_code == 200:
+        BillingDocumentTemplateParser.extract_json_from_api_response(response)
+        BillingDocumentTemplateParser.extract_source_code(template_name)
+        return True
+
+    logger.error(f"❌ Could not export billing document {url}")
+    logger.error(response.text)
+    return False
+
+
+def export_all_billing_document_templates(environment: str, force: bool = False):
+    """
+    Exports HTML billing document templates into ``billing_documents/``.
+    Templates whose id and ``updatedOn`` match the local manifest, and whose
+    files are untouched on disk, are skipped unless ``force`` is set.
+    """
     logger.info("Exporting all billing document templates")
     logger.info("Input validation")
     validate_environment(environment)
@@ -20,21 +44,28 @@ def export_all_billing_document_templates(environment: str):
         environment
     )
 
-    logger.info(f"Zuora environment: {environment}")
-    zuora_api = ZuoraAPI(environment)
-
-    for document_type, documents in billing_documents.items():
-        for document in documents:
-            id = document["id"]
-            template_name = document["name"]
+    manifest = BillingDocumentTemplateParser.read_manifest()
 
-            url = f"settings/{document_type}-templates/{id}"
-            response = zuora_api.get(path=url)
-
-            if response.status_code == 200:
-                BillingDocumentTemplateParser.extract_json_from_api_response(response)
-                BillingDocumentTemplateParser.extract_source_code(template_name)
+    logger.info(f"Zuora environment: {environment}")
+    try:
+        with ZuoraAPI(environment) as zuora_api:
+            for document_type, documents in billing_documents.items():
+                for document in documents:
+                    template_name = document["name"]
+                    is_unchanged = BillingDocumentTemplateParser.is_template_unchanged(
+                        manifest, document, environment
+                    )
+                    if is_unchanged and not force:
+                        logger.info(f"Template {template_name} unchanged, skipping")
+                        continue
 
-            else:
-                logger.error(f"❌ Could not export billing document {url}")
-                logger.error(response.text)
+                    if export_billing_document_template(
+                        zuora_api, document_type, document
+                    ):
+                        manifest[template_name] = (
+                            BillingDocumentTemplateParser.get_manifest_entry(
+                                document, environment
+                            )
+                        )
+    finally:
+        BillingDocumentTemplateParser.dump_manifest(manifest)
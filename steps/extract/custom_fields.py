@@ -1,42 +1,109 @@
+import asyncio
 from common.lib.logger import logger
 from common.app.zuora.api import ZuoraAPI
 from common.util.custom_fields.util import CustomFieldsUtil, ZUORA_OBJECTS
 
+DEFINITIONS_URL = "objects/definitions/com_zuora"
+
+
+def list_standard_object_definitions(zuora_api: ZuoraAPI) -> dict:
+    logger.info(f"Get request to {DEFINITIONS_URL}")
+    response = zuora_api.get(DEFINITIONS_URL)
+
+    if response.status_code != 200:
+        logger.info("🟡 Unable to list standard object definitions")
+        logger.info(response.text)
+        return {}
+
+    return response.json().get("definitions", {})
+
+
+def get_standard_object_definition(zuora_api: ZuoraAPI, object_name: str) -> dict:
+    definition_url = f"{DEFINITIONS_URL}/{object_name}"
+    logger.info(f"Get request to {definition_url}")
+    response = zuora_api.get(definition_url)
+
+    if response.status_code != 200:
+        raise Exception(f"Unable to retrieve object definition. {response.text}")
+
+    return response.json()
+
+
+def extract_custom_fields(
+    environment: str, list_all: bool = True, use_async: bool = False
+) -> dict:
+    """
+    Extracts custom fields of ``ZUORA_OBJECTS``. With ``list_all`` the definitions
+    of all standard objects are fetched in a single request, and objects that
+    are missing from that response fall back to one request per object.
+    With ``use_async`` the fallback requests run concurrently.
+    """
+    if use_async:
+        return asyncio.run(extract_custom_fields_async(environment))
 
-def extract_custom_fields(environment: str) -> dict:
     logger.info(
-        f"🟡 Extracting custom object records from Zuora environment {environment.upper()}"
+        f"🟡 Extracting custom fields from Zuora environment {environment.upper()}"
     )
 
-    zuora_api = ZuoraAPI(environment)
-
     all_custom_fields = {}
-    for object_name in ZUORA_OBJECTS:
-        definition_url = f"objects/definitions/com_zuora/{object_name}"
-        logger.info(f"Get request to {definition_url}")
-        response = zuora_api.get(definition_url)
-        response_json = response.json()
-
-        if response.status_code != 200:
-            raise Exception(f"Unable to retrieve object definition. {response.text}")
-
-        schema: dict = response_json.get("schema", {})
-        properties: dict[str, dict] = response_json["schema"]["properties"]
-        custom_fields = {
-            field_name: field_definition
-            for field_name, field_definition in properties.items()
-            if field_definition.get("origin") == "custom"
-        }
-
-        all_custom_fields[object_name] = {
-            "custom_fields": custom_fields,
-            "read_only": schema.get("readonlyOnUI", []),
-            "filterable": schema.get("filterable", []),
-        }
+    with ZuoraAPI(environment) as zuora_api:
+        definitions = {}
+        if list_all:
+            definitions = list_standard_object_definitions(zuora_api)
+
+        for object_name in ZUORA_OBJECTS:
+            definition = definitions.get(object_name)
+            if not definition:
+                definition = get_standard_object_definition(zuora_api, object_name)
+
+            all_custom_fields[object_name] = (
+                CustomFieldsUtil.get_custom_fields_from_definition(definition)
+            )
 
     return all_custom_fields
 
 
+async def extract_custom_fields_async(environment: str) -> dict:
+    """Async variant of ``extract_custom_fields`` with concurrent fallback calls"""
+    from common.app.zuora.async_api import AsyncZuoraAPI
+
+    logger.info(
+        f"🟡 Extracting custom fields from Zuora environment {environment.upper()}"
+    )
+
+    async with AsyncZuoraAPI(environment) as zuora_api:
+        logger.info(f"Get request to {DEFINITIONS_URL}")
+        response = await zuora_api.get(DEFINITIONS_URL)
+        definitions = {}
+        if response.status_code == 200:
+            definitions = response.json().get("definitions", {})
+        else:
+            logger.info("🟡 Unable to list standard object definitions")
+            logger.info(response.text)
+
+        async def get_definition(object_name: str) -> dict:
+            if definitions.get(object_name):
+                return definitions[object_name]
+
+            definition_url = f"{DEFINITIONS_URL}/{object_name}"
+            logger.info(f"Get request to {definition_url}")
+            response = await zuora_api.get(definition_url)
+            if response.status_code != 200:
+                raise Exception(
+                    f"Unable to retrieve object definition. {response.text}"
+                )
+            return response.json()
+
+        object_definitions = await asyncio.gather(
+            *(get_definition(object_name) for object_name in ZUORA_OBJECTS)
+        )
+
+    return {
+        object_name: CustomFieldsUtil.get_custom_fields_from_definition(definition)
+        for object_name, definition in zip(ZUORA_OBJECTS, object_definitions)
+    }
+
+
 def extract_custom_fields_to_file(environment: str):
     custom_fields = extract_custom_fields(environment=environment)
 
@@ -1,6 +1,6 @@
-import copy
-from typing import List
-from common.app.zuora.api import ZuoraAPI
+import asyncio
+from typing import Iterator, List
+from common.app.zuora.api import ZuoraAPI, ZuoraAPIResponseError
 from common.lib.logger import logger
 from common.util.custom_objects_records import CustomObjectRecordsUtil
 
@@ -14,34 +14,103 @@ KEYS_TO_REMOVE = [
 ]
 
 
+def iter_custom_object_records(
+    zuora_api: ZuoraAPI,
+    custom_object_name: str,
+    remove_keys: bool = False,
+    page_size: int = None,
+) -> Iterator[dict]:
+    records_url = f"objects/records/default/{custom_object_name}"
+    logger.info(f"Get request to {records_url}")
+
+    records = zuora_api.get_paginated_records(records_url, page_size=page_size)
+    for record in records:
+        if remove_keys:
+            CustomObjectRecordsUtil.remove_keys_from_dict(record, KEYS_TO_REMOVE)
+        yield record
+
+
 def extract_custom_object_records(
     environment: str,
     custom_object_names: List[str],
     remove_keys: bool = False,
+    page_size: int = None,
+    use_async: bool = False,
 ) -> dict:
+    if use_async:
+        return asyncio.run(
+            extract_custom_object_records_async(
+                environment, custom_object_names, remove_keys, page_size
+            )
+        )
+
     logger.info(
         f"🟡 Extracting custom object records from Zuora environment {environment.upper()}"
     )
 
-    zuora_api = ZuoraAPI(environment)
-
     custom_object_records = {}
-    for custom_object_name in custom_object_names:
-        records_url = f"objects/records/default/{custom_object_name}"
-        logger.info(f"Get request to {records_url}")
-        response = zuora_api.get(records_url)
-        if response.status_code == 200:
-            response_json = response.json()
-            records: List[dict] = response_json["records"]
-
-            copied_records = copy.deepcopy(records)
-            if remove_keys:
-                for record in copied_records:
+    with ZuoraAPI(environment) as zuora_api:
+        for custom_object_name in custom_object_names:
+            records = iter_custom_object_records(
+                zuora_api=zuora_api,
+                custom_object_name=custom_object_name,
+                remove_keys=remove_keys,
+                page_size=page_size,
+            )
+
+            try:
+                custom_object_records[custom_object_name] = list(records)
+            except ZuoraAPIResponseError as e:
+                logger.error(f"❌ Failed to extract records for {custom_object_name}")
+                logger.error(e)
+
+    return custom_object_records
+
+
+async def extract_custom_object_records_async(
+    environment: str,
+    custom_object_names: List[str],
+    remove_keys: bool = False,
+    page_size: int = None,
+) -> dict:
+    """Async variant of ``extract_custom_object_records``, objects run concurrently"""
+    from common.app.zuora.async_api import AsyncZuoraAPI
+
+    logger.info(
+        f"🟡 Extracting custom object records from Zuora environment {environment.upper()}"
+    )
+
+    async with AsyncZuoraAPI(environment) as zuora_api:
+
+        async def get_records(custom_object_name: str) -> List[dict]:
+            records_url = f"objects/records/default/{custom_object_name}"
+            logger.info(f"Get request to {records_url}")
+
+            records = []
+            pages = zuora_api.get_paginated_records(records_url, page_size=page_size)
+            async for record in pages:
+                if remove_keys:
                     CustomObjectRecordsUtil.remove_keys_from_dict(
                         record, KEYS_TO_REMOVE
                     )
+                records.append(record)
+            return records
+
+        results = await asyncio.gather(
+            *(get_records(name) for name in custom_object_names),
+            return_exceptions=True,
+        )
+
+    custom_object_records = {}
+    for custom_object_name, result in zip(custom_object_names, results):
+        if isinstance(result, ZuoraAPIResponseError):
+            logger.error(f"❌ Failed to extract records for {custom_object_name}")
+            logger.error(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            custom_object_records[custom_object_name] = result
 
-            custom_object_records[custom_object_name] = copied_records
     return custom_object_records
 
 
@@ -49,11 +118,25 @@ def extract_custom_object_records_to_file(
     environment: str,
     custom_object_names: List[str],
     remove_keys: bool = False,
-) -> dict:
-    custom_object_records = extract_custom_object_records(
-        environment=environment,
-        custom_object_names=custom_object_names,
-        remove_keys=remove_keys,
+    page_size: int = None,
+):
+    logger.info(
+        f"🟡 Extracting custom object records from Zuora environment {environment.upper()}"
     )
-    for custom_object_name, records in custom_object_records.items():
-        CustomObjectRecordsUtil.dump_records_to_file(records, custom_object_name)
+
+    with ZuoraAPI(environment) as zuora_api:
+        for custom_object_name in custom_object_names:
+            records = iter_custom_object_records(
+                zuora_api=zuora_api,
+                custom_object_name=custom_object_name,
+                remove_keys=remove_keys,
+                page_size=page_size,
+            )
+
+            try:
+                CustomObjectRecordsUtil.dump_records_to_file(
+                    records, custom_object_name
+                )
+            except ZuoraAPIResponseError as e:
+                logger.error(f"❌ Failed to extract records for {custom_object_name}")
+                logger.error(e)
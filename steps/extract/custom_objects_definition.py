@@ -1,3 +1,4 @@
+import asyncio
 from common.lib.logger import logger
 from common.app.zuora.api import ZuoraAPI
 from common.util.custom_objects_definitions import CustomObjectsDefinitionUtil
@@ -15,18 +16,60 @@ KEYS_TO_REMOVE = [
 
 def extract_custom_objects_definitions(
     environment: str,
+    use_async: bool = False,
 ) -> dict:
+    if use_async:
+        return asyncio.run(extract_custom_objects_definitions_async(environment))
+
     logger.info(
         f"🟡 Extracting custom object definitions from Zuora environment {environment.upper()}"
     )
 
-    zuora_api = ZuoraAPI(environment)
+    custom_objects = {}
+    with ZuoraAPI(environment) as zuora_api:
+        for custom_object_name in CUSTOM_OBJECT_NAMES:
+            definition_url = f"objects/definitions/default/{custom_object_name}"
+            logger.info(f"Get request to {definition_url}")
+            response = zuora_api.get(definition_url)
+            if response.status_code == 200:
+                response_json = response.json()
+                CustomObjectsDefinitionUtil.remove_keys_from_dict(
+                    response_json, KEYS_TO_REMOVE
+                )
+
+                custom_objects[custom_object_name] = response_json
+            else:
+                logger.error(
+                    f"Failed to extract custom object definition for {custom_object_name}"
+                )
+                logger.error(response.text)
+
+    return custom_objects
+
+
+async def extract_custom_objects_definitions_async(
+    environment: str,
+) -> dict:
+    """Async variant of ``extract_custom_objects_definitions``"""
+    from common.app.zuora.async_api import AsyncZuoraAPI
+
+    logger.info(
+        f"🟡 Extracting custom object definitions from Zuora environment {environment.upper()}"
+    )
+
+    async with AsyncZuoraAPI(environment) as zuora_api:
+
+        async def get_definition(custom_object_name: str):
+            definition_url = f"objects/definitions/default/{custom_object_name}"
+            logger.info(f"Get request to {definition_url}")
+            return await zuora_api.get(definition_url)
+
+        responses = await asyncio.gather(
+            *(get_definition(name) for name in CUSTOM_OBJECT_NAMES)
+        )
 
     custom_objects = {}
-    for custom_object_name in CUSTOM_OBJECT_NAMES:
-        definition_url = f"objects/definitions/default/{custom_object_name}"
-        logger.info(f"Get request to {definition_url}")
-        response = zuora_api.get(definition_url)
+    for custom_object_name, response in zip(CUSTOM_OBJECT_NAMES, responses):
         if response.status_code == 200:
             response_json = response.json()
             CustomObjectsDefinitionUtil.remove_keys_from_dict(
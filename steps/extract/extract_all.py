@@ -1,6 +1,11 @@
+import threading
 from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from common.config import config
 from common.lib.logger import logger
+from common.lib.cancellation import is_cancelled
+from common.util.workflow.util import WORKFLOW_EXPORT_CACHE_ENABLED
 from steps.extract.workflow import extract_workflow_src_code
 from steps.extract.billing_doc import export_all_billing_document_templates
 from steps.extract.custom_fields import extract_custom_fields
@@ -9,22 +14,24 @@ from steps.extract.custom_object_records import extract_custom_object_records_to
 
 root_dir = Path(__file__).parent.parent.parent
 
+ExtractTask = Tuple[str, Callable, dict]
 
-def extract_all(request_form: dict):
-    logger.info("🟣 Running extraction step")
-    logger.info(f"Request form: {request_form}")
 
+def get_extract_tasks(request_form: dict) -> List[ExtractTask]:
     source_environment = request_form["source_environment"]
+    use_async = request_form.get("use_async", False)
+    tasks: List[ExtractTask] = []
 
     # Custom fields for standard objects
     include_custom_fields = request_form.get("include_custom_fields", False)
     if include_custom_fields:
-        try:
-            logger.info("Extracting custom fields")
-            extract_custom_fields(environment=source_environment)
-        except Exception as e:
-            logger.info("❌ FAILED to extract custom fields")
-            raise e
+        tasks.append(
+            (
+                "custom fields",
+                extract_custom_fields,
+                {"environment": source_environment, "use_async": use_async},
+            )
+        )
     else:
         logger.info("Skipping custom fields extraction")
 
@@ -33,13 +40,13 @@ def extract_all(request_form: dict):
         "include_custom_object_definitions", False
     )
     if include_custom_object_definitions:
-        logger.info("Extracting custom object definitions")
-        try:
-            extract_custom_objects_definitions(environment=source_environment)
-            logger.info("✅ Successfully extracted custom object definitions")
-        except Exception as e:
-            logger.info("❌ FAILED to extract custom object definitions")
-            logger.info(e)
+        tasks.append(
+            (
+                "custom object definitions",
+                extract_custom_objects_definitions,
+                {"environment": source_environment, "use_async": use_async},
+            )
+        )
     else:
         logger.info("Skipping custom object definitions extraction")
 
@@ -48,54 +55,139 @@ def extract_all(request_form: dict):
         "include_custom_object_records", False
     )
     if include_custom_object_records:
-        try:
-            logger.info("Extracting custom object records")
-            extract_custom_object_records_to_file(
-                environment=source_environment,
-                custom_object_names=config.CUSTOM_OBJECT_NAMES,
-                remove_keys=True,
+        tasks.append(
+            (
+                "custom object records",
+                extract_custom_object_records_to_file,
+                {
+                    "environment": source_environment,
+                    "custom_object_names": config.CUSTOM_OBJECT_NAMES,
+                    "remove_keys": True,
+                },
             )
-            logger.info("✅ Successfully extracted custom object records")
-        except Exception as e:
-            logger.info("❌ FAILED to extract custom object records")
-            logger.info(e)
+        )
     else:
         logger.info("Skipping custom object records extraction")
 
     # Billing document templates (Out of the box HTML templates)
     include_html_templates = request_form.get("include_html_templates", False)
     if include_html_templates:
-        try:
-            logger.info("Extracting billing document templates")
-            export_all_billing_document_templates(environment=source_environment)
-        except Exception as e:
-            logger.info("❌ FAILED to extract all billing document templates")
-            raise e
+        tasks.append(
+            (
+                "billing document templates",
+                export_all_billing_document_templates,
+                {"environment": source_environment},
+            )
+        )
     else:
         logger.info("Skipping billing document templates extraction")
 
     # Workflows
     workflows = request_form.get("workflows", [])
+    # refresh_workflow_exports downloads versions edited in place again
+    use_cache = WORKFLOW_EXPORT_CACHE_ENABLED and not request_form.get(
+        "refresh_workflow_exports", False
+    )
     if workflows:
         for workflow in workflows:
-            try:
-                logger.info(
-                    f"Extracting workflow source code for {workflow['name']} and {workflow['version']}"
-                )
-                extract_workflow_src_code(
-                    environment=source_environment,
-                    workflow_name=workflow["name"],
-                    workflow_version=workflow["version"],
+            tasks.append(
+                (
+                    f"workflow {workflow['name']} v{workflow['version']}",
+                    extract_workflow_src_code,
+                    {
+                        "environment": source_environment,
+                        "workflow_name": workflow["name"],
+                        "workflow_version": workflow["version"],
+                        "use_cache": use_cache,
+                    },
                 )
-                logger.info(
-                    f"✅ Successfully extracted workflow source code for {workflow['name']}"
-                )
-            except Exception as e:
-                logger.info(
-                    f"❌ FAILED to extract workflow source code for {workflow['name']}"
-                )
-                raise e
+            )
     else:
         logger.info("Skipping workflow source code extraction")
 
+    return tasks
+
+
+def run_extract_task(
+    name: str,
+    task: Callable,
+    kwargs: dict,
+    cancel_event: threading.Event = None,
+) -> Exception:
+    if is_cancelled(cancel_event, f"Extracting {name}"):
+        return None
+
+    try:
+        logger.info(f"Extracting {name}")
+        task(**kwargs)
+        logger.info(f"✅ Successfully extracted {name}")
+    except Exception as e:
+        logger.info(f"❌ FAILED to extract {name}")
+        logger.info(e)
+        return e
+
+
+def run_extract_tasks(
+    tasks: List[ExtractTask],
+    max_workers: int = 1,
+    cancel_event: threading.Event = None,
+) -> Dict[str, Exception]:
+    """
+    Runs extraction tasks one after another, or concurrently in a bounded thread
+    pool when ``max_workers`` is greater than 1. Components write to disjoint
+    folders, so they can safely run side by side.
+    Tasks not started yet are skipped once ``cancel_event`` is set.
+    Returns the errors raised by each failed task, keyed by task name.
+    """
+    errors: Dict[str, Exception] = {}
+
+    if max_workers <= 1 or len(tasks) <= 1:
+        for name, task, kwargs in tasks:
+            error = run_extract_task(name, task, kwargs, cancel_event)
+            if error:
+                errors[name] = error
+        return errors
+
+    max_workers = min(max_workers, len(tasks))
+    logger.info(f"Running {len(tasks)} extraction tasks with {max_workers} workers")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_extract_task, name, task, kwargs, cancel_event): name
+            for name, task, kwargs in tasks
+        }
+        for future in as_completed(futures):
+            error = future.result()
+            if error:
+                errors[futures[future]] = error
+
+    return errors
+
+
+def extract_all(request_form: dict, cancel_event: threading.Event = None):
+    """
+    Given extraction parameters in ``request_form``. \n
+    Extracts selected components from the source environment. \n
+    Set ``max_workers`` in the request form to extract components and workflows
+    concurrently. Failures are collected per component and reported at the end.
+    Setting ``cancel_event`` skips the components not started yet.
+    """
+    logger.info("🟣 Running extraction step")
+    logger.info(f"Request form: {request_form}")
+
+    tasks = get_extract_tasks(request_form)
+    max_workers = request_form.get("max_workers", 1)
+
+    errors = run_extract_tasks(
+        tasks, max_workers=max_workers, cancel_event=cancel_event
+    )
+    if errors:
+        logger.info("❌ Some components failed to extract")
+        for name, error in errors.items():
+            logger.info(f"❌ {name}: {error}")
+        raise Exception(f"FAILED to extract: {', '.join(errors.keys())}")
+
+    if is_cancelled(cancel_event, "Extracting step"):
+        return "cancelled"
+
     logger.info("🟢🟢🟢 Extracting step completed 🟢🟢🟢")
+    return "success"
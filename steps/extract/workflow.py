@@ -3,7 +3,7 @@ import shutil
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
 from common.app.zuora.validator import validate_environment
-from common.util.workflow.util import ZuoraWorkflowUtil
+from common.util.workflow.util import ZuoraWorkflowUtil, WORKFLOW_EXPORT_CACHE_ENABLED
 from common.util.workflow.task import WorkflowTaskUtil
 from common.util.workflow.linkage import WorkflowLinkageUtil
 from common.util.workflow.metadata import WorkflowMetadataUtil
@@ -17,6 +17,7 @@ def extract_workflow_src_code(
     workflow_name: str,
     workflow_version: str,
     temp: bool = False,
+    use_cache: bool = WORKFLOW_EXPORT_CACHE_ENABLED,
 ):
     logger.info("Input validation")
     validate_environment(environment)
@@ -37,6 +38,7 @@ def extract_workflow_src_code(
             environment=environment,
             workflow_id=workflow_id,
             workflow_version=workflow_version,
+            use_cache=use_cache,
         )
 
         if temp:
@@ -1,9 +1,47 @@
+import json
+from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
+from common.app.zuora.api import ZuoraAPI
+from common.util.billing_doc.util import BillingDocumentTemplateUtil
 from common.util.billing_doc.build_util import BillingDocumentTemplateBuilder
 
+TEMPLATE_PLAN_MAX_WORKERS = 4
 
-def generate_all_html_template_payloads(environment: str):
+
+def get_target_templates(environment: str, max_workers: int) -> Dict[str, dict]:
+    """Current content of every HTML template of the target, by template name"""
+    billing_documents = BillingDocumentTemplateUtil.list_all_billing_document_templates(
+        environment
+    )
+
+    urls = {}
+    for document_type, documents in billing_documents.items():
+        for document in documents:
+            url = f"settings/{document_type}-templates/{document['id']}"
+            urls.setdefault(document["name"], url)
+
+    max_workers = max(1, min(max_workers, len(urls) or 1))
+    with ZuoraAPI(environment) as zuora_api:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            templates = executor.map(
+                lambda url: BillingDocumentTemplateUtil.get_template(zuora_api, url),
+                urls.values(),
+            )
+            return dict(zip(urls.keys(), templates))
+
+
+def generate_all_html_template_payloads(
+    environment: str,
+    max_workers: int = TEMPLATE_PLAN_MAX_WORKERS,
+) -> Dict[str, List[str]]:
+    """
+    Rebuilds every template of ``billing_documents/`` and compares it with the
+    template deployed on the target environment. Payloads are only written for
+    templates that are new or differ, and the outcome per template is written
+    to ``temp/billing_documents/diff.json``.
+    """
     logger.info(
         f"Generating all HTML template payloads to upload to Zuora {environment.upper()}"
     )
@@ -16,17 +54,55 @@ def generate_all_html_template_payloads(environment: str):
     for file in request_form_files:
         template_names.append(file.stem.replace("_form", ""))
 
-    for template_name in template_names:
+    target_templates = get_target_templates(environment, max_workers)
+
+    diff = {"new": [], "changed": [], "unchanged": [], "failed": []}
+    for template_name in sorted(template_names):
         try:
             logger.info(f"Generating HTML template payload for {template_name}")
-            BillingDocumentTemplateBuilder.build_request_payload(
-                template_name, output_dir
-            )
-            logger.info(
-                f"✅ Successfully generated HTML template payload for {template_name}"
+            payload = BillingDocumentTemplateBuilder.build_request_payload(
+                template_name
             )
         except Exception as e:
             logger.error(
                 f"❌ FAILED to generate HTML template payload for {template_name}"
             )
             logger.error(f"❌ {e}")
+            diff["failed"].append(template_name)
+            continue
+
+        if template_name not in target_templates:
+            status = "new"
+        elif target_templates[template_name] is None:
+            # The deployed content could not be read, deploy to be safe
+            status = "changed"
+        else:
+            payload_hash = BillingDocumentTemplateUtil.get_payload_hash(
+                payload, payload.keys()
+            )
+            target_hash = BillingDocumentTemplateUtil.get_payload_hash(
+                target_templates[template_name], payload.keys()
+            )
+            status = "unchanged" if payload_hash == target_hash else "changed"
+
+        diff[status].append(template_name)
+        if status == "unchanged":
+            logger.info(f"Template {template_name} is up to date on the target")
+            continue
+
+        BillingDocumentTemplateBuilder.dump_request_payload(
+            template_name, payload, output_dir
+        )
+        logger.info(
+            f"✅ Successfully generated HTML template payload for {template_name}"
+        )
+
+    with open(output_dir.joinpath("diff.json"), "w") as fs:
+        json.dump(diff, fs, indent=4)
+
+    logger.info(
+        f"Billing document templates: {len(diff['new'])} new, "
+        f"{len(diff['changed'])} changed, {len(diff['unchanged'])} unchanged, "
+        f"{len(diff['failed'])} failed"
+    )
+    return diff
@@ -7,11 +7,12 @@ from common.util.custom_fields.util import CustomFieldsUtil
 
 def get_custom_fields_diff(
     target_env: str,
+    use_async: bool = False,
 ) -> dict:
     logger.info("Getting all custom objects records difference")
 
     source_objects = CustomFieldsUtil.read_custom_fields_definition()
-    target_objects = extract_custom_fields(environment=target_env)
+    target_objects = extract_custom_fields(environment=target_env, use_async=use_async)
 
     diff = CustomFieldsUtil.diff(
         source_objects=source_objects,
@@ -1,21 +1,57 @@
+import os
 import json
 import copy
-from typing import List, Dict
+import tempfile
+from pathlib import Path
+from itertools import groupby
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Dict
 from common.lib.logger import logger
+from common.lib.external_sort import sort_entries
+from common.app.zuora.api import ZuoraAPI, ZuoraAPIResponseError
 from common.config.config import ZUORA_VCS_DIR, CUSTOM_OBJECT_NAMES, CUSTOM_OBJECTS_MAP
 from common.util.custom_objects_records import CustomObjectRecordsUtil
-from steps.extract.custom_object_records import extract_custom_object_records
+from steps.extract.custom_object_records import (
+    extract_custom_object_records,
+    iter_custom_object_records,
+)
 
+# Memory budget of the sort-merge diff, 0 keeps both record sets in memory
+RECORDS_DIFF_MEMORY_BYTES = int(os.getenv("ZUORA_RECORDS_DIFF_MEMORY_BYTES", 0))
+RECORDS_DIFF_MAX_WORKERS = int(os.getenv("ZUORA_RECORDS_DIFF_MAX_WORKERS", 1))
+
+
+def get_custom_objects_records_diff(
+    target_env: str,
+    memory_bytes: int = RECORDS_DIFF_MEMORY_BYTES,
+    max_workers: int = RECORDS_DIFF_MAX_WORKERS,
+    use_async: bool = False,
+) -> dict:
+    """
+    Difference between the records in the Zuora-VCS repository and the records
+    of the target environment, for each object of ``CUSTOM_OBJECTS_MAP``. With a
+    ``memory_bytes`` budget the records are streamed through a sort-merge diff
+    instead of being loaded in memory. With ``max_workers`` above 1 the objects
+    are compared in parallel processes. The resulting diff is the same.
+    ``use_async`` extracts the target objects concurrently when they are
+    loaded in memory.
+    """
+    if max_workers > 1:
+        return get_custom_objects_records_diff_parallel(
+            target_env, memory_bytes, max_workers
+        )
+    if memory_bytes:
+        return get_custom_objects_records_diff_sorted(target_env, memory_bytes)
 
-def get_custom_objects_records_diff(target_env: str) -> dict:
     logger.info("Getting all custom objects records difference")
     diff = {}
 
-    source_records = CustomObjectRecordsUtil.read_custom_object_record()
+    source_records = CustomObjectRecordsUtil.read_custom_object_record(lazy=True)
     target_records = extract_custom_object_records(
         environment=target_env,
         custom_object_names=CUSTOM_OBJECT_NAMES,
         remove_keys=False,
+        use_async=use_async,
     )
     target_record_names = list(target_records.keys())
     for custom_object_type, criteria in CUSTOM_OBJECTS_MAP.items():
@@ -32,6 +68,131 @@ def get_custom_objects_records_diff(target_env: str) -> dict:
 
         diff[custom_object_type] = custom_object_diff
 
+    return dump_custom_objects_records_diff(diff)
+
+
+def get_custom_objects_records_diff_sorted(target_env: str, memory_bytes: int) -> dict:
+    logger.info(
+        f"Getting all custom objects records difference, memory budget {memory_bytes} bytes"
+    )
+    diff = {}
+
+    source_records = CustomObjectRecordsUtil.read_custom_object_record(lazy=True)
+    with ZuoraAPI(target_env) as zuora_api:
+        for custom_object_type, criteria in CUSTOM_OBJECTS_MAP.items():
+            if custom_object_type not in CUSTOM_OBJECT_NAMES:
+                continue
+
+            records_target_env = iter_custom_object_records(
+                zuora_api=zuora_api,
+                custom_object_name=custom_object_type,
+                remove_keys=False,
+            )
+            try:
+                diff[custom_object_type] = get_sorted_custom_object_records_diff(
+                    object_type=custom_object_type,
+                    criteria=criteria,
+                    records_source_env=source_records[custom_object_type],
+                    records_target_env=records_target_env,
+                    memory_bytes=memory_bytes,
+                )
+            except ZuoraAPIResponseError as e:
+                logger.error(f"❌ Failed to extract records for {custom_object_type}")
+                logger.error(e)
+
+    return dump_custom_objects_records_diff(diff)
+
+
+def get_custom_objects_records_diff_parallel(
+    target_env: str, memory_bytes: int, max_workers: int
+) -> dict:
+    """
+    Target records of each object are written to a temporary JSONL file while
+    they are fetched, then the object is compared in a worker process which reads
+    both record files itself. Only file paths are sent to the workers, and each
+    object is compared while the next one is fetched.
+    """
+    logger.info(
+        f"Getting all custom objects records difference with {max_workers} workers"
+    )
+    diff = {}
+
+    source_files = CustomObjectRecordsUtil.get_custom_object_record_files()
+    with tempfile.TemporaryDirectory(prefix="records-diff-") as temp_dir:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            with ZuoraAPI(target_env) as zuora_api:
+                for custom_object_type, criteria in CUSTOM_OBJECTS_MAP.items():
+                    if custom_object_type not in CUSTOM_OBJECT_NAMES:
+                        continue
+
+                    target_file = Path(temp_dir, f"{custom_object_type}.jsonl")
+                    records_target_env = iter_custom_object_records(
+                        zuora_api=zuora_api,
+                        custom_object_name=custom_object_type,
+                        remove_keys=False,
+                    )
+                    try:
+                        dump_records_to_jsonl(records_target_env, target_file)
+                    except ZuoraAPIResponseError as e:
+                        logger.error(
+                            f"❌ Failed to extract records for {custom_object_type}"
+                        )
+                        logger.error(e)
+                        continue
+
+                    futures[custom_object_type] = executor.submit(
+                        get_custom_object_records_files_diff,
+                        object_type=custom_object_type,
+                        criteria=criteria,
+                        source_file=source_files[custom_object_type],
+                        target_file=target_file,
+                        memory_bytes=memory_bytes,
+                    )
+
+            # Same key order as the serial diff
+            for custom_object_type, future in futures.items():
+                diff[custom_object_type] = future.result()
+
+    return dump_custom_objects_records_diff(diff)
+
+
+def get_custom_object_records_files_diff(
+    object_type: str,
+    criteria: dict,
+    source_file: Path,
+    target_file: Path,
+    memory_bytes: int,
+) -> dict:
+    """Worker process side of ``get_custom_objects_records_diff_parallel``"""
+    records_source_env = CustomObjectRecordsUtil.iter_records_from_file(source_file)
+    records_target_env = CustomObjectRecordsUtil.iter_records_from_file(target_file)
+    if memory_bytes:
+        return get_sorted_custom_object_records_diff(
+            object_type=object_type,
+            criteria=criteria,
+            records_source_env=records_source_env,
+            records_target_env=records_target_env,
+            memory_bytes=memory_bytes,
+        )
+
+    return get_single_custom_object_records_diff(
+        object_type=object_type,
+        criteria=criteria,
+        records_source_env=records_source_env,
+        records_target_env=list(records_target_env),
+    )
+
+
+def dump_records_to_jsonl(records: Iterable[dict], output_file: Path):
+    # Keys keep their order, deleted records are written to the diff as they are
+    with open(output_file, "w") as fs:
+        for record in records:
+            fs.write(json.dumps(record))
+            fs.write("\n")
+
+
+def dump_custom_objects_records_diff(diff: dict) -> dict:
     if not diff:
         return None
 
@@ -61,46 +222,25 @@ def get_single_custom_object_records_diff(
     edit_records = []
     delete_records = []
 
+    target_index = build_record_index(records_target_env, criteria)
+    source_keys = set()
+
     # Finding records to add or edit
     for record_source_env in records_source_env:
-        matching_record = find_match(records_target_env, record_source_env, criteria)
+        record_key = get_record_key(record_source_env, criteria)
+        source_keys.add(record_key)
+
+        matching_record = target_index.get(record_key)
         if matching_record:
-            # Special custom object conditions
-            if "LookupType__c" in record_source_env:
-                if record_source_env["LookupType__c"] == "SEQUENCESET":
-                    continue
-
-            temp = {}
-            for key, source_value in record_source_env.items():
-                if key in ("Id"):
-                    continue
-
-                if matching_record.get(key) != source_value:
-                    logger.info(f"Source and destination values do not match for {key}")
-                    logger.info(f"{matching_record.get(key)} =/= {source_value}")
-                    temp[key] = source_value
-                    temp["__" + key] = matching_record.get(key)
-                    temp["Id"] = matching_record["Id"]
-            if temp:
-                edit_records.append(temp)
+            edit_record = get_edit_record(record_source_env, matching_record)
+            if edit_record:
+                edit_records.append(edit_record)
         else:
-            temp = copy.deepcopy(record_source_env)
-            try:
-                temp.pop("Id")
-            except KeyError:
-                pass
-
-            # Special custom object conditions
-            if "LookupType__c" in record_source_env:
-                if record_source_env["LookupType__c"] == "SEQUENCESET":
-                    temp["LookupValue1__c"] = "To be generated on DEPLOY step"
-
-            add_records.append(temp)
+            add_records.append(get_add_record(record_source_env))
 
     # Finding records to delete
     for record_target_env in records_target_env:
-        matching_record = find_match(records_source_env, record_target_env, criteria)
-        if not matching_record:
+        if get_record_key(record_target_env, criteria) not in source_keys:
             delete_records.append(record_target_env)
 
     return {
@@ -110,6 +250,151 @@ def get_single_custom_object_records_diff(
     }
 
 
+def get_sorted_custom_object_records_diff(
+    object_type: str,
+    criteria: dict,
+    records_source_env: Iterable[dict],
+    records_target_env: Iterable[dict],
+    memory_bytes: int,
+):
+    """
+    Same result as ``get_single_custom_object_records_diff``, for record sets
+    larger than memory. Both sides are sorted on disk by record key, within
+    ``memory_bytes`` each, and joined in one streaming pass. Only records sharing
+    a key and the resulting diff are held in memory.
+    """
+    logger.info(f"Comparing {object_type} records (sort-merge) ...")
+    if object_type not in CUSTOM_OBJECTS_MAP.keys():
+        raise ValueError(f"Not a valid object type - {object_type}")
+
+    # (position in its record set, record) to restore the in-memory diff order
+    add_records = []
+    edit_records = []
+    delete_records = []
+
+    with tempfile.TemporaryDirectory(prefix="records-diff-") as temp_dir:
+        source_groups = iter_record_groups(
+            records_source_env, criteria, Path(temp_dir, "source"), memory_bytes
+        )
+        target_groups = iter_record_groups(
+            records_target_env, criteria, Path(temp_dir, "target"), memory_bytes
+        )
+
+        source_group = next(source_groups, None)
+        target_group = next(target_groups, None)
+        while source_group or target_group:
+            if target_group is None or (
+                source_group and source_group[0] < target_group[0]
+            ):
+                for seq, record_source_env in source_group[1]:
+                    add_records.append((seq, get_add_record(record_source_env)))
+                source_group = next(source_groups, None)
+
+            elif source_group is None or target_group[0] < source_group[0]:
+                delete_records.extend(target_group[1])
+                target_group = next(target_groups, None)
+
+            else:
+                # Like build_record_index, the first target record is the match
+                matching_record = target_group[1][0][1]
+                for seq, record_source_env in source_group[1]:
+                    edit_record = get_edit_record(record_source_env, matching_record)
+                    if edit_record:
+                        edit_records.append((seq, edit_record))
+                source_group = next(source_groups, None)
+                target_group = next(target_groups, None)
+
+    return {
+        "add": [record for _, record in sorted(add_records, key=lambda r: r[0])],
+        "edit": [record for _, record in sorted(edit_records, key=lambda r: r[0])],
+        "delete": [record for _, record in sorted(delete_records, key=lambda r: r[0])],
+    }
+
+
+def iter_record_groups(
+    records: Iterable[dict], criteria: Dict, directory: Path, memory_bytes: int
+) -> Iterator[tuple]:
+    """``(sort key, [(seq, record), ...])`` for each record key, in key order"""
+    entries = (
+        [get_sort_key(record, criteria), seq, record]
+        for seq, record in enumerate(records)
+    )
+    sorted_entries = sort_entries(entries, directory, memory_bytes)
+    for sort_key, group in groupby(sorted_entries, key=lambda entry: entry[0]):
+        yield sort_key, [(seq, record) for _, seq, record in group]
+
+
+def get_sort_key(record: Dict, criteria: Dict) -> str:
+    """
+    ``get_record_key`` as JSON text, which orders keys of any type. Key values
+    compare by their JSON, so e.g. ``1`` and ``1.0`` no longer match each other.
+    """
+    return json.dumps(get_record_key(record, criteria))
+
+
+def get_edit_record(record_source_env: Dict, matching_record: Dict) -> Dict:
+    # Special custom object conditions
+    if "LookupType__c" in record_source_env:
+        if record_source_env["LookupType__c"] == "SEQUENCESET":
+            return {}
+
+    temp = {}
+    for key, source_value in record_source_env.items():
+        if key in ("Id"):
+            continue
+
+        if matching_record.get(key) != source_value:
+            logger.info(f"Source and destination values do not match for {key}")
+            logger.info(f"{matching_record.get(key)} =/= {source_value}")
+            temp[key] = source_value
+            temp["__" + key] = matching_record.get(key)
+            temp["Id"] = matching_record["Id"]
+    return temp
+
+
+def get_add_record(record_source_env: Dict) -> Dict:
+    temp = copy.deepcopy(record_source_env)
+    try:
+        temp.pop("Id")
+    except KeyError:
+        pass
+
+    # Special custom object conditions
+    if "LookupType__c" in record_source_env:
+        if record_source_env["LookupType__c"] == "SEQUENCESET":
+            temp["LookupValue1__c"] = "To be generated on DEPLOY step"
+
+    return temp
+
+
+def get_record_key(record: Dict, criteria: Dict) -> tuple:
+    """
+    Hashable key of a record made of its ``primary`` (and ``secondary``) criteria
+    values. Two records have the same key exactly when ``find_match`` matches them.
+    """
+    primary_key = criteria["primary"]
+    secondary_key = criteria.get("secondary")
+
+    record_key = (to_hashable(record.get(primary_key)),)
+    if secondary_key:
+        record_key += (to_hashable(record.get(secondary_key)),)
+    return record_key
+
+
+def to_hashable(value):
+    if isinstance(value, (dict, list)):
+        return ("__json__", json.dumps(value, sort_keys=True))
+    return value
+
+
+def build_record_index(records: List[Dict], criteria: Dict) -> Dict[tuple, Dict]:
+    # Keep the first record for each key, like the linear scan in find_match
+    record_index = {}
+    for record in records:
+        record_index.setdefault(get_record_key(record, criteria), record)
+    return record_index
+
+
 def find_match(records: List[Dict], compare_record: Dict, criteria: Dict):
     primary_key = criteria["primary"]
     secondary_key = criteria.get("secondary")
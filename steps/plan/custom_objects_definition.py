@@ -7,11 +7,14 @@ from common.util.custom_objects_definitions import CustomObjectsDefinitionUtil
 
 def get_custom_objects_definitions_diff(
     target_env: str,
+    use_async: bool = False,
 ) -> dict:
     logger.info("Getting all custom objects records difference")
 
     source_definitions = CustomObjectsDefinitionUtil.read_custom_objects_definition()
-    target_definitions = extract_custom_objects_definitions(environment=target_env)
+    target_definitions = extract_custom_objects_definitions(
+        environment=target_env, use_async=use_async
+    )
 
     diff = CustomObjectsDefinitionUtil.diff(
         source_definitions=source_definitions,
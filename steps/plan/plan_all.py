@@ -1,25 +1,34 @@
 import shutil
+import threading
 from common.lib.logger import logger
+from common.lib.cancellation import is_cancelled
 from common.config.config import ZUORA_VCS_DIR
 from steps.plan.custom_fields import get_custom_fields_diff
 from steps.plan.workflow import generate_all_workflow_jsons
-from steps.plan.custom_object_records import get_custom_objects_records_diff
+from steps.plan.custom_object_records import (
+    RECORDS_DIFF_MAX_WORKERS,
+    get_custom_objects_records_diff,
+)
 from steps.plan.billing_doc import generate_all_html_template_payloads
 from steps.plan.custom_objects_definition import get_custom_objects_definitions_diff
 
 
-def plan_all(request_form: dict):
+def plan_all(request_form: dict, cancel_event: threading.Event = None):
     """
     Given deployment parameters in ``input-plan-deploy.json``. \n
     Prepares deployment ready JSONs for: \n
     - Workflows \n
     - Configuration templates \n
     - Custom object records  \n
+    Setting ``cancel_event`` stops before the next component.
+    Returns ``"failed"`` when some component could not be planned.
     """
     logger.info("🟣 Running planning step")
     logger.info(f"Request form: {request_form}")
 
     target_env = request_form["target_env"]
+    use_async = request_form.get("use_async", False)
+    failed = []
 
     plan_output_dir = ZUORA_VCS_DIR.joinpath("temp")
 
@@ -31,19 +40,26 @@ def plan_all(request_form: dict):
         pass
     plan_output_dir.mkdir(exist_ok=True, parents=True)
 
+    if is_cancelled(cancel_event, "Planning step"):
+        return "cancelled"
+
     # Custom fields for standard objects
     include_custom_fields = request_form.get("include_custom_fields", False)
     if include_custom_fields:
         try:
             logger.info("🟡 Generating custom fields JSONs")
-            get_custom_fields_diff(target_env)
+            get_custom_fields_diff(target_env, use_async=use_async)
             logger.info("✅ Successfully generated all custom fields JSONs")
         except Exception as e:
             logger.info("❌ FAILED to generate all custom fields JSONs")
             logger.info(e)
+            failed.append("custom fields")
     else:
         logger.info("Skipping custom fields generation")
 
+    if is_cancelled(cancel_event, "Planning step"):
+        return "cancelled"
+
     # Custom object definitions
     include_custom_object_definitions = request_form.get(
         "include_custom_object_definitions", False
@@ -51,14 +67,18 @@ def plan_all(request_form: dict):
     if include_custom_object_definitions:
         try:
             logger.info("🟡 Generating custom object definitions")
-            get_custom_objects_definitions_diff(target_env)
+            get_custom_objects_definitions_diff(target_env, use_async=use_async)
             logger.info("✅ Successfully generated all custom object definitions")
         except Exception as e:
             logger.info("❌ FAILED to generate all custom object definitions")
             logger.info(e)
+            failed.append("custom object definitions")
     else:
         logger.info("Skipping custom object definitions generation")
 
+    if is_cancelled(cancel_event, "Planning step"):
+        return "cancelled"
+
     # Custom object records
     include_custom_object_records = request_form.get(
         "include_custom_object_records", False
@@ -66,7 +86,13 @@ def plan_all(request_form: dict):
     if include_custom_object_records:
         try:
             logger.info("🟡 Getting custom object records difference")
-            get_custom_objects_records_diff(target_env)
+            get_custom_objects_records_diff(
+                target_env,
+                max_workers=request_form.get(
+                    "records_diff_workers", RECORDS_DIFF_MAX_WORKERS
+                ),
+                use_async=use_async,
+            )
             logger.info("✅ Successfully got all custom object records difference")
         except Exception as e:
             logger.info("❌ FAILED to get custom object records difference")
@@ -74,19 +100,28 @@ def plan_all(request_form: dict):
     else:
         logger.info("Skipping custom object records difference generation")
 
+    if is_cancelled(cancel_event, "Planning step"):
+        return "cancelled"
+
     # Billing document templates (Out of the box HTML templates)
     include_html_templates = request_form.get("include_html_templates", False)
     if include_html_templates:
         try:
             logger.info("🟡 Generating all HTML template Payloads")
-            generate_all_html_template_payloads(environment=target_env)
+            diff = generate_all_html_template_payloads(environment=target_env)
+            if diff["failed"]:
+                raise Exception(f"FAILED to generate: {', '.join(diff['failed'])}")
             logger.info("✅ Successfully generated all HTML template Payloads")
         except Exception as e:
             logger.info("❌ FAILED to generate all HTML template Payloads")
             logger.info(e)
+            failed.append("billing document templates")
     else:
         logger.info("Skipping HTML template Payloads generation")
 
+    if is_cancelled(cancel_event, "Planning step"):
+        return "cancelled"
+
     # Workflows
     workflow_names = request_form.get("workflows", [])
     if workflow_names:
@@ -100,8 +135,13 @@ def plan_all(request_form: dict):
         except Exception as e:
             logger.info("❌ FAILED to generate all workflow JSONs")
             logger.info(e)
+            failed.append("workflows")
     else:
         logger.info("Skipping workflow generation")
 
+    if failed:
+        logger.info(f"❌ Planning step failed for: {', '.join(failed)}")
+        return "failed"
+
     logger.info("🟢🟢🟢 Planning step completed 🟢🟢🟢")
     return "success"
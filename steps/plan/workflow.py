@@ -3,6 +3,7 @@ from pathlib import Path
 from common.lib.logger import logger
 from common.config.config import ZUORA_VCS_DIR
 from common.util.workflow.task import WorkflowTaskUtil
+from common.util.workflow.index import WorkflowSourceIndex
 from common.util.workflow.linkage import WorkflowLinkageUtil
 
 
@@ -17,20 +18,17 @@ def generate_workflow_json(workflow_name: str, output_dir: Path):
     with open(linkage_file) as fs:
         linkages_src = json.load(fs)
 
-    task_map_file = source_code_dir.joinpath("task_map.json")
-    with open(task_map_file) as fs:
-        task_map_src = json.load(fs)
+    source_index = WorkflowSourceIndex.from_directory(source_code_dir)
 
     workflow_metadata_file = source_code_dir.joinpath("workflow.json")
     with open(workflow_metadata_file) as fs:
         workflow = json.load(fs)
 
     linkages_dest = WorkflowLinkageUtil.create_linkages_with_id(
-        linkages_src, task_map_src
+        linkages_src, source_index.task_map
     )
 
-    task_files = list(source_code_dir.joinpath("tasks").glob("*"))
-    tasks_dest = WorkflowTaskUtil.create_task_definitions(task_map_src, task_files)
+    tasks_dest = WorkflowTaskUtil.create_task_definitions(source_index)
 
     workflow["tasks"] = tasks_dest
     workflow["linkages"] = linkages_dest
@@ -47,6 +45,7 @@ def generate_all_workflow_jsons(environment: str, workflow_names: str):
     )
     output_dir = ZUORA_VCS_DIR.joinpath("temp/workflows")
 
+    failed = []
     for workflow_name in workflow_names:
         try:
             logger.info(f"Generating workflow JSON for {workflow_name}")
@@ -55,3 +54,7 @@ def generate_all_workflow_jsons(environment: str, workflow_names: str):
         except Exception as e:
             logger.error(f"❌ FAILED to generate workflow JSON for {workflow_name}")
             logger.error(f"❌ {e}")
+            failed.append(workflow_name)
+
+    if failed:
+        raise Exception(f"FAILED to generate workflow JSONs: {', '.join(failed)}")
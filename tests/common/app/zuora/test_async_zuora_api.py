@@ -0,0 +1,105 @@
+import httpx
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+from pytest_mock import MockerFixture
+from common.app.zuora import throttle as throttle_module
+from common.app.zuora.api import token_cache
+from common.app.zuora.async_api import AsyncZuoraAPI
+from common.lib.secrets_manager import SecretsManager
+
+
+def mock_async_zuora_api(mocker: MockerFixture, handler, max_concurrency: int):
+    mocker.patch.object(
+        SecretsManager, "get_secret", return_value="https://rest.zuora.test"
+    )
+    token_cache.set("DEV", ("token", datetime.now() + timedelta(hours=1)))
+
+    zuora_api = AsyncZuoraAPI(environment="DEV", max_concurrency=max_concurrency)
+    zuora_api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return zuora_api
+
+
+def test_async_zuoraapi_bounds_concurrency(mocker: MockerFixture):
+    in_flight = {"current": 0, "max": 0}
+
+    async def handler(request: httpx.Request):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.01)
+        in_flight["current"] -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def run():
+        async with mock_async_zuora_api(mocker, handler, 3) as zuora_api:
+            return await asyncio.gather(
+                *(zuora_api.get(f"objects/{i}") for i in range(10))
+            )
+
+    responses = asyncio.run(run())
+    token_cache.invalidate()
+
+    assert [response.json()["path"] for response in responses] == [
+        f"/objects/{i}" for i in range(10)
+    ]
+    assert in_flight["max"] == 3
+
+
+def test_async_zuoraapi_get_paginated_records_follows_cursor(
+    mocker: MockerFixture,
+):
+    pages = {
+        "pageSize=2": {"records": [{"id": 1}, {"id": 2}], "cursor": "abc"},
+        "pageSize=2&cursor=abc": {"records": [{"id": 3}]},
+    }
+
+    def handler(request: httpx.Request):
+        assert request.headers["Authorization"] == "Bearer token"
+        return httpx.Response(200, json=pages[request.url.query.decode()])
+
+    async def run():
+        async with mock_async_zuora_api(mocker, handler, 2) as zuora_api:
+            records = zuora_api.get_paginated_records(
+                "objects/records/default/Lookup", page_size=2
+            )
+            return [record["id"] async for record in records]
+
+    records = asyncio.run(run())
+    token_cache.invalidate()
+
+    assert records == [1, 2, 3]
+
+
+def test_async_zuoraapi_retries_through_the_throttle(mocker: MockerFixture):
+    mocker.patch.object(throttle_module, "_throttles", {})
+    mocker.patch("common.app.zuora.async_api.asyncio.sleep", side_effect=no_sleep)
+    calls = []
+
+    def handler(request: httpx.Request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("timeout", request=request)
+        if len(calls) == 2:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with mock_async_zuora_api(mocker, handler, 2) as zuora_api:
+            response = await zuora_api.get("objects/1")
+            with pytest.raises(httpx.ReadTimeout):
+                calls.clear()
+                await zuora_api.post("objects/1", payload={"key": "value"})
+            return response
+
+    response = asyncio.run(run())
+    token_cache.invalidate()
+
+    assert response.status_code == 200
+    assert calls == ["POST"]
+    throttle = throttle_module.get_throttle("DEV")
+    assert throttle.in_flight == 0
+    assert throttle.limit < throttle.max_concurrency
+
+
+async def no_sleep(delay):
+    pass
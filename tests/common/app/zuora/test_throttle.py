@@ -0,0 +1,101 @@
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from common.app.zuora import throttle as throttle_module
+from common.app.zuora.api import ZuoraAPI
+from common.app.zuora.throttle import AdaptiveThrottle, is_retryable
+from common.lib.secrets_manager import SecretsManager
+
+
+def test_throttle_halves_limit_on_429_and_grows_back():
+    throttle = AdaptiveThrottle(max_concurrency=8)
+
+    throttle.acquire()
+    throttle.release(429, {})
+    assert throttle.limit == 4
+
+    for _ in range(4):
+        throttle.acquire()
+        throttle.release(200, {})
+    assert 4 < throttle.limit <= 5
+
+
+def test_throttle_follows_rate_limit_headers():
+    throttle = AdaptiveThrottle(max_concurrency=8)
+
+    throttle.acquire()
+    throttle.release(
+        200,
+        {
+            "Concurrency-Limit-Limit": "3",
+            "RateLimit-Remaining": "0",
+            "RateLimit-Reset": "5",
+        },
+    )
+
+    assert throttle.limit == 3
+    assert throttle.paused_until > 0
+
+
+def test_throttle_retries_only_safe_requests():
+    assert is_retryable("POST", 429)
+    assert is_retryable("GET", 502)
+    assert not is_retryable("POST", 502)
+    assert not is_retryable("GET", 400)
+
+
+def test_throttle_backoff_honours_retry_after():
+    assert 7 <= AdaptiveThrottle.get_backoff(0, {"Retry-After": "7"}) < 8
+    assert 0 <= AdaptiveThrottle.get_backoff(3) <= 8
+
+
+def test_zuoraapi_retries_throttled_requests(mocker: MockerFixture):
+    mocker.patch.object(SecretsManager, "get_secret", return_value="secret")
+    mocker.patch.object(throttle_module, "_throttles", {})
+    sleep = mocker.patch("common.app.zuora.api.time.sleep")
+
+    zuora_api = ZuoraAPI(environment="DEV")
+    responses = [
+        mocker.Mock(status_code=429, headers={"Retry-After": "0"}),
+        mocker.Mock(status_code=503, headers={}),
+        mocker.Mock(status_code=200, headers={}),
+    ]
+    request = mocker.patch.object(zuora_api.session, "request", side_effect=responses)
+
+    response = zuora_api.send_request("POST", "https://rest.zuora.com/path")
+
+    assert response.status_code == 200
+    assert request.call_count == 3
+    assert sleep.call_count == 2
+
+
+def test_zuoraapi_releases_throttle_on_request_errors(mocker: MockerFixture):
+    mocker.patch.object(SecretsManager, "get_secret", return_value="secret")
+    mocker.patch.object(throttle_module, "_throttles", {})
+    mocker.patch("common.app.zuora.api.time.sleep")
+
+    zuora_api = ZuoraAPI(environment="DEV")
+    request = mocker.patch.object(
+        zuora_api.session,
+        "request",
+        side_effect=[
+            requests.exceptions.ReadTimeout(),
+            requests.exceptions.ChunkedEncodingError(),
+            mocker.Mock(status_code=200, headers={}),
+            requests.exceptions.ChunkedEncodingError(),
+            requests.exceptions.InvalidURL(),
+        ],
+    )
+
+    response = zuora_api.send_request("GET", "https://rest.zuora.com/path")
+    assert response.status_code == 200
+    assert request.call_count == 3
+
+    # Not resent for a POST, nor for errors other than timeouts and broken responses
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        zuora_api.send_request("POST", "https://rest.zuora.com/path")
+    with pytest.raises(requests.exceptions.InvalidURL):
+        zuora_api.send_request("GET", "https://rest.zuora.com/path")
+    assert request.call_count == 5
+
+    assert throttle_module.get_throttle("DEV").in_flight == 0
@@ -1,5 +1,8 @@
-from datetime import datetime
-from common.app.zuora.api import ZuoraAPI
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from pytest_mock import MockerFixture
+from common.app.zuora.api import ZuoraAPI, token_cache
 from common.lib.secrets_manager import SecretsManager
 
 
@@ -38,3 +41,100 @@ def test_zuoraapi_renew_token_if_expired():
     zuora_api = ZuoraAPI(environment="DEV")
 
     zuora_api.renew_bearer_token_if_expired()
+
+
+def test_zuoraapi_reuses_pooled_session(mocker: MockerFixture):
+    mocker.patch.object(SecretsManager, "get_secret", return_value="secret")
+
+    with ZuoraAPI(environment="DEV", pool_maxsize=4) as zuora_api:
+        session = zuora_api.session
+        assert zuora_api.session is session
+        assert session.get_adapter("https://rest.zuora.com")._pool_maxsize == 4
+
+    assert zuora_api._session is None
+
+
+def test_zuoraapi_serves_bearer_token_from_cache(mocker: MockerFixture):
+    token_ttl = (datetime.now() + timedelta(hours=1)).timestamp()
+    secrets = {"zuora_bearer_token": "token", "zuora_token_ttl": token_ttl}
+    get_secret = mocker.patch.object(
+        SecretsManager,
+        "get_secret",
+        side_effect=lambda secret_key, **kwargs: secrets.get(secret_key, "secret"),
+    )
+    token_cache.invalidate()
+
+    zuora_api = ZuoraAPI(environment="DEV")
+    zuora_api.renew_bearer_token_if_expired()
+    calls_after_first_renewal = get_secret.call_count
+    zuora_api.renew_bearer_token_if_expired()
+    ZuoraAPI(environment="DEV").renew_bearer_token_if_expired()
+
+    assert zuora_api.bearer_token == "token"
+    assert get_secret.call_count == calls_after_first_renewal + 2
+    token_cache.invalidate()
+
+
+def test_zuoraapi_get_paginated_records_follows_cursor(mocker: MockerFixture):
+    mocker.patch.object(SecretsManager, "get_secret", return_value="secret")
+    pages = {
+        "objects/records/default/Lookup?pageSize=2": {
+            "records": [{"id": 1}, {"id": 2}],
+            "cursor": "abc",
+        },
+        "objects/records/default/Lookup?pageSize=2&cursor=abc": {
+            "records": [{"id": 3}],
+        },
+    }
+
+    def mocked_get(path: str, payload: dict = {}):
+        response = mocker.Mock(status_code=200)
+        response.json.return_value = pages[path]
+        return response
+
+    zuora_api = ZuoraAPI(environment="DEV")
+    mocker.patch.object(zuora_api, "get", side_effect=mocked_get)
+
+    records = zuora_api.get_paginated_records(
+        "objects/records/default/Lookup", page_size=2
+    )
+
+    assert [record["id"] for record in records] == [1, 2, 3]
+
+
+def test_zuoraapi_refreshes_expired_token_once(mocker: MockerFixture, tmp_path):
+    secrets = {"zuora_bearer_token": "expired", "zuora_token_ttl": 1.0}
+    mocker.patch.object(
+        SecretsManager,
+        "get_secret",
+        side_effect=lambda secret_key, **kwargs: secrets.get(secret_key, "secret"),
+    )
+    mocker.patch("common.app.zuora.api.TOKEN_LOCK_DIR", tmp_path)
+    token_cache.invalidate()
+
+    def generate_bearer_token(self: ZuoraAPI):
+        time.sleep(0.05)
+        self.bearer_token = "token"
+        self.token_ttl = datetime.now() + timedelta(hours=1)
+        secrets["zuora_bearer_token"] = self.bearer_token
+        secrets["zuora_token_ttl"] = self.token_ttl.timestamp()
+        self.cache_bearer_token()
+
+    generate = mocker.patch.object(
+        ZuoraAPI,
+        "generate_bearer_token",
+        autospec=True,
+        side_effect=generate_bearer_token,
+    )
+
+    def renew():
+        zuora_api = ZuoraAPI(environment="DEV")
+        zuora_api.renew_bearer_token_if_expired()
+        return zuora_api.bearer_token
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: renew(), range(8)))
+
+    assert tokens == ["token"] * 8
+    assert generate.call_count == 1
+    token_cache.invalidate()
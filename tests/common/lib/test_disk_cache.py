@@ -0,0 +1,38 @@
+import os
+import pytest
+from common.lib.disk_cache import DiskCache
+
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=1024)
+
+    cache.set("dev/workflows/1/export?version=1.0.0", {"tasks": [1, 2]})
+
+    assert cache.get("dev/workflows/1/export?version=1.0.0") == {"tasks": [1, 2]}
+    assert cache.get("qa/workflows/1/export?version=1.0.0") is None
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    value = "x" * 100
+    cache = DiskCache(tmp_path, max_bytes=250)
+
+    cache.set("a", value)
+    cache.set("b", value)
+    os.utime(cache.get_path("a"), (1, 1))
+    os.utime(cache.get_path("b"), (2, 2))
+    cache.get("a")
+    cache.set("c", value)
+
+    assert cache.get("a") == value
+    assert cache.get("b") is None
+    assert cache.get("c") == value
+
+
+def test_disk_cache_set_removes_temp_file_on_error(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=1024)
+
+    with pytest.raises(TypeError):
+        cache.set("a", {"value": object()})
+
+    assert cache.get("a") is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,16 @@
+import random
+from common.lib.external_sort import sort_entries
+
+
+def test_sort_entries_spills_and_merges_runs(tmp_path):
+    randomizer = random.Random(0)
+    entries = [
+        [str(randomizer.randint(0, 50)), seq, {"value": seq}] for seq in range(500)
+    ]
+    expected = sorted(entries, key=lambda entry: (entry[0], entry[1]))
+
+    assert list(sort_entries(iter(entries), tmp_path, memory_bytes=10**9)) == expected
+    assert not list(tmp_path.iterdir())
+
+    assert list(sort_entries(iter(entries), tmp_path, memory_bytes=1024)) == expected
+    assert len(list(tmp_path.glob("run-*.jsonl"))) > 1
@@ -1,4 +1,7 @@
+import json
 import pytest
+from pytest_mock import MockerFixture
+from common.lib import secrets_manager
 from common.lib.secrets_manager import SecretsManager
 
 
@@ -17,3 +20,28 @@ def test_get_existing_secrets():
     secret_keys = list(secrets.keys())
     assert "zuora_client_id" in secret_keys
     assert "zuora_client_secret" in secret_keys
+
+
+def test_update_secret_writes_all_keys_at_once(mocker: MockerFixture, tmp_path):
+    sm_file = tmp_path.joinpath("sm.json")
+    sm_file.write_text(json.dumps({"dev": {"zuora_client_id": "id"}}))
+    mocker.patch.object(secrets_manager, "IS_LOCAL", True)
+    mocker.patch.object(secrets_manager, "local_sm_file", sm_file)
+    mocker.patch.object(
+        secrets_manager, "local_sm_lock_file", tmp_path.joinpath(".sm.json.lock")
+    )
+
+    SecretsManager.update_secret(
+        secret={"zuora_bearer_token": "token", "zuora_token_ttl": 1.0},
+        environment="DEV",
+    )
+
+    assert json.loads(sm_file.read_text()) == {
+        "dev": {
+            "zuora_client_id": "id",
+            "zuora_bearer_token": "token",
+            "zuora_token_ttl": 1.0,
+        }
+    }
+    assert list(tmp_path.glob("*.tmp")) == []
+    secrets_manager.secrets_cache.invalidate()
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from pytest_mock import MockerFixture
+from common.util.billing_doc.html_util import BillingDocumentHtmlSplitter
+from common.util.billing_doc.build_util import BillingDocumentTemplateBuilder
+from common.util.billing_doc.dump_util import BillingDocumentTemplateParser
+
+HEADER_HTML = "<table>\n  <tr><td>{{Invoice.Number}}</td></tr>\n</table>"
+LINES_HTML = (
+    '<div class="lines">\n<div>{{#InvoiceItems}}&nbsp;{{/InvoiceItems}}</div>\n</div>'
+)
+
+MAIN_HTML = (
+    "<!DOCTYPE html>\n<html><head><style>div > p { color: red; }</style></head>\n"
+    "<body>\r\n  <div id='u_content_header' class=\"custom\">"
+    f"{HEADER_HTML}</div>\n"
+    '  <!-- <div id="u_content_lines">commented</div> -->\n'
+    f'  <div id="u_content_lines">{LINES_HTML}</div>\n'
+    '  <div id="u_content_header_2"><br/><img src="logo.png"></div>\n'
+    "</body></html>"
+)
+
+
+def test_split_and_merge_round_trip_is_byte_identical():
+    html_ids = ["u_content_header", "u_content_lines", "u_content_header_2"]
+
+    skeleton, contents = BillingDocumentHtmlSplitter.split(MAIN_HTML, html_ids)
+
+    assert contents["u_content_header"] == HEADER_HTML
+    assert contents["u_content_lines"] == LINES_HTML
+    assert "placeholder-u_content_header_2" in skeleton
+    assert BillingDocumentHtmlSplitter.merge(skeleton, contents) == MAIN_HTML
+
+
+def get_content(html_id: str, html: str) -> dict:
+    return {
+        "type": "customx",
+        "slug": "reactHtml",
+        "values": {"_meta": {"htmlID": html_id}, "html": html},
+    }
+
+
+def test_template_source_code_round_trip(mocker: MockerFixture, tmp_path: Path):
+    mocker.patch("common.util.billing_doc.dump_util.HTML_TEMPLATES_DIR", tmp_path)
+    mocker.patch("common.util.billing_doc.build_util.HTML_TEMPLATES_DIR", tmp_path)
+    template = {
+        "design": {
+            "body": {
+                "rows": [
+                    {
+                        "columns": [
+                            {
+                                "contents": [
+                                    get_content("u_content_header", HEADER_HTML),
+                                    {"type": "text", "values": {}},
+                                    get_content("u_content_lines", LINES_HTML),
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            }
+        },
+        "htmlContent": MAIN_HTML,
+    }
+    template_dir = tmp_path.joinpath("Invoice")
+    template_dir.mkdir()
+    with open(template_dir.joinpath("Invoice.json"), "w") as fs:
+        json.dump(template, fs)
+
+    BillingDocumentTemplateParser.extract_source_code("Invoice")
+    rebuilt_template = BillingDocumentTemplateBuilder.build_json_from_source_code(
+        "Invoice"
+    )
+
+    assert rebuilt_template == template
@@ -0,0 +1,32 @@
+from pathlib import Path
+from pytest_mock import MockerFixture
+from common.util.billing_doc.dump_util import BillingDocumentTemplateParser
+
+
+def test_template_is_unchanged_until_updated_or_edited(
+    mocker: MockerFixture, tmp_path: Path
+):
+    mocker.patch("common.util.billing_doc.dump_util.HTML_TEMPLATES_DIR", tmp_path)
+    template_dir = tmp_path.joinpath("Invoice")
+    template_dir.mkdir()
+    template_dir.joinpath("main_content.html").write_text("<div>placeholder</div>")
+
+    template = {"id": "1", "name": "Invoice", "updatedOn": "2024-01-01 10:00:00"}
+    manifest = {
+        "Invoice": BillingDocumentTemplateParser.get_manifest_entry(template, "dev")
+    }
+
+    assert BillingDocumentTemplateParser.is_template_unchanged(
+        manifest, template, "dev"
+    )
+    assert not BillingDocumentTemplateParser.is_template_unchanged(
+        manifest, template, "qa"
+    )
+    assert not BillingDocumentTemplateParser.is_template_unchanged(
+        manifest, {**template, "updatedOn": "2024-02-01 10:00:00"}, "dev"
+    )
+
+    template_dir.joinpath("main_content.html").write_text("<div>edited</div>")
+    assert not BillingDocumentTemplateParser.is_template_unchanged(
+        manifest, template, "dev"
+    )
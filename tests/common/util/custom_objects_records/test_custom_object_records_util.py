@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+from pytest_mock import MockerFixture
+from common.util.custom_objects_records import CustomObjectRecordsUtil
+
+RECORDS = [
+    {"Name": "First", "LookupType__c": "TYPE", "Values__c": ["a", "b"]},
+    {"Name": "Second\nline", "LookupType__c": None, "Nested__c": {"key": 1.5}},
+]
+
+
+def test_dump_records_to_file_matches_json_dump(mocker: MockerFixture, tmp_path: Path):
+    mocker.patch("common.util.custom_objects_records.util.ZUORA_VCS_DIR", tmp_path)
+
+    for records in (RECORDS, []):
+        CustomObjectRecordsUtil.dump_records_to_file(iter(records), "Lookup")
+
+        output_file = tmp_path.joinpath("custom_object_records/Lookup.json")
+        assert output_file.read_text() == json.dumps(records, indent=2)
+
+
+def test_dump_records_to_file_jsonl(mocker: MockerFixture, tmp_path: Path):
+    mocker.patch("common.util.custom_objects_records.util.ZUORA_VCS_DIR", tmp_path)
+
+    CustomObjectRecordsUtil.dump_records_to_file(iter(RECORDS), "Lookup", "json")
+    CustomObjectRecordsUtil.dump_records_to_file(iter(RECORDS), "Lookup", "jsonl")
+
+    records_dir = tmp_path.joinpath("custom_object_records")
+    assert not records_dir.joinpath("Lookup.json").exists()
+    lines = records_dir.joinpath("Lookup.jsonl").read_text().splitlines()
+    assert lines == [json.dumps(record, sort_keys=True) for record in RECORDS]
+
+
+def test_read_custom_object_record_mixed_formats(mocker: MockerFixture, tmp_path: Path):
+    mocker.patch("common.util.custom_objects_records.util.ZUORA_VCS_DIR", tmp_path)
+
+    CustomObjectRecordsUtil.dump_records_to_file(iter(RECORDS), "Lookup", "jsonl")
+    CustomObjectRecordsUtil.dump_records_to_file(iter(RECORDS), "Other", "json")
+
+    records = CustomObjectRecordsUtil.read_custom_object_record()
+    assert records == {"Lookup": RECORDS, "Other": RECORDS}
+
+    lazy_records = CustomObjectRecordsUtil.read_custom_object_record(lazy=True)
+    assert not isinstance(lazy_records["Lookup"], list)
+    assert list(lazy_records["Lookup"]) == RECORDS
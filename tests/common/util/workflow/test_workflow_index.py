@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+from common.util.workflow.index import WorkflowSourceIndex
+from common.util.workflow.task import WorkflowTaskUtil
+
+
+def test_workflow_source_index_from_directory(tmp_path: Path):
+    tasks_dir = tmp_path.joinpath("tasks")
+    tasks_dir.mkdir()
+    tasks_dir.joinpath("Check.json").write_text(
+        json.dumps({"action_type": "If", "parameters": {}})
+    )
+    tasks_dir.joinpath("Check.liquid").write_text("{{ true }}")
+    with open(tmp_path.joinpath("task_map.json"), "w") as fs:
+        json.dump({"Check": 1, "Missing": 2}, fs)
+
+    source_index = WorkflowSourceIndex.from_directory(tmp_path)
+    tasks = WorkflowTaskUtil.create_task_definitions(source_index)
+
+    assert source_index.find_task_file("Check.liquid").name == "Check.liquid"
+    assert source_index.get_task_name_by_id("2") == "Missing"
+    assert tasks == [
+        {
+            "action_type": "If",
+            "parameters": {"if_clause": "{{ true }}"},
+            "id": 1,
+            "name": "Check",
+        }
+    ]
+
+
+def test_update_id_in_file_resolves_ids_through_index():
+    source_index = WorkflowSourceIndex.from_tasks(
+        [{"name": "Export", "id": 481516}, {"name": "Upload", "id": 2342}]
+    )
+    task_map_new = {"Export": 1, "Upload": 2}
+
+    updated_file = WorkflowTaskUtil.update_id_in_file(
+        "Export.csv__481516.csv", source_index, task_map_new
+    )
+    unknown_file = WorkflowTaskUtil.update_id_in_file(
+        "Other.csv__999.csv", source_index, task_map_new
+    )
+
+    assert updated_file == "Export.csv__1.csv"
+    assert unknown_file == "Other.csv__999.csv"
@@ -1,4 +1,7 @@
+from pytest_mock import MockerFixture
 from common.lib.logger import logger
+from common.lib.disk_cache import DiskCache
+from common.util.workflow import util as workflow_util
 from common.util.workflow.util import ZuoraWorkflowUtil
 
 
@@ -32,3 +35,101 @@ def test_get_target_workflow_id_and_version():
 
     assert workflow_id == 480329
     assert new_version == "0.0.4"
+
+
+def test_build_workflow_definition_resolves_linkage_task_names():
+    response_json = {
+        "workflow": {"name": "Workflow"},
+        "workflow_definition": {"name": "Workflow"},
+        "tasks": [{"id": 1, "name": "Start"}, {"id": 2, "name": "Update"}],
+        "linkages": [
+            {
+                "source_workflow_id": 10,
+                "source_task_id": None,
+                "target_task_id": 1,
+                "linkage_type": "Start",
+            },
+            {
+                "source_workflow_id": None,
+                "source_task_id": 1,
+                "target_task_id": 2,
+                "linkage_type": "Success",
+            },
+            {
+                "source_workflow_id": None,
+                "source_task_id": 2,
+                "target_task_id": 3,
+                "linkage_type": "Failure",
+            },
+        ],
+    }
+
+    workflow_definition = ZuoraWorkflowUtil.build_workflow_definition(response_json)
+
+    assert [
+        (linkage["source_task_name"], linkage["target_task_name"])
+        for linkage in workflow_definition["linkages"]
+    ] == [("Update", 3), ("Start", "Update"), (None, "Start")]
+
+
+def test_workflow_catalogue_is_listed_once_per_environment(mocker: MockerFixture):
+    def version(number: str, definition_id: int) -> dict:
+        return {"version": number, "definitionId": definition_id, "description": ""}
+
+    workflows = [
+        {
+            "name": "Workflow A",
+            "active_version": version("1.0.1", 10),
+            "latest_inactive_versions": [version("1.0.0", 10)],
+        },
+        {
+            "name": "Workflow B",
+            "active_version": None,
+            "latest_inactive_versions": [version("0.0.1", 20)],
+        },
+    ]
+    list_workflows = mocker.patch.object(
+        ZuoraWorkflowUtil, "list_workflows", return_value=workflows
+    )
+    ZuoraWorkflowUtil.invalidate_workflow_catalogue()
+
+    version_map = ZuoraWorkflowUtil.get_workflow_version_map_by_workflow_name(
+        environment="dev", workflow_name="Workflow A"
+    )
+    workflow_id, new_version = ZuoraWorkflowUtil.get_target_workflow_id_and_version(
+        environment="DEV", workflow_name="Workflow B"
+    )
+
+    assert list(version_map.keys()) == ["1.0.1", "1.0.0"]
+    assert (workflow_id, new_version) == (20, "0.0.2")
+    assert list_workflows.call_count == 1
+
+    ZuoraWorkflowUtil.invalidate_workflow_catalogue("dev")
+    ZuoraWorkflowUtil.get_workflow_catalogue("dev")
+    assert list_workflows.call_count == 2
+    ZuoraWorkflowUtil.invalidate_workflow_catalogue()
+
+
+def test_export_workflow_definition_is_served_from_disk_cache(
+    mocker: MockerFixture, tmp_path
+):
+    mocker.patch.object(
+        workflow_util, "workflow_export_cache", DiskCache(tmp_path, 1024 * 1024)
+    )
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {
+        "workflow": {"name": "Workflow"},
+        "workflow_definition": {"name": "Workflow"},
+        "tasks": [],
+        "linkages": [],
+    }
+    zuora_api = mocker.patch.object(workflow_util, "ZuoraAPI")
+    zuora_api.return_value.get.return_value = response
+
+    for _ in range(2):
+        workflow_definition = ZuoraWorkflowUtil.export_workflow_definition(
+            environment="dev", workflow_id=1, workflow_version="1.0.0"
+        )
+
+    assert workflow_definition["workflow"] == {"name": "Workflow"}
+    assert zuora_api.return_value.get.call_count == 1
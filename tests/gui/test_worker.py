@@ -0,0 +1,34 @@
+import time
+from gui.worker import BackgroundWorker
+
+
+class FakeWidget:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay_ms: int, callback):
+        self.scheduled.append(callback)
+
+    def run_scheduled(self):
+        while self.scheduled:
+            time.sleep(0.01)
+            self.scheduled.pop(0)()
+
+
+def test_background_worker_hands_results_to_main_thread():
+    widget = FakeWidget()
+    worker = BackgroundWorker(widget, max_workers=2)
+    results = []
+    errors = []
+
+    def fail():
+        raise ValueError("failed")
+
+    worker.submit(lambda x: x * 2, 21, on_done=results.append)
+    worker.submit(fail, on_error=errors.append)
+    widget.run_scheduled()
+    worker.shutdown()
+
+    assert results == [42]
+    assert [str(error) for error in errors] == ["failed"]
+    assert worker.pending == 0
@@ -17,3 +17,24 @@ def test_deploy_all(mocker: MockerFixture):
     )
 
     deploy_all()
+
+
+def test_deploy_all_reports_failed_components(mocker: MockerFixture):
+    mocker.patch(
+        "steps.deploy.deploy_all.deploy_all_custom_object_records_diff",
+        return_value={"Lookup": {"create": {"succeeded": 1, "failed": []}}},
+    )
+    deploy_billing = mocker.patch(
+        "steps.deploy.deploy_all.deploy_all_billing_document_templates",
+        return_value=[],
+    )
+    request_form = {
+        "target_env": "qa",
+        "include_custom_object_records": True,
+        "include_html_templates": True,
+    }
+
+    assert deploy_all(request_form) == "success"
+
+    deploy_billing.return_value = ["Generic Invoice"]
+    assert deploy_all(request_form) == "failed"
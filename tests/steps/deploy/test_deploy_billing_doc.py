@@ -0,0 +1,77 @@
+import json
+import base64
+from pytest_mock import MockerFixture
+from common.util.billing_doc.util import BillingDocumentTemplateUtil
+from steps.deploy.billing_doc import deploy_all_billing_document_templates
+
+
+def encode(template: dict, **kwargs) -> str:
+    return base64.b64encode(json.dumps(template, **kwargs).encode()).decode()
+
+
+def test_payload_hash_ignores_formatting_and_read_only_fields():
+    template = {"htmlContent": "<div>Invoice</div>", "columns": [1, 2]}
+    payload = {"name": "Invoice", "base64EncodedTemplateFileContent": encode(template)}
+    deployed = {
+        "id": "8a1",
+        "updatedOn": "2024-01-01",
+        "name": "Invoice",
+        "base64EncodedTemplateFileContent": encode(template, indent=2, sort_keys=True),
+    }
+
+    payload_hash = BillingDocumentTemplateUtil.get_payload_hash(payload, payload)
+    deployed_hash = BillingDocumentTemplateUtil.get_payload_hash(deployed, payload)
+
+    assert payload_hash == deployed_hash
+
+    deployed["name"] = "Renamed"
+    deployed_hash = BillingDocumentTemplateUtil.get_payload_hash(deployed, payload)
+    assert payload_hash != deployed_hash
+
+
+def test_deploy_only_puts_changed_templates(mocker: MockerFixture, tmp_path):
+    payloads_dir = tmp_path.joinpath("temp", "billing_documents")
+    payloads_dir.mkdir(parents=True)
+    payloads = {
+        "Unchanged": {
+            "name": "Unchanged",
+            "base64EncodedTemplateFileContent": encode({"a": 1}),
+        },
+        "Changed": {
+            "name": "Changed",
+            "base64EncodedTemplateFileContent": encode({"a": 2}),
+        },
+    }
+    for name, payload in payloads.items():
+        payloads_dir.joinpath(f"{name}_form_new.json").write_text(json.dumps(payload))
+    mocker.patch("steps.deploy.billing_doc.ZUORA_VCS_DIR", tmp_path)
+
+    mocker.patch.object(
+        BillingDocumentTemplateUtil,
+        "list_all_billing_document_templates",
+        return_value={
+            "invoice": [
+                {"id": "1", "name": "Unchanged"},
+                {"id": "2", "name": "Changed"},
+            ]
+        },
+    )
+    deployed = {
+        "settings/invoice-templates/1": payloads["Unchanged"],
+        "settings/invoice-templates/2": {
+            "name": "Changed",
+            "base64EncodedTemplateFileContent": encode({"a": 1}),
+        },
+    }
+    zuora_api = mocker.patch("steps.deploy.billing_doc.ZuoraAPI").return_value
+    zuora_api = zuora_api.__enter__.return_value
+    zuora_api.get.side_effect = lambda path: mocker.Mock(
+        status_code=200, json=lambda: deployed[path]
+    )
+    zuora_api.put.return_value = mocker.Mock(status_code=200)
+
+    deploy_all_billing_document_templates("dev")
+
+    zuora_api.put.assert_called_once_with(
+        path="settings/invoice-templates/2", payload=payloads["Changed"]
+    )
@@ -1,5 +1,37 @@
-from steps.deploy.custom_objects_records import deploy_all_custom_object_records
+from steps.deploy.custom_objects_records import (
+    BATCH_RECORDS_LIMIT,
+    SEQUENCESET_PLACEHOLDER,
+    deploy_all_custom_object_records_diff,
+    get_batch_actions,
+    get_batch_payload,
+)
 
 
 def test_deploy_all_custom_object_records():
-    deploy_all_custom_object_records(environment="olduat")
+    deploy_all_custom_object_records_diff(target_env="olduat")
+
+
+def test_get_batch_actions_chunks_at_record_limit():
+    object_diff = {
+        "add": [{"Name": f"record {i}"} for i in range(BATCH_RECORDS_LIMIT + 1)]
+        + [{"Name": "sequence", "LookupValue1__c": SEQUENCESET_PLACEHOLDER}],
+        "edit": [{"Id": "id-1", "Name": "new", "__Name": "old"}],
+        "delete": [{"Id": "id-2", "Name": "deleted"}],
+    }
+
+    batch_actions = get_batch_actions("Lookup", object_diff)
+
+    assert [(action_type, len(chunk)) for _, action_type, chunk in batch_actions] == [
+        ("create", BATCH_RECORDS_LIMIT),
+        ("create", 1),
+        ("update", 1),
+        ("delete", 1),
+    ]
+    assert get_batch_payload(*batch_actions[2]) == {
+        "action": {
+            "type": "update",
+            "object": "Lookup",
+            "records": {"id-1": {"Name": "new"}},
+        }
+    }
+    assert get_batch_payload(*batch_actions[3])["action"]["ids"] == ["id-2"]
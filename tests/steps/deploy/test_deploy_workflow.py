@@ -1,3 +1,5 @@
+import json
+import pytest
 from pytest_mock import MockerFixture
 from common.lib.logger import logger
 from steps.deploy.workflow import deploy_workflow, deploy_all_workflows
@@ -27,3 +29,36 @@ def test_deply_all_workflows(mocker: MockerFixture):
             "Workflow name 3",
         ],
     )
+
+
+def test_deploy_all_workflows_reports_each_workflow(mocker: MockerFixture, tmp_path):
+    workflows_dir = tmp_path.joinpath("temp", "workflows")
+    workflows_dir.mkdir(parents=True)
+    for workflow_name in ("Workflow 1", "Workflow 2"):
+        workflows_dir.joinpath(f"{workflow_name}-output-to-zuora.json").write_text("{}")
+    mocker.patch("steps.deploy.workflow.ZUORA_VCS_DIR", tmp_path)
+
+    def import_workflow_version(environment, workflow_name, content_file):
+        status_code = 200 if workflow_name == "Workflow 1" else 500
+        return mocker.Mock(status_code=status_code, text="error body"), "1.0.1"
+
+    mocker.patch(
+        "steps.deploy.workflow.import_workflow_version",
+        side_effect=import_workflow_version,
+    )
+
+    with pytest.raises(Exception, match="Workflow 2"):
+        deploy_all_workflows(
+            environment="dev",
+            workflow_names=["Workflow 1", "Workflow 2", "Workflow 3"],
+            max_workers=3,
+        )
+
+    results = json.loads(workflows_dir.joinpath("deploy_result.json").read_text())
+    assert [(result["workflow"], result["status"]) for result in results] == [
+        ("Workflow 1", "success"),
+        ("Workflow 2", "failed"),
+        ("Workflow 3", "skipped"),
+    ]
+    assert results[1]["error"] == "error body"
+    assert results[1]["version"] == "1.0.1"
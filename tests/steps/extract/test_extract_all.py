@@ -0,0 +1,71 @@
+import threading
+import pytest
+from pytest_mock import MockerFixture
+from steps.extract.extract_all import extract_all, get_extract_tasks, run_extract_tasks
+
+
+def test_run_extract_tasks_collects_errors_per_component():
+    def succeed(**kwargs):
+        pass
+
+    def fail(**kwargs):
+        raise ValueError(kwargs["name"])
+
+    tasks = [
+        ("component 1", succeed, {}),
+        ("component 2", fail, {"name": "component 2"}),
+        ("component 3", succeed, {}),
+        ("component 4", fail, {"name": "component 4"}),
+    ]
+
+    for max_workers in (1, 4):
+        errors = run_extract_tasks(tasks, max_workers=max_workers)
+        assert sorted(errors.keys()) == ["component 2", "component 4"]
+
+
+def test_extract_all_raises_when_a_component_fails(mocker: MockerFixture):
+    mocker.patch(
+        "steps.extract.extract_all.extract_custom_fields",
+        side_effect=Exception("Mocked failure"),
+    )
+
+    with pytest.raises(Exception):
+        extract_all(
+            {
+                "source_environment": "dev",
+                "include_custom_fields": True,
+                "max_workers": 2,
+            }
+        )
+
+
+def test_run_extract_tasks_skips_tasks_once_cancelled():
+    cancel_event = threading.Event()
+    extracted = []
+
+    def extract(name: str):
+        extracted.append(name)
+        cancel_event.set()
+
+    tasks = [
+        ("component 1", extract, {"name": "component 1"}),
+        ("component 2", extract, {"name": "component 2"}),
+    ]
+
+    errors = run_extract_tasks(tasks, cancel_event=cancel_event)
+
+    assert errors == {}
+    assert extracted == ["component 1"]
+
+
+def test_get_extract_tasks_refreshes_workflow_exports():
+    request_form = {
+        "source_environment": "dev",
+        "workflows": [{"name": "Workflow 1", "version": "1.0.0"}],
+    }
+    [(_, _, kwargs)] = get_extract_tasks(request_form)
+    assert kwargs["use_cache"] is True
+
+    request_form["refresh_workflow_exports"] = True
+    [(_, _, kwargs)] = get_extract_tasks(request_form)
+    assert kwargs["use_cache"] is False
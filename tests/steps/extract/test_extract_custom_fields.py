@@ -1,5 +1,83 @@
-from steps.extract.custom_fields import extract_custom_fields_to_file
+from pytest_mock import MockerFixture
+from common.app.zuora.api import ZuoraAPI
+from common.app.zuora.async_api import AsyncZuoraAPI
+from common.lib.secrets_manager import SecretsManager
+from steps.extract.custom_fields import (
+    extract_custom_fields,
+    extract_custom_fields_to_file,
+)
 
 
 def test_extract_custom_fields_to_file():
     extract_custom_fields_to_file(environment="dev")
+
+
+def get_definition(field_name: str) -> dict:
+    return {
+        "schema": {
+            "properties": {
+                field_name: {"origin": "custom", "type": "string"},
+                "Id": {"origin": "system", "type": "string"},
+            },
+            "filterable": [field_name],
+        }
+    }
+
+
+def test_extract_custom_fields_lists_all_definitions_once(mocker: MockerFixture):
+    mocker.patch.object(SecretsManager, "get_secret", return_value="secret")
+    mocker.patch("steps.extract.custom_fields.ZUORA_OBJECTS", ["Account", "Invoice"])
+    responses = {
+        "objects/definitions/com_zuora": {
+            "definitions": {"Account": get_definition("Segment__c")}
+        },
+        "objects/definitions/com_zuora/Invoice": get_definition("Batch__c"),
+    }
+
+    def mocked_get(self, path: str, payload: dict = {}):
+        response = mocker.Mock(status_code=200)
+        response.json.return_value = responses[path]
+        return response
+
+    get = mocker.patch.object(ZuoraAPI, "get", autospec=True, side_effect=mocked_get)
+
+    custom_fields = extract_custom_fields(environment="dev")
+
+    assert get.call_count == 2
+    assert list(custom_fields["Account"]["custom_fields"]) == ["Segment__c"]
+    assert list(custom_fields["Invoice"]["custom_fields"]) == ["Batch__c"]
+    assert custom_fields["Invoice"]["filterable"] == ["Batch__c"]
+
+
+def test_extract_custom_fields_async_matches_sync(mocker: MockerFixture):
+    mocker.patch.object(SecretsManager, "get_secret", return_value="secret")
+    mocker.patch("steps.extract.custom_fields.ZUORA_OBJECTS", ["Account", "Invoice"])
+    responses = {
+        "objects/definitions/com_zuora": {
+            "definitions": {"Account": get_definition("Segment__c")}
+        },
+        "objects/definitions/com_zuora/Invoice": get_definition("Batch__c"),
+    }
+
+    def get_response(path: str):
+        response = mocker.Mock(status_code=200)
+        response.json.return_value = responses[path]
+        return response
+
+    async def mocked_async_get(self, path: str, payload: dict = {}):
+        return get_response(path)
+
+    mocker.patch.object(
+        ZuoraAPI,
+        "get",
+        autospec=True,
+        side_effect=lambda self, path: get_response(path),
+    )
+    async_get = mocker.patch.object(
+        AsyncZuoraAPI, "get", autospec=True, side_effect=mocked_async_get
+    )
+
+    custom_fields = extract_custom_fields(environment="dev", use_async=True)
+
+    assert async_get.call_count == 2
+    assert custom_fields == extract_custom_fields(environment="dev")
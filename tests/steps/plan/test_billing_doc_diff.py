@@ -0,0 +1,60 @@
+import json
+import base64
+from pytest_mock import MockerFixture
+from common.util.billing_doc.util import BillingDocumentTemplateUtil
+from common.util.billing_doc.build_util import BillingDocumentTemplateBuilder
+from steps.plan.billing_doc import generate_all_html_template_payloads
+
+
+def get_payload(name: str, template: dict) -> dict:
+    content = base64.b64encode(json.dumps(template).encode()).decode()
+    return {"name": name, "base64EncodedTemplateFileContent": content}
+
+
+def test_plan_writes_payloads_only_for_new_and_changed_templates(
+    mocker: MockerFixture, tmp_path
+):
+    for template_name in ("Changed", "New", "Unchanged"):
+        template_dir = tmp_path.joinpath("billing_documents", template_name)
+        template_dir.mkdir(parents=True)
+        template_dir.joinpath(f"{template_name}_form.json").write_text("{}")
+    mocker.patch("steps.plan.billing_doc.ZUORA_VCS_DIR", tmp_path)
+
+    mocker.patch.object(
+        BillingDocumentTemplateBuilder,
+        "build_request_payload",
+        side_effect=lambda template_name: get_payload(template_name, {"a": 1}),
+    )
+    mocker.patch.object(
+        BillingDocumentTemplateUtil,
+        "list_all_billing_document_templates",
+        return_value={
+            "invoice": [
+                {"id": "1", "name": "Changed"},
+                {"id": "2", "name": "Unchanged"},
+            ]
+        },
+    )
+    deployed = {
+        "settings/invoice-templates/1": get_payload("Changed", {"a": 2}),
+        "settings/invoice-templates/2": get_payload("Unchanged", {"a": 1}),
+    }
+    zuora_api = mocker.patch("steps.plan.billing_doc.ZuoraAPI").return_value
+    zuora_api.__enter__.return_value.get.side_effect = lambda path: mocker.Mock(
+        status_code=200, json=lambda: deployed[path]
+    )
+
+    diff = generate_all_html_template_payloads("qa")
+
+    output_dir = tmp_path.joinpath("temp", "billing_documents")
+    assert diff == {
+        "new": ["New"],
+        "changed": ["Changed"],
+        "unchanged": ["Unchanged"],
+        "failed": [],
+    }
+    assert json.loads(output_dir.joinpath("diff.json").read_text()) == diff
+    assert sorted(file.name for file in output_dir.glob("*_form_new.json")) == [
+        "Changed_form_new.json",
+        "New_form_new.json",
+    ]
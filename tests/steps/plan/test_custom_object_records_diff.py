@@ -0,0 +1,150 @@
+import copy
+import random
+from pathlib import Path
+from typing import List
+from pytest_mock import MockerFixture
+from common.util.custom_objects_records import CustomObjectRecordsUtil
+from steps.plan.custom_object_records import (
+    get_custom_objects_records_diff,
+    find_match,
+    get_add_record,
+    get_edit_record,
+    get_single_custom_object_records_diff,
+    get_sorted_custom_object_records_diff,
+)
+
+CRITERIA = {"primary": "LookupType__c", "secondary": "LookupKey__c"}
+
+
+def generate_records(seed: int, count: int) -> List[dict]:
+    randomizer = random.Random(seed)
+    records = []
+    for i in range(count):
+        records.append(
+            {
+                "Id": f"{seed}-{i}",
+                "LookupType__c": randomizer.choice(["TYPE_A", "TYPE_B", None]),
+                "LookupKey__c": str(randomizer.randint(0, 40)),
+                "LookupValue1__c": str(randomizer.randint(0, 3)),
+            }
+        )
+    return records
+
+
+def get_diff_by_linear_scan(criteria, records_source_env, records_target_env):
+    add_records = []
+    edit_records = []
+    for record_source_env in records_source_env:
+        matching_record = find_match(records_target_env, record_source_env, criteria)
+        if matching_record:
+            edit_record = get_edit_record(record_source_env, matching_record)
+            if edit_record:
+                edit_records.append(edit_record)
+        else:
+            add_records.append(get_add_record(record_source_env))
+
+    delete_records = [
+        record_target_env
+        for record_target_env in records_target_env
+        if not find_match(records_source_env, record_target_env, criteria)
+    ]
+    return {"add": add_records, "edit": edit_records, "delete": delete_records}
+
+
+def test_indexed_diff_matches_linear_scan(mocker: MockerFixture):
+    mocker.patch(
+        "steps.plan.custom_object_records.CUSTOM_OBJECTS_MAP",
+        {"Lookup": CRITERIA},
+    )
+
+    for criteria in (CRITERIA, {"primary": "LookupKey__c"}):
+        records_source_env = generate_records(seed=1, count=200)
+        records_target_env = generate_records(seed=2, count=150)
+
+        expected_diff = get_diff_by_linear_scan(
+            criteria,
+            copy.deepcopy(records_source_env),
+            copy.deepcopy(records_target_env),
+        )
+        diff = get_single_custom_object_records_diff(
+            object_type="Lookup",
+            criteria=criteria,
+            records_source_env=records_source_env,
+            records_target_env=records_target_env,
+        )
+
+        assert diff == expected_diff
+
+
+def test_sorted_diff_matches_in_memory_diff(mocker: MockerFixture):
+    mocker.patch(
+        "steps.plan.custom_object_records.CUSTOM_OBJECTS_MAP",
+        {"Lookup": CRITERIA},
+    )
+
+    for criteria in (CRITERIA, {"primary": "LookupKey__c"}):
+        records_source_env = generate_records(seed=3, count=200)
+        records_target_env = generate_records(seed=4, count=150)
+
+        expected_diff = get_single_custom_object_records_diff(
+            object_type="Lookup",
+            criteria=criteria,
+            records_source_env=copy.deepcopy(records_source_env),
+            records_target_env=copy.deepcopy(records_target_env),
+        )
+        # A small budget spills both sides into many sorted runs
+        for memory_bytes in (1024, 10**9):
+            diff = get_sorted_custom_object_records_diff(
+                object_type="Lookup",
+                criteria=criteria,
+                records_source_env=iter(copy.deepcopy(records_source_env)),
+                records_target_env=iter(copy.deepcopy(records_target_env)),
+                memory_bytes=memory_bytes,
+            )
+
+            assert diff == expected_diff
+
+
+def test_parallel_diff_matches_serial_diff(mocker: MockerFixture, tmp_path: Path):
+    objects_map = {"Lookup": CRITERIA, "Other": {"primary": "LookupKey__c"}}
+    target_records = {
+        "Lookup": generate_records(seed=5, count=150),
+        "Other": generate_records(seed=6, count=100),
+    }
+    mocker.patch("steps.plan.custom_object_records.CUSTOM_OBJECTS_MAP", objects_map)
+    mocker.patch(
+        "steps.plan.custom_object_records.CUSTOM_OBJECT_NAMES", list(objects_map)
+    )
+    mocker.patch("steps.plan.custom_object_records.ZUORA_VCS_DIR", tmp_path)
+    mocker.patch("common.util.custom_objects_records.util.ZUORA_VCS_DIR", tmp_path)
+    mocker.patch("steps.plan.custom_object_records.ZuoraAPI")
+    mocker.patch(
+        "steps.plan.custom_object_records.extract_custom_object_records",
+        side_effect=lambda **kwargs: copy.deepcopy(target_records),
+    )
+    mocker.patch(
+        "steps.plan.custom_object_records.iter_custom_object_records",
+        side_effect=lambda custom_object_name, **kwargs: iter(
+            copy.deepcopy(target_records[custom_object_name])
+        ),
+    )
+
+    CustomObjectRecordsUtil.dump_records_to_file(
+        generate_records(seed=7, count=200), "Lookup", "json"
+    )
+    CustomObjectRecordsUtil.dump_records_to_file(
+        generate_records(seed=8, count=120), "Other", "jsonl"
+    )
+    diff_file = tmp_path.joinpath("temp/custom_object_records/diff.json")
+
+    expected_diff = get_custom_objects_records_diff("qa", memory_bytes=0, max_workers=1)
+    expected_diff_file = diff_file.read_text()
+    assert list(expected_diff) == list(objects_map)
+
+    for memory_bytes in (0, 1024):
+        diff = get_custom_objects_records_diff(
+            "qa", memory_bytes=memory_bytes, max_workers=2
+        )
+
+        assert diff == expected_diff
+        assert diff_file.read_text() == expected_diff_file
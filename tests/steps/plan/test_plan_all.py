@@ -0,0 +1,36 @@
+from pytest_mock import MockerFixture
+from steps.plan.plan_all import plan_all
+
+
+def test_plan_all_reports_failed_components(mocker: MockerFixture, tmp_path):
+    mocker.patch("steps.plan.plan_all.ZUORA_VCS_DIR", tmp_path)
+    mocker.patch(
+        "steps.plan.plan_all.get_custom_fields_diff",
+        side_effect=Exception("Mocked failure"),
+    )
+    generate_templates = mocker.patch(
+        "steps.plan.plan_all.generate_all_html_template_payloads",
+        return_value={"new": [], "changed": [], "unchanged": [], "failed": []},
+    )
+
+    assert plan_all({"target_env": "qa", "include_html_templates": True}) == "success"
+
+    generate_templates.return_value["failed"] = ["Generic Invoice"]
+    assert plan_all({"target_env": "qa", "include_html_templates": True}) == "failed"
+    assert plan_all({"target_env": "qa", "include_custom_fields": True}) == "failed"
+
+
+def test_plan_all_records_diff_workers(mocker: MockerFixture, tmp_path):
+    mocker.patch("steps.plan.plan_all.ZUORA_VCS_DIR", tmp_path)
+    records_diff = mocker.patch("steps.plan.plan_all.get_custom_objects_records_diff")
+    request_form = {
+        "target_env": "qa",
+        "include_custom_object_records": True,
+        "max_workers": 4,
+    }
+
+    plan_all(request_form)
+    assert records_diff.call_args.kwargs["max_workers"] == 1
+
+    plan_all({**request_form, "records_diff_workers": 2})
+    assert records_diff.call_args.kwargs["max_workers"] == 2
@@ -0,0 +1,97 @@
+import json
+import pytest
+from pytest_mock import MockerFixture
+from steps import batch
+from batch import main
+
+
+def test_load_request_forms_rejects_invalid_form(tmp_path):
+    request_form_file = tmp_path.joinpath("form.json")
+    request_form_file.write_text(json.dumps({"steps": ["deploy"]}))
+
+    with pytest.raises(batch.BatchRequestError):
+        batch.load_request_forms(request_form_file)
+
+
+def test_run_batch_stops_request_form_at_failed_step(mocker: MockerFixture):
+    calls = []
+
+    def get_step_function(step: str):
+        def run_step(request_form: dict):
+            calls.append((request_form["target_env"], step))
+            if request_form["target_env"] == "qa" and step == "plan":
+                raise Exception("plan failed")
+            return "success"
+
+        return run_step
+
+    mocker.patch.object(batch, "get_step_function", side_effect=get_step_function)
+    requests = [
+        ("qa.json", {"steps": ["plan", "deploy"], "target_env": "qa"}),
+        ("uat.json", {"steps": ["plan", "deploy"], "target_env": "uat"}),
+    ]
+
+    results = batch.run_batch(requests)
+
+    assert calls == [("qa", "plan"), ("uat", "plan"), ("uat", "deploy")]
+    assert [result["status"] for result in results] == ["failed", "success"]
+    assert results[0]["steps"][0]["error"] == "plan failed"
+    assert batch.get_exit_code(results) == batch.EXIT_FAILURE
+
+
+def test_run_batch_groups_request_forms_by_vcs_dir(mocker: MockerFixture, tmp_path):
+    def run_group_in_subprocess(vcs_dir, requests):
+        return [
+            {"name": name, "status": "success", "steps": [], "vcs_dir": str(vcs_dir)}
+            for name, _ in requests
+        ]
+
+    mocker.patch.object(
+        batch, "run_group_in_subprocess", side_effect=run_group_in_subprocess
+    )
+    requests = [
+        ("a", {"steps": ["extract"], "vcs_dir": str(tmp_path.joinpath("dev"))}),
+        ("b", {"steps": ["extract"], "vcs_dir": str(tmp_path.joinpath("qa"))}),
+        ("c", {"steps": ["extract"], "vcs_dir": str(tmp_path.joinpath("dev"))}),
+    ]
+
+    results = batch.run_batch(requests, max_workers=2)
+
+    assert [result["name"] for result in results] == ["a", "b", "c"]
+    assert batch.run_group_in_subprocess.call_count == 2
+    assert results[0]["vcs_dir"] == results[2]["vcs_dir"]
+
+
+def test_batch_main_exit_codes(mocker: MockerFixture, tmp_path):
+    mocker.patch.object(
+        batch, "get_step_function", return_value=lambda request_form: "success"
+    )
+    request_form_file = tmp_path.joinpath("form.json")
+    report_file = tmp_path.joinpath("report.json")
+
+    request_form_file.write_text(json.dumps({"steps": ["plan"], "target_env": "qa"}))
+    assert main([str(request_form_file), "--report", str(report_file)]) == 0
+    assert json.loads(report_file.read_text())[0]["status"] == "success"
+
+    request_form_file.write_text("{")
+    assert main([str(request_form_file)]) == batch.EXIT_INVALID_REQUEST
+
+
+def test_run_group_in_subprocess_passes_resolved_vcs_dir(
+    mocker: MockerFixture, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    child_forms = []
+
+    def run(args, cwd, env):
+        child_forms.extend(json.loads(open(args[2]).read()))
+        return mocker.Mock(returncode=0)
+
+    mocker.patch.object(batch.subprocess, "run", side_effect=run)
+    request_form = {"steps": ["extract"], "vcs_dir": "../zuora-vcs-qa"}
+    vcs_dir = batch.get_vcs_dir(request_form)
+
+    batch.run_group_in_subprocess(vcs_dir, [("a", request_form)])
+
+    assert vcs_dir == tmp_path.parent.joinpath("zuora-vcs-qa").resolve()
+    assert child_forms == [{"steps": ["extract"], "vcs_dir": str(vcs_dir)}]
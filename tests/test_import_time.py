@@ -0,0 +1,61 @@
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# Seconds a cold import of an entry point may take, generous for slow CI runners
+IMPORT_TIME_BUDGET = float(os.getenv("IMPORT_TIME_BUDGET", 1.0))
+
+# Modules loaded when the GUI windows and the batch runner start
+STARTUP_MODULES = [
+    "gui.app_extract",
+    "gui.app_plan_deploy",
+    "batch",
+    "steps.batch",
+    "common.lib.secrets_manager",
+]
+
+LAZY_MODULES = ["boto3", "bs4", "httpx", "packaging", "steps"]
+
+
+def import_cold(module: str) -> dict:
+    code = (
+        "import sys, json, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout)
+
+
+def get_lazy_modules_loaded(module: str, modules: list) -> list:
+    loaded = []
+    for name in modules:
+        # The imported module itself and its parent packages are expected
+        if module == name or module.startswith(f"{name}."):
+            continue
+        if name.split(".")[0] in LAZY_MODULES:
+            loaded.append(name)
+        # Only the GUI windows need Tk
+        elif name == "tkinter" and not module.startswith("gui."):
+            loaded.append(name)
+    return loaded
+
+
+def test_startup_modules_import_within_budget():
+    for module in STARTUP_MODULES:
+        result = import_cold(module)
+
+        assert result["elapsed"] < IMPORT_TIME_BUDGET, module
+        assert get_lazy_modules_loaded(module, result["modules"]) == [], module